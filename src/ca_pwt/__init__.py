@@ -13,7 +13,9 @@ from ca_pwt.groups import (
     load_groups,
     save_groups,
     get_groups_by_ids,
+    get_groups_by_ids_async,
     import_groups,
+    import_groups_async,
     cleanup_groups,
 )
 
@@ -23,9 +25,12 @@ from ca_pwt.policies import (
     load_policies,
     save_policies,
     import_policies,
+    import_policies_async,
     export_policies,
+    export_policies_async,
     get_groups_in_policies,
     cleanup_policies,
 )
 
 from ca_pwt.helpers.graph_api import DuplicateActionEnum
+from ca_pwt.helpers.graph_api_async import AsyncGraphTransport, run_async
@@ -1,4 +1,26 @@
 import click
+from ca_pwt.helpers.transport import (
+    GraphTransport,
+    set_default_transport,
+    _DEFAULT_POOL_SIZE,
+    _DEFAULT_READ_TIMEOUT,
+    _GRAPH_API_BASE_URL,
+)
+from ca_pwt.helpers.retry import RetryPolicy, _DEFAULT_DEADLINE, _DEFAULT_MAX_RETRIES
+from ca_pwt.helpers.cassette import Cassette, use_cassette
+from ca_pwt.helpers.metrics import _METRICS_FORMATS
+from ca_pwt.helpers.response_cache import ResponseCache, _DEFAULT_MAX_SIZE, _DEFAULT_TTL
+from ca_pwt.lookup_store import (
+    _DEFAULT_NOT_FOUND_TTL as _DEFAULT_LOOKUP_STORE_NOT_FOUND_TTL,
+    _DEFAULT_TTL as _DEFAULT_LOOKUP_STORE_TTL,
+)
+from ca_pwt.helpers.rate_limiter import RateLimiter, set_default_rate_limiter, _DEFAULT_RATE
+from ca_pwt.policies_mappings import (
+    LookupThresholds,
+    set_default_lookup_thresholds,
+    _DEFAULT_POINT_MAX_KEYS,
+    _DEFAULT_PREFETCH_MIN_KEYS,
+)
 from ca_pwt.commands import (
     export_policies_cmd,
     import_policies_cmd,
@@ -30,12 +52,261 @@ from ca_pwt.commands import (
     type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
     help="The log level to use for logging (default: INFO). Possible values: DEBUG, INFO, WARNING, ERROR, CRITICAL",
 )
+@click.option(
+    "--pool_size",
+    default=_DEFAULT_POOL_SIZE,
+    type=click.IntRange(min=1),
+    help=f"The maximum number of keep-alive connections to the Graph API (default: {_DEFAULT_POOL_SIZE})",
+)
+@click.option(
+    "--max_concurrency",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Sends up to this number of concurrent requests (using asyncio) when exporting and importing "
+    "policies and groups, e.g. 16 or 32. Requires the httpx package (pip install ca-pwt[async]). "
+    "By default, requests are sent one at a time",
+)
+@click.option(
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="The number of threads used to send independent lookups and fetches concurrently "
+    "(e.g. when replacing guids with attributes or exporting groups). Default: 1 (sequential)",
+)
+@click.option(
+    "--requests_per_second",
+    default=_DEFAULT_RATE,
+    type=click.FloatRange(min=0, min_open=True),
+    help="The initial rate of requests per second shared by all the requests of the process "
+    f"(default: {_DEFAULT_RATE}). The rate is lowered when the Graph API throttles requests and raised again "
+    "after sustained success",
+)
+@click.option(
+    "--timeout",
+    default=_DEFAULT_READ_TIMEOUT,
+    type=click.FloatRange(min=0, min_open=True),
+    help=f"The number of seconds to wait for data from the Graph API before a request attempt is considered "
+    f"stalled (default: {_DEFAULT_READ_TIMEOUT})",
+)
+@click.option(
+    "--max_retries",
+    default=_DEFAULT_MAX_RETRIES,
+    type=click.IntRange(min=0),
+    help="The maximum number of times a throttled request or a request that failed with a transient error "
+    f"(5xx, connection reset, timeout) is retried, with exponential backoff (default: {_DEFAULT_MAX_RETRIES})",
+)
+@click.option(
+    "--deadline",
+    default=_DEFAULT_DEADLINE,
+    type=click.FloatRange(min=0, min_open=True),
+    help=f"The maximum number of seconds spent on a request, including all its retries (default: {_DEFAULT_DEADLINE})",
+)
+@click.option(
+    "--cache_dir",
+    default=None,
+    type=click.Path(file_okay=False),
+    help="A directory where the successful GET responses of the Graph API are cached between runs, "
+    "so repeated runs do not look up the same directory objects again. By default, responses are not cached",
+)
+@click.option(
+    "--cache_ttl",
+    default=_DEFAULT_TTL,
+    type=click.FloatRange(min=0),
+    help=f"The number of seconds a cached response is used (default: {_DEFAULT_TTL}). "
+    "Built-in objects like role templates are cached for longer",
+)
+@click.option(
+    "--cache_max_size",
+    default=_DEFAULT_MAX_SIZE // (1024 * 1024),
+    type=click.IntRange(min=1),
+    help=f"The maximum size of the cache in MB (default: {_DEFAULT_MAX_SIZE // (1024 * 1024)}). "
+    "The least recently used responses are evicted first",
+)
+@click.option(
+    "--bypass_cache",
+    is_flag=True,
+    default=False,
+    help="Ignore the cached responses (fresh responses are still cached)",
+)
+@click.option(
+    "--directory_index",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="A JSON file with a local index of the groups, users and service principals of the tenant, "
+    "built on the first run and refreshed incrementally with delta queries, so names and ids are resolved locally. "
+    "By default, every name or id is looked up in the Graph API",
+)
+@click.option(
+    "--lookup_store",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="A SQLite file where the names and ids resolved by the replace-*, import-policies and export-policy-groups "
+    "commands are stored by tenant, so later runs do not look them up again. Several runs can share it. "
+    "By default, nothing is stored between runs",
+)
+@click.option(
+    "--lookup_store_ttl",
+    default=_DEFAULT_LOOKUP_STORE_TTL,
+    type=click.FloatRange(min=0),
+    help=f"The number of seconds a stored name or id is used (default: {_DEFAULT_LOOKUP_STORE_TTL})",
+)
+@click.option(
+    "--lookup_store_not_found_ttl",
+    default=_DEFAULT_LOOKUP_STORE_NOT_FOUND_TTL,
+    type=click.FloatRange(min=0),
+    help="The number of seconds a name or id that could not be resolved (e.g. a deleted group) is not looked up "
+    f"again (default: {_DEFAULT_LOOKUP_STORE_NOT_FOUND_TTL})",
+)
+@click.option(
+    "--recheck_not_found",
+    is_flag=True,
+    default=False,
+    help="Look up again the names and ids of the lookup store that could not be resolved, even if they did not expire",
+)
+@click.option(
+    "--point_lookup_max_keys",
+    default=_DEFAULT_POINT_MAX_KEYS,
+    type=click.IntRange(min=0),
+    help="The maximum number of names or ids of a type (groups, users, applications) that are looked up one by one "
+    f"(default: {_DEFAULT_POINT_MAX_KEYS}). More keys are looked up 15 per request",
+)
+@click.option(
+    "--prefetch_min_keys",
+    default=_DEFAULT_PREFETCH_MIN_KEYS,
+    type=click.IntRange(min=1),
+    help="The minimum number of names or ids of a type (groups, users, applications) that are resolved by listing "
+    f"all the objects of the type, 999 per request, instead of looking them up (default: {_DEFAULT_PREFETCH_MIN_KEYS})",
+)
+@click.option(
+    "--metrics_file",
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help="A file where the metrics of the requests sent to the Graph API (by endpoint and method: count, latency "
+    "percentiles, retries, throttling waits, status codes and bytes) are written at exit",
+)
+@click.option(
+    "--metrics_format",
+    default="json",
+    type=click.Choice(_METRICS_FORMATS),
+    help="The format of the metrics file (default: json)",
+)
+@click.option(
+    "--record",
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help="A cassette file where the requests sent to the Graph API and their responses are recorded "
+    "(without the Authorization header; the file is overwritten), so the commands can be replayed offline "
+    "with --replay",
+)
+@click.option(
+    "--replay",
+    default=None,
+    type=click.Path(dir_okay=False, exists=True),
+    help="A cassette file recorded with --record: the requests are answered from it, without network access",
+)
+@click.option(
+    "--replay_latency",
+    default=None,
+    type=click.FloatRange(min=0),
+    help="The number of seconds each replayed response is delayed (default: the recorded latency)",
+)
+@click.option(
+    "--graph_url",
+    default=_GRAPH_API_BASE_URL,
+    help=f"The base url of the Graph API, including the version (default: {_GRAPH_API_BASE_URL}). "
+    "Use it to point the commands at a local mock server (python -m ca_pwt.mock_graph)",
+)
+@click.option(
+    "--http2",
+    is_flag=True,
+    default=False,
+    help="Multiplex the concurrent requests (--jobs, --max_concurrency) over a few HTTP/2 connections "
+    "instead of one HTTP/1.1 connection per request in flight. Needs the http2 extra (pip install ca-pwt[http2])",
+)
 @_access_token_option
 @click.pass_context
-def cli(ctx: click.Context, access_token: str, log_level: str):
+def cli(
+    ctx: click.Context,
+    *,
+    access_token: str | None = None,
+    log_level: str = "WARNING",
+    pool_size: int = _DEFAULT_POOL_SIZE,
+    max_concurrency: int | None = None,
+    jobs: int = 1,
+    requests_per_second: float = _DEFAULT_RATE,
+    timeout: float = _DEFAULT_READ_TIMEOUT,
+    max_retries: int = _DEFAULT_MAX_RETRIES,
+    deadline: float = _DEFAULT_DEADLINE,
+    cache_dir: str | None = None,
+    cache_ttl: float = _DEFAULT_TTL,
+    cache_max_size: int = _DEFAULT_MAX_SIZE // (1024 * 1024),
+    directory_index: str | None = None,
+    lookup_store: str | None = None,
+    lookup_store_ttl: float = _DEFAULT_LOOKUP_STORE_TTL,
+    lookup_store_not_found_ttl: float = _DEFAULT_LOOKUP_STORE_NOT_FOUND_TTL,
+    point_lookup_max_keys: int = _DEFAULT_POINT_MAX_KEYS,
+    prefetch_min_keys: int = _DEFAULT_PREFETCH_MIN_KEYS,
+    metrics_file: str | None = None,
+    metrics_format: str = "json",
+    record: str | None = None,
+    replay: str | None = None,
+    replay_latency: float | None = None,
+    graph_url: str = _GRAPH_API_BASE_URL,
+    bypass_cache: bool = False,
+    http2: bool = False,
+    recheck_not_found: bool = False,
+):
+    if record and replay:
+        msg = "--record and --replay cannot be used together"
+        raise click.UsageError(msg)
+    if (record or replay) and max_concurrency:
+        msg = "--record and --replay cannot be used with --max_concurrency"
+        raise click.UsageError(msg)
+    if prefetch_min_keys <= point_lookup_max_keys:
+        msg = "--prefetch_min_keys must be greater than --point_lookup_max_keys"
+        raise click.UsageError(msg)
     ctx.ensure_object(dict)
     # persist the access token in the context for use in subcommands
     ctx.obj["access_token"] = access_token
+    ctx.obj["max_concurrency"] = max_concurrency
+    ctx.obj["jobs"] = jobs
+    ctx.obj["directory_index_file"] = directory_index
+    ctx.obj["lookup_store_file"] = lookup_store
+    ctx.obj["lookup_store_ttl"] = lookup_store_ttl
+    ctx.obj["lookup_store_not_found_ttl"] = lookup_store_not_found_ttl
+    ctx.obj["recheck_not_found"] = recheck_not_found
+
+    # all the requests (including from chained commands and worker threads) share the same budget
+    set_default_rate_limiter(RateLimiter(rate=requests_per_second))
+    set_default_lookup_thresholds(
+        LookupThresholds(point_max_keys=point_lookup_max_keys, prefetch_min_keys=prefetch_min_keys)
+    )
+
+    # all the commands (including chained ones) share the same pooled connections
+    # (with at least one connection per thread, so connections are not discarded)
+    transport = GraphTransport(
+        pool_size=max(pool_size, jobs),
+        retry_policy=RetryPolicy(max_retries, deadline=deadline),
+        read_timeout=timeout,
+        base_url=graph_url,
+        http2=http2,
+        response_cache=(
+            ResponseCache(cache_dir, max_size=cache_max_size * 1024 * 1024, default_ttl=cache_ttl, bypass=bypass_cache)
+            if cache_dir
+            else None
+        ),
+    )
+    set_default_transport(transport)
+    ctx.call_on_close(transport.close)
+    if record:
+        cassette = Cassette(record)
+        cassette.clear()
+        use_cassette(transport, cassette, "record")
+        ctx.call_on_close(cassette.save)
+    elif replay:
+        use_cassette(transport, Cassette(replay), "replay", latency=replay_latency)
+    if metrics_file:
+        ctx.call_on_close(lambda: transport.metrics.save(metrics_file, metrics_format))
 
     import logging
 
@@ -8,8 +8,11 @@ from ca_pwt.policies import (
     save_policies,
     cleanup_policies,
     export_policies,
+    export_policies_async,
     import_policies,
+    import_policies_async,
     get_groups_in_policies,
+    get_group_ids_in_policies,
     delete_policies,
 )
 from ca_pwt.groups import (
@@ -17,14 +20,21 @@ from ca_pwt.groups import (
     save_groups,
     cleanup_groups,
     import_groups,
+    import_groups_async,
+    get_groups_by_ids_async,
     delete_groups,
 )
 from ca_pwt.helpers.graph_api import DuplicateActionEnum
+from ca_pwt.helpers.graph_api_async import run_async
+from ca_pwt.directory_index import DirectoryIndex
+from ca_pwt.lookup_cache import LookupCache
+from ca_pwt.lookup_store import LookupStore
 
 from ca_pwt.policies_mappings import (
     replace_guids_with_attrs_in_policies,
     replace_attrs_with_guids_in_policies,
     load_lookup_cache_from_file,
+    create_lookup_cache,
 )
 
 _logger = logging.getLogger(__name__)
@@ -53,9 +63,10 @@ _lookup_cache_file_option = click.option(
     prompt_required=False,
     help="The file to read the lookup cache from. "
     "This file will be used to initially load the lookup cache between guids "
-    "and attributes. The expected format is a json file with a dictionary of [str, str] pairs, where the "
-    "key is the guid and the value is the attribute. "
-    "e.g. {'00000000-0000-0000-0000-000000000000': 'All Users'}",
+    "and attributes, in both directions. The expected format is a json file with a dictionary per type of object "
+    "(groups, users, roles and applications) of [str, str] pairs, where the key is the guid and the value is the "
+    "attribute. e.g. {'groups': {'00000000-0000-0000-0000-000000000000': 'All Users'}}. "
+    "A single dictionary of [str, str] pairs is also accepted, and applies to every type of object",
 )
 
 _access_token_option = click.option(
@@ -94,6 +105,85 @@ def _exit_with_exception(exception: Exception, exit_code: int = 1, fg: str = "re
         exit(exit_code)
 
 
+def _get_max_concurrency(ctx: click.Context) -> int | None:
+    """Get the max_concurrency global option from the context.
+    If it is set, commands should use the async variants of the library functions"""
+    ctx.ensure_object(dict)
+    return ctx.obj.get("max_concurrency")
+
+
+def _get_jobs(ctx: click.Context) -> int:
+    """Get the jobs global option from the context (the number of threads used for lookups and fetches)"""
+    ctx.ensure_object(dict)
+    return ctx.obj.get("jobs") or 1
+
+
+def _get_directory_index(ctx: click.Context, access_token: str) -> DirectoryIndex | None:
+    """Get the directory index of the directory_index global option, refreshed with the changes since the last run.
+    The index is refreshed once and shared by chained commands"""
+    ctx.ensure_object(dict)
+    directory_index_file = ctx.obj.get("directory_index_file")
+    if not directory_index_file:
+        return None
+    directory_index = ctx.obj.get("directory_index")
+    if directory_index is None:
+        directory_index = DirectoryIndex(directory_index_file, access_token)
+        directory_index.refresh()
+        directory_index.save()
+        ctx.obj["directory_index"] = directory_index
+    return directory_index
+
+
+def _get_lookup_store(ctx: click.Context, access_token: str) -> LookupStore | None:
+    """Get the lookup store of the lookup_store global option, shared by chained commands"""
+    ctx.ensure_object(dict)
+    lookup_store_file = ctx.obj.get("lookup_store_file")
+    if not lookup_store_file:
+        return None
+    lookup_store = ctx.obj.get("lookup_store")
+    if lookup_store is None:
+        lookup_store = LookupStore(
+            lookup_store_file,
+            access_token,
+            ttl=ctx.obj["lookup_store_ttl"],
+            not_found_ttl=ctx.obj["lookup_store_not_found_ttl"],
+            recheck_not_found=ctx.obj["recheck_not_found"],
+        )
+        ctx.obj["lookup_store"] = lookup_store
+    return lookup_store
+
+
+def _load_lookup_cache(ctx: click.Context, access_token: str, lookup_cache_file: str | None) -> LookupCache:
+    """Loads the lookup cache of the lookup cache file (or the built-in objects if there is none),
+    with the objects of the lookup store (if any)"""
+    lookup_cache = load_lookup_cache_from_file(lookup_cache_file) if lookup_cache_file else create_lookup_cache()
+    lookup_store = _get_lookup_store(ctx, access_token)
+    if lookup_store is not None:
+        lookup_store.load(lookup_cache)
+    return lookup_cache
+
+
+def _save_lookup_cache(ctx: click.Context, access_token: str, lookup_cache: LookupCache):
+    """Stores the objects resolved by a command in the lookup store (if any), so later runs do not look them up,
+    and reports the names and ids that could not be resolved"""
+    lookup_store = _get_lookup_store(ctx, access_token)
+    if lookup_store is not None:
+        lookup_store.save(lookup_cache)
+
+    not_found: dict[str, list[str]] = {}
+    for to_guids in [True, False]:
+        for object_type, keys in lookup_cache.get_not_found(to_guids=to_guids).items():
+            not_found.setdefault(object_type, []).extend(keys)
+    if not_found:
+        count = sum(len(keys) for keys in not_found.values())
+        message = f"{count} names or ids could not be resolved"
+        if lookup_store is not None:
+            message += " (they are not looked up again until they expire, unless --recheck_not_found is used)"
+        click.secho(f"{message}:", fg="yellow")
+        for object_type, keys in not_found.items():
+            click.echo(f"  {object_type}: {', '.join(keys)}")
+
+
 def _get_from_ctx_if_none(
     ctx: click.Context,
     ctx_key: str,
@@ -235,9 +325,7 @@ def replace_guids_with_attrs_cmd(
         click.echo(f"Input file: {input_file}; Output file: {output_file}; Lookup cache file: {lookup_cache_file}")
 
         policies = load_policies(input_file)
-        lookup_cache = (
-            load_lookup_cache_from_file(lookup_cache_file, reverse_format=False) if lookup_cache_file else None
-        )
+        lookup_cache = _load_lookup_cache(ctx, access_token, lookup_cache_file)
 
         policies = load_policies(input_file)
         policies = replace_guids_with_attrs_in_policies(
@@ -248,8 +336,11 @@ def replace_guids_with_attrs_cmd(
             lookup_users=True,
             lookup_applications=True,
             lookup_cache=lookup_cache,
+            jobs=_get_jobs(ctx),
+            directory_index=_get_directory_index(ctx, access_token),
         )
 
+        _save_lookup_cache(ctx, access_token, lookup_cache)
         save_policies(policies=policies, output_file=output_file)
 
         # store the output file in the context for chaining commands
@@ -294,9 +385,7 @@ def replace_attrs_with_guids_cmd(
         click.echo(f"Input file: {input_file}; Output file: {output_file}; Lookup cache file: {lookup_cache_file}")
 
         policies = load_policies(input_file)
-        lookup_cache = (
-            load_lookup_cache_from_file(lookup_cache_file, reverse_format=True) if lookup_cache_file else None
-        )
+        lookup_cache = _load_lookup_cache(ctx, access_token, lookup_cache_file)
         policies = replace_attrs_with_guids_in_policies(
             access_token,
             policies,
@@ -305,8 +394,11 @@ def replace_attrs_with_guids_cmd(
             lookup_roles=True,
             lookup_applications=True,
             lookup_cache=lookup_cache,
+            jobs=_get_jobs(ctx),
+            directory_index=_get_directory_index(ctx, access_token),
         )
 
+        _save_lookup_cache(ctx, access_token, lookup_cache)
         save_policies(policies=policies, output_file=output_file)
 
         # store the output file in the context for chaining commands
@@ -344,7 +436,11 @@ def export_policies_cmd(
         output_file = _get_from_ctx_if_none(ctx, "output_file", output_file, lambda: click.prompt("The output file"))
         click.echo(f"Output file: {output_file}")
 
-        policies = export_policies(access_token, odata_filter)
+        max_concurrency = _get_max_concurrency(ctx)
+        if max_concurrency:
+            policies = run_async(export_policies_async, access_token, odata_filter, max_concurrency=max_concurrency)
+        else:
+            policies = export_policies(access_token, odata_filter)
         save_policies(policies=policies, output_file=output_file)
 
         # store the output file in the context for chaining commands
@@ -439,14 +535,31 @@ def import_policies_cmd(
         click.echo(f"Input file: {input_file}; Lookup cache file: {lookup_cache_file}")
 
         policies = load_policies(input_file)
-        lookup_cache = (
-            load_lookup_cache_from_file(lookup_cache_file, reverse_format=True) if lookup_cache_file else None
-        )
-
-        created_policies = import_policies(
-            access_token=access_token, policies=policies, duplicate_action=duplicate_action, lookup_cache=lookup_cache
-        )
-
+        lookup_cache = _load_lookup_cache(ctx, access_token, lookup_cache_file)
+
+        max_concurrency = _get_max_concurrency(ctx)
+        if max_concurrency:
+            created_policies = run_async(
+                import_policies_async,
+                access_token=access_token,
+                policies=policies,
+                duplicate_action=duplicate_action,
+                lookup_cache=lookup_cache,
+                max_concurrency=max_concurrency,
+                jobs=_get_jobs(ctx),
+                directory_index=_get_directory_index(ctx, access_token),
+            )
+        else:
+            created_policies = import_policies(
+                access_token=access_token,
+                policies=policies,
+                duplicate_action=duplicate_action,
+                lookup_cache=lookup_cache,
+                jobs=_get_jobs(ctx),
+                directory_index=_get_directory_index(ctx, access_token),
+            )
+
+        _save_lookup_cache(ctx, access_token, lookup_cache)
         click.echo("Successfully created policies:")
         for policy in created_policies:
             click.echo(f"{policy[0]}: {policy[1]}")
@@ -481,12 +594,33 @@ def export_policy_groups_cmd(
         click.echo(f"Input file: {input_file}; Output file: {output_file}; Lookup cache file: {lookup_cache_file}")
 
         policies = load_policies(input_file)
-        lookup_cache = (
-            load_lookup_cache_from_file(lookup_cache_file, reverse_format=True) if lookup_cache_file else None
-        )
-        groups = get_groups_in_policies(
-            access_token, policies, ignore_not_found=ignore_not_found, lookup_cache=lookup_cache
-        )
+        lookup_cache = _load_lookup_cache(ctx, access_token, lookup_cache_file)
+        max_concurrency = _get_max_concurrency(ctx)
+        if max_concurrency:
+            group_ids = get_group_ids_in_policies(
+                access_token,
+                policies,
+                lookup_cache=lookup_cache,
+                jobs=_get_jobs(ctx),
+                directory_index=_get_directory_index(ctx, access_token),
+            )
+            groups = run_async(
+                get_groups_by_ids_async,
+                access_token,
+                group_ids,
+                ignore_not_found=ignore_not_found,
+                max_concurrency=max_concurrency,
+            )
+        else:
+            groups = get_groups_in_policies(
+                access_token,
+                policies,
+                ignore_not_found=ignore_not_found,
+                lookup_cache=lookup_cache,
+                jobs=_get_jobs(ctx),
+                directory_index=_get_directory_index(ctx, access_token),
+            )
+        _save_lookup_cache(ctx, access_token, lookup_cache)
         save_groups(groups=groups, output_file=output_file)
 
         # store the output file in the context for chaining commands
@@ -529,7 +663,17 @@ def import_groups_cmd(
         input_file = _get_from_ctx_if_none(ctx, "output_file", input_file, lambda: click.prompt("The input file"))
         click.echo(f"Input file: {input_file}")
         groups = load_groups(input_file)
-        created_groups = import_groups(access_token=access_token, groups=groups, duplicate_action=duplicate_action)
+        max_concurrency = _get_max_concurrency(ctx)
+        if max_concurrency:
+            created_groups = run_async(
+                import_groups_async,
+                access_token=access_token,
+                groups=groups,
+                duplicate_action=duplicate_action,
+                max_concurrency=max_concurrency,
+            )
+        else:
+            created_groups = import_groups(access_token=access_token, groups=groups, duplicate_action=duplicate_action)
         click.echo("Successfully created groups:")
         for group in created_groups:
             click.echo(f"{group[0]}: {group[1]}")
@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+from ca_pwt.helpers.graph_api import EntityAPI
+from ca_pwt.helpers.response_cache import _get_tenant
+from ca_pwt.helpers.transport import GraphTransport
+from ca_pwt.helpers.utils import assert_condition
+
+_logger = logging.getLogger(__name__)
+
+_DELTA_LINK = "@odata.deltaLink"
+_REMOVED = "@removed"
+_HTTP_GONE = 410
+
+# the attributes kept in the index for each entity type
+_INDEXED_ATTRIBUTES = {
+    "groups": ["id", "displayName"],
+    "servicePrincipals": ["id", "appId", "displayName"],
+    "users": ["id", "userPrincipalName"],
+}
+
+
+class _DeltaAPI(EntityAPI):
+    """The delta queries of an entity type"""
+
+    def __init__(self, access_token: str, entity_type: str, *, transport: GraphTransport | None = None):
+        self.entity_type = entity_type
+        super().__init__(access_token, transport=transport)
+
+    def _get_entity_path(self) -> str:
+        return self.entity_type
+
+    def get_delta_url(self) -> str:
+        """Returns the url of the initial delta query, selecting only the indexed attributes"""
+        return f"{self.entity_url}/delta?$select={','.join(_INDEXED_ATTRIBUTES[self.entity_type])}"
+
+
+class DirectoryIndex:
+    """A local index of the groups, service principals and users of a tenant (only the attributes used to map
+    policies, e.g. id and displayName), stored in a JSON file, so lookups are local dictionary hits.
+    The index is built once by listing all the entities with a delta query, and then refreshed incrementally with
+    the delta link stored by the previous refresh, so only the changes since then are downloaded"""
+
+    def __init__(
+        self,
+        file_path: str,
+        access_token: str,
+        *,
+        entity_types: list[str] | None = None,
+        transport: GraphTransport | None = None,
+    ):
+        """Creates a DirectoryIndex object, loading the index from the file if it exists (and belongs to the tenant
+        of the access token)
+        - file_path: the JSON file where the index is stored
+        - access_token: the access token to use for requests to the API
+        - entity_types: the entity types to index (default: groups, servicePrincipals and users)
+        - transport: the transport used to send requests (default: the transport shared by the whole process)
+        """
+        entity_types = entity_types if entity_types is not None else list(_INDEXED_ATTRIBUTES)
+        assert_condition(
+            all(entity_type in _INDEXED_ATTRIBUTES for entity_type in entity_types),
+            f"entity_types must be in {list(_INDEXED_ATTRIBUTES)}",
+        )
+        self.file_path = file_path
+        self.access_token = access_token
+        self.entity_types = entity_types
+        self.transport = transport
+        self._tenant = _get_tenant(f"Bearer {access_token}")
+        # entity type -> {"delta_link": the delta link of the next refresh, "entities": {id: attributes}}
+        self._tables: dict[str, dict] = {}
+        self._lookup_tables: dict[tuple[str, str, str], dict[str, str | None]] = {}
+        self._load()
+
+    def _load(self):
+        """Loads the index from the file, ignoring it if it belongs to another tenant"""
+        if not os.path.exists(self.file_path):
+            return
+        with open(self.file_path) as f:
+            data = json.load(f)
+        if data.get("tenant") != self._tenant:
+            _logger.warning(f"The directory index {self.file_path} belongs to another tenant. Rebuilding it...")
+            return
+        self._tables = data.get("entity_types", {})
+
+    def save(self):
+        """Stores the index in the file"""
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"tenant": self._tenant, "entity_types": self._tables}, f)
+        os.replace(temp_path, self.file_path)
+
+    def _sync(self, api: _DeltaAPI, url: str, entities: dict[str, dict]) -> str | None:
+        """Applies the changes of the delta query to the entities, following all its pages.
+        Returns the delta link of the next refresh, or None if the delta link expired"""
+        attributes = _INDEXED_ATTRIBUTES[api.entity_type]
+        for response in api._iter_pages(url):
+            if response.status_code == _HTTP_GONE:
+                return None
+            response.assert_success(f"Error synchronizing {api.entity_type}")
+            body = response.json()
+            for entity in body["value"]:
+                if _REMOVED in entity:
+                    entities.pop(entity["id"], None)
+                else:
+                    # changed entities may only have the changed attributes
+                    indexed_entity = entities.setdefault(entity["id"], {})
+                    indexed_entity.update({key: entity[key] for key in attributes if key in entity})
+            if _DELTA_LINK in body:
+                return body[_DELTA_LINK]
+        return None
+
+    def refresh(self):
+        """Builds the index of the entity types that are not indexed yet, and applies the changes since the last
+        refresh to the others"""
+        for entity_type in self.entity_types:
+            api = _DeltaAPI(self.access_token, entity_type, transport=self.transport)
+            table = self._tables.get(entity_type)
+            delta_link = None
+            if table and table.get("delta_link"):
+                _logger.info(f"Refreshing the index of {entity_type}...")
+                delta_link = self._sync(api, table["delta_link"], table["entities"])
+                if delta_link is None:
+                    _logger.warning(f"The delta link of {entity_type} expired. Rebuilding the index...")
+
+            if delta_link is None:
+                _logger.info(f"Building the index of {entity_type}...")
+                table = {"entities": {}}
+                delta_link = self._sync(api, api.get_delta_url(), table["entities"])
+                assert_condition(delta_link, f"The delta query of {entity_type} did not return a delta link")
+
+            table["delta_link"] = delta_link
+            self._tables[entity_type] = table
+            _logger.debug(f"{len(table['entities'])} {entity_type} indexed")
+        self._lookup_tables = {}
+
+    def _get_lookup_table(self, entity_type: str, key_attrib_name: str, value_attrib_name: str) -> dict:
+        """Returns a dictionary from the (lower case) key attribute to the value attribute of the entities.
+        Keys shared by several entities map to None, as they are ambiguous"""
+        lookup_table_key = (entity_type, key_attrib_name, value_attrib_name)
+        lookup_table = self._lookup_tables.get(lookup_table_key)
+        if lookup_table is None:
+            lookup_table = {}
+            for entity in self._tables.get(entity_type, {}).get("entities", {}).values():
+                key = entity.get(key_attrib_name)
+                if key is None:
+                    continue
+                key = str(key).lower()
+                lookup_table[key] = None if key in lookup_table else entity.get(value_attrib_name)
+            self._lookup_tables[lookup_table_key] = lookup_table
+        return lookup_table
+
+    def resolve(self, entity_type: str, key_attrib_name: str, value_attrib_name: str, keys: list[str]) -> dict:
+        """Resolves the keys against the index (e.g. group names to ids), matching them case-insensitively.
+        Keys that are not in the index or that match several entities are left out, so they can be looked up
+        in the API
+        - entity_type: groups, servicePrincipals or users
+        - key_attrib_name: the attribute to match the keys with (e.g. displayName)
+        - value_attrib_name: the attribute to return for each key (e.g. id)
+        """
+        lookup_table = self._get_lookup_table(entity_type, key_attrib_name, value_attrib_name)
+        result = {}
+        for key in keys:
+            value = lookup_table.get(key.lower())
+            if value is not None:
+                result[key] = value
+        return result
@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import Iterable
+from ca_pwt.helpers.graph_api import EntityAPI, APIResponse, _HTTP_NOT_FOUND
+from ca_pwt.helpers.graph_api_async import AsyncEntityAPI
+from ca_pwt.helpers.concurrency import map_in_order
+from ca_pwt.helpers.utils import assert_condition, is_guid
+
+# the maximum number of ids accepted by a single getByIds request
+_GET_BY_IDS_MAX_IDS = 1000
+
+_ODATA_TYPE = "@odata.type"
+
+
+class DirectoryObjectsAPI(EntityAPI):
+    """Directory objects (users, groups, roles, service principals, ...) resolved by id, across types"""
+
+    def _get_entity_path(self) -> str:
+        return "directoryObjects"
+
+    def _get_chunk_by_ids(self, ids: list[str], types: list[str] | None) -> tuple[APIResponse, dict[str, dict]]:
+        """Sends a single getByIds request and returns its response and the objects found, indexed by id"""
+        url = f"{self.entity_url}/getByIds"
+        self._logger.debug(f"POST {url}")
+        # getByIds only reads, so it is retried like a GET, and answers with 200 OK instead of 201 Created
+        response = APIResponse(
+            self.transport.post(url, headers=self.request_headers, json=_get_by_ids_body(ids, types), idempotent=True),
+            expected_status_code=200,
+        )
+        return response, _get_entities_by_id(response)
+
+    def get_by_ids(
+        self, entity_ids: list[str], select: list[str] | None = None, *, types: list[str] | None = None
+    ) -> list[APIResponse]:
+        """Returns the directory objects with the specified IDs with POST /directoryObjects/getByIds,
+        up to 1000 IDs per request (sent concurrently if jobs is greater than 1).
+        The responses are returned in the same order as the IDs, with a 404 response for the IDs that were not found.
+        The type of each object is in its @odata.type attribute (e.g. #microsoft.graph.group)
+        - select: the attributes to return (applied to the results, as getByIds returns the default attributes)
+        - types: the types of the objects to look for (e.g. ["group", "user"]; default: all types)
+        """
+        chunks = _get_by_ids_chunks(entity_ids)
+        self._logger.debug(
+            f"Getting {sum(len(chunk) for chunk in chunks)} directory objects in {len(chunks)} requests..."
+        )
+        chunk_results = map_in_order(lambda chunk: self._get_chunk_by_ids(chunk, types), chunks, self.jobs)
+        return _get_by_ids_responses(entity_ids, chunks, chunk_results, select)
+
+
+class AsyncDirectoryObjectsAPI(AsyncEntityAPI):
+    """Async variant of DirectoryObjectsAPI"""
+
+    def _get_entity_path(self) -> str:
+        return "directoryObjects"
+
+    async def _get_chunk_by_ids(self, ids: list[str], types: list[str] | None) -> tuple[APIResponse, dict[str, dict]]:
+        """Sends a single getByIds request and returns its response and the objects found, indexed by id"""
+        url = f"{self.entity_url}/getByIds"
+        self._logger.debug(f"POST {url}")
+        # getByIds only reads, so it is retried like a GET, and answers with 200 OK instead of 201 Created
+        response = APIResponse(
+            await self._request("POST", url, json=_get_by_ids_body(ids, types), idempotent=True),
+            expected_status_code=200,
+        )
+        return response, _get_entities_by_id(response)
+
+    async def get_by_ids(
+        self, entity_ids: list[str], select: list[str] | None = None, *, types: list[str] | None = None
+    ) -> list[APIResponse]:
+        """Async variant of DirectoryObjectsAPI.get_by_ids: the requests are sent concurrently
+        (bounded by the transport)"""
+        chunks = _get_by_ids_chunks(entity_ids)
+        self._logger.debug(
+            f"Getting {sum(len(chunk) for chunk in chunks)} directory objects in {len(chunks)} requests..."
+        )
+        chunk_results = await asyncio.gather(*(self._get_chunk_by_ids(chunk, types) for chunk in chunks))
+        return _get_by_ids_responses(entity_ids, chunks, chunk_results, select)
+
+
+def _get_by_ids_body(ids: list[str], types: list[str] | None) -> dict:
+    """Returns the body of a getByIds request"""
+    body: dict = {"ids": ids}
+    if types:
+        body["types"] = types
+    return body
+
+
+def _get_entities_by_id(response: APIResponse) -> dict[str, dict]:
+    """Returns the objects of a getByIds response, indexed by id"""
+    if not response.success:
+        return {}
+    return {entity["id"]: entity for entity in response.json()["value"]}
+
+
+def _get_by_ids_chunks(entity_ids: list[str]) -> list[list[str]]:
+    """Splits the unique IDs in chunks of up to 1000 IDs, one per getByIds request"""
+    assert_condition(all(entity_ids), "entity_ids cannot contain None")
+    # ids that are not guids (e.g. All) would fail the whole request
+    unique_ids = list(dict.fromkeys(entity_id for entity_id in entity_ids if is_guid(entity_id)))
+    return [unique_ids[start : start + _GET_BY_IDS_MAX_IDS] for start in range(0, len(unique_ids), _GET_BY_IDS_MAX_IDS)]
+
+
+def _get_by_ids_responses(
+    entity_ids: list[str],
+    chunks: list[list[str]],
+    chunk_results: Iterable[tuple[APIResponse, dict[str, dict]]],
+    select: list[str] | None,
+) -> list[APIResponse]:
+    """Returns one response per ID (in the same order) from the results of the getByIds requests of the chunks"""
+    responses: dict[str, APIResponse] = {}
+    entities: dict[str, dict] = {}
+    for chunk, (response, chunk_entities) in zip(chunks, chunk_results):
+        entities.update(chunk_entities)
+        if not response.success:
+            responses.update(dict.fromkeys(chunk, response))
+
+    result: list[APIResponse] = []
+    for entity_id in entity_ids:
+        if entity_id in entities:
+            entity = entities[entity_id]
+            if select:
+                entity = {key: value for key, value in entity.items() if key in select or key == _ODATA_TYPE}
+            result.append(APIResponse.from_values(200, entity))
+        elif entity_id in responses:
+            result.append(responses[entity_id])
+        else:
+            not_found = {"error": {"code": "Request_ResourceNotFound", "message": f"{entity_id} not found"}}
+            result.append(APIResponse.from_values(_HTTP_NOT_FOUND, not_found))
+    return result
@@ -1,6 +1,7 @@
-import requests
 import logging
-from ca_pwt.helpers.graph_api import APIResponse, EntityAPI, _REQUEST_TIMEOUT, DuplicateActionEnum, _HTTP_NOT_FOUND
+from ca_pwt.helpers.graph_api import APIResponse, EntityAPI, DuplicateActionEnum, _HTTP_NOT_FOUND
+from ca_pwt.helpers.graph_api_async import AsyncEntityAPI, AsyncGraphTransport, gather_by_key
+from ca_pwt.directory_objects import AsyncDirectoryObjectsAPI, DirectoryObjectsAPI, _ODATA_TYPE
 from ca_pwt.helpers.utils import assert_condition, cleanup_odata_dict, remove_element_from_dict, ensure_list
 
 _logger = logging.getLogger(__name__)
@@ -15,17 +16,23 @@ class GroupsAPI(EntityAPI):
         Returns an API_Response object
         To check if the request was successful, use the success property of the API_Response object
         """
-        add_user_url = f"https://graph.microsoft.com/v1.0/groups/{group_id}/members/$ref"
+        add_user_url = f"{self.entity_url}/{group_id}/members/$ref"
 
         # Define the payload to add user to group
-        payload = {"@odata.id": f"https://graph.microsoft.com/v1.0/directoryObjects/{user_id}"}
+        payload = {"@odata.id": f"{self.transport.base_url}/directoryObjects/{user_id}"}
 
         # Make the request to add user to group
         return APIResponse(
-            requests.post(add_user_url, headers=self.request_headers, json=payload, timeout=_REQUEST_TIMEOUT), 204
+            self.transport.post(add_user_url, headers=self.request_headers, json=payload),
+            204,
         )
 
 
+class AsyncGroupsAPI(AsyncEntityAPI):
+    def _get_entity_path(self) -> str:
+        return "groups"
+
+
 def load_groups(input_file: str) -> list[dict]:
     """Loads groups from the specified file.
     It also cleans up the dictionary to remove unnecessary elements."""
@@ -93,22 +100,42 @@ def cleanup_groups(source: list[dict]) -> list[dict]:
     return source
 
 
-def get_groups_by_ids(access_token: str, group_ids: list[str], *, ignore_not_found: bool = True) -> list[dict]:
-    """Obtain groups with the specified ids."""
+def get_groups_by_ids(
+    access_token: str,
+    group_ids: list[str],
+    *,
+    ignore_not_found: bool = True,
+    jobs: int = 1,
+    select: list[str] | None = None,
+) -> list[dict]:
+    """Obtain groups with the specified ids.
+    If jobs is greater than 1, the requests are sent concurrently by a pool of jobs threads.
+    If select is specified, only those attributes of the groups are returned (default: all attributes).
+    Groups are returned in the same order as the ids."""
     assert_condition(group_ids, "group_ids cannot be None")
     _logger.info("Getting groups by ids...")
     _logger.debug(f"Ignoring not found groups: {ignore_not_found}")
 
+    directory_objects_api = DirectoryObjectsAPI(access_token=access_token, jobs=jobs)
+    # up to 1000 groups are fetched per request
+    group_responses = directory_objects_api.get_by_ids(group_ids, select=select, types=["group"])
+    return _get_groups_from_responses(group_ids, group_responses, ignore_not_found=ignore_not_found)
+
+
+def _get_groups_from_responses(
+    group_ids: list[str], group_responses: list[APIResponse], *, ignore_not_found: bool
+) -> list[dict]:
+    """Returns the groups of the getByIds responses of the group ids, skipping the groups that were not found
+    if ignore_not_found is True"""
     result: list[dict] = []
-    groups_api = GroupsAPI(access_token=access_token)
-    for group_id in group_ids:
-        group_response = groups_api.get_by_id(group_id)
+    for group_id, group_response in zip(group_ids, group_responses):
         if group_response.status_code == _HTTP_NOT_FOUND and ignore_not_found:
             _logger.warning(f"Group with id {group_id} was not found.")
             continue
         else:
             group_response.assert_success()
         group_detail = cleanup_odata_dict(group_response.json())
+        remove_element_from_dict(group_detail, _ODATA_TYPE)
         result.append(group_detail)
     return result
 
@@ -133,13 +160,59 @@ def import_groups(
     return result
 
 
+async def get_groups_by_ids_async(
+    access_token: str,
+    group_ids: list[str],
+    *,
+    ignore_not_found: bool = True,
+    select: list[str] | None = None,
+    transport: AsyncGraphTransport,
+) -> list[dict]:
+    """Async variant of get_groups_by_ids: the getByIds requests (up to 1000 groups each) are sent concurrently
+    (bounded by the transport)"""
+    assert_condition(group_ids, "group_ids cannot be None")
+    _logger.info("Getting groups by ids...")
+    _logger.debug(f"Ignoring not found groups: {ignore_not_found}")
+
+    directory_objects_api = AsyncDirectoryObjectsAPI(access_token=access_token, transport=transport)
+    group_responses = await directory_objects_api.get_by_ids(group_ids, select=select, types=["group"])
+    return _get_groups_from_responses(group_ids, group_responses, ignore_not_found=ignore_not_found)
+
+
+async def import_groups_async(
+    access_token: str,
+    groups: list[dict],
+    duplicate_action: DuplicateActionEnum = DuplicateActionEnum.IGNORE,
+    *,
+    transport: AsyncGraphTransport,
+) -> list[tuple[str, str]]:
+    """Async variant of import_groups: the groups are imported concurrently (bounded by the transport),
+    except for groups with the same display name, which are imported in order"""
+    _logger.info("Importing groups...")
+    groups_api = AsyncGroupsAPI(access_token=access_token, transport=transport)
+    groups = cleanup_groups(groups)
+
+    async def import_group(group: dict) -> tuple[str, str]:
+        group_name = group["displayName"]
+        response = await groups_api.create_checking_duplicates(
+            group, f"displayName eq '{group_name}'", duplicate_action
+        )
+        response.assert_success()
+        group_id = response.json()["id"]
+        _logger.info(f"Imported group {group_name} with id {group_id}")
+        return (group_id, group_name)
+
+    return await gather_by_key(groups, lambda group: group["displayName"], import_group)
+
+
 def delete_groups(access_token: str, groups: list[dict]):
     """Deletes groups that are in the specified list of groups (mandatory fields: id)."""
     _logger.info("Deleting groups...")
     groups_api = GroupsAPI(access_token=access_token)
-    for group in groups:
-        group_id = group["id"]
-        response = groups_api.delete(group_id)
+    group_ids = [group["id"] for group in groups]
+    # requests are packed in $batch envelopes to save round trips
+    responses = groups_api.delete_by_ids(group_ids)
+    for group_id, response in zip(group_ids, responses):
         if response.status_code == _HTTP_NOT_FOUND:
             _logger.warning(f"Group with id {group_id} was not found.")
             continue
@@ -0,0 +1,197 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from ca_pwt.helpers.transport import GraphTransport
+from ca_pwt.helpers.utils import assert_condition
+
+_logger = logging.getLogger(__name__)
+
+# the only headers stored in a cassette: the Authorization header (and anything else that could hold a secret)
+# is never written to disk
+_RECORDED_REQUEST_HEADERS = ["Content-Type"]
+_RECORDED_RESPONSE_HEADERS = ["Content-Type", "Location", "Retry-After"]
+
+_CASSETTE_MODES = ["record", "replay"]
+
+
+def _get_body(body: Any) -> str | None:
+    """Returns the body of a request as a string, with JSON bodies normalized so they match regardless of
+    the order of their keys"""
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode()
+    try:
+        return json.dumps(json.loads(body), sort_keys=True)
+    except ValueError:
+        return body
+
+
+def _get_key(method: str, url: str, body: Any) -> str:
+    """Returns the key that matches a request with its recorded interactions"""
+    return f"{method.upper()} {url} {_get_body(body) or ''}"
+
+
+class Cassette:
+    """A file of recorded Graph API interactions (requests and their responses), so commands can be replayed
+    offline. Requests are matched by method, url and body; identical requests are answered in the order they
+    were recorded, and the last response is repeated once they are exhausted.
+    Authorization headers are never recorded. It is thread-safe"""
+
+    def __init__(self, file_path: str):
+        """Creates a Cassette object, loading the interactions of the file if it exists
+        - file_path: the JSON file where the interactions are stored
+        """
+        self.file_path = file_path
+        self.interactions: list[dict] = []
+        self._lock = threading.Lock()
+        self._served: dict[str, int] = {}
+        if os.path.exists(file_path):
+            with open(file_path) as f:
+                self.interactions = json.load(f)["interactions"]
+        self._by_key: dict[str, list[dict]] = {}
+        for interaction in self.interactions:
+            self._index(interaction)
+
+    def _index(self, interaction: dict):
+        request = interaction["request"]
+        self._by_key.setdefault(_get_key(request["method"], request["url"], request["body"]), []).append(interaction)
+
+    def record(self, request: PreparedRequest, response: Response):
+        """Records a request and its response"""
+        interaction = {
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "headers": {key: request.headers[key] for key in _RECORDED_REQUEST_HEADERS if key in request.headers},
+                "body": _get_body(request.body),
+            },
+            "response": {
+                "status_code": response.status_code,
+                "headers": {
+                    key: response.headers[key] for key in _RECORDED_RESPONSE_HEADERS if key in response.headers
+                },
+                "body": response.text,
+            },
+            "elapsed": response.elapsed.total_seconds(),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+            self._index(interaction)
+
+    def find(self, request: PreparedRequest) -> dict | None:
+        """Returns the next recorded interaction matching the request, or None if it was not recorded"""
+        key = _get_key(str(request.method), str(request.url), request.body)
+        with self._lock:
+            interactions = self._by_key.get(key)
+            if not interactions:
+                return None
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+            return interactions[min(served, len(interactions) - 1)]
+
+    def clear(self):
+        """Discards all the interactions (e.g. before recording them again)"""
+        with self._lock:
+            self.interactions = []
+            self._by_key = {}
+            self._served = {}
+
+    def save(self):
+        """Stores the interactions in the file"""
+        with self._lock:
+            temp_path = f"{self.file_path}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump({"interactions": self.interactions}, f, indent=4)
+            os.replace(temp_path, self.file_path)
+        _logger.info(f"Recorded {len(self.interactions)} interactions in {self.file_path}")
+
+
+class RecordingAdapter(BaseAdapter):
+    """A requests adapter that sends the requests with another adapter and records them in a cassette"""
+
+    def __init__(self, cassette: Cassette, adapter: BaseAdapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(  # noqa: PLR0917
+        self,
+        request: PreparedRequest,
+        stream: bool = False,  # noqa: FBT001, FBT002
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,  # noqa: FBT001, FBT002
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> Response:
+        response = self.adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        self.cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """A requests adapter that answers the requests with the interactions of a cassette, without network access"""
+
+    def __init__(self, cassette: Cassette, latency: float | None = None):
+        """Creates a ReplayAdapter object
+        - cassette: the cassette with the recorded interactions
+        - latency: the number of seconds each response is delayed (default: the recorded latency)
+        """
+        assert_condition(latency is None or latency >= 0, "latency cannot be negative")
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+
+    def send(  # noqa: PLR0917
+        self,
+        request: PreparedRequest,
+        stream: bool = False,  # noqa: FBT001, FBT002, ARG002
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,  # noqa: ARG002
+        verify: bool | str = True,  # noqa: FBT001, FBT002, ARG002
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,  # noqa: ARG002
+        proxies: Mapping[str, str] | None = None,  # noqa: ARG002
+    ) -> Response:
+        interaction = self.cassette.find(request)
+        if interaction is None:
+            msg = f"No recorded response for {request.method} {request.url} in {self.cassette.file_path}"
+            raise ValueError(msg)
+        latency = self.latency if self.latency is not None else interaction["elapsed"]
+        if latency > 0:
+            time.sleep(latency)
+        recorded_response = interaction["response"]
+        response = Response()
+        response.status_code = recorded_response["status_code"]
+        response.headers.update(recorded_response["headers"])
+        response._content = recorded_response["body"].encode()
+        response.encoding = "utf-8"
+        response.url = str(request.url)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def use_cassette(transport: GraphTransport, cassette: Cassette, mode: str, *, latency: float | None = None):
+    """Plugs a cassette into the transport, so all the requests sent through it are either recorded
+    (mode=record; the cassette must be saved afterwards) or answered from the cassette (mode=replay).
+    The retry policy, rate limiter, response cache and metrics of the transport still apply
+    - latency: the number of seconds each replayed response is delayed (default: the recorded latency)
+    """
+    assert_condition(mode in _CASSETTE_MODES, f"mode must be in {_CASSETTE_MODES}")
+    for prefix in ["https://", "http://"]:
+        adapter: BaseAdapter
+        if mode == "record":
+            adapter = RecordingAdapter(cassette, transport.session.get_adapter(prefix))
+        else:
+            adapter = ReplayAdapter(cassette, latency)
+        transport.session.mount(prefix, adapter)
@@ -0,0 +1,47 @@
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def map_in_order(func: Callable[[_T], _R], items: Sequence[_T], jobs: int = 1) -> list[_R]:
+    """Applies func to all the items, fanning out over a pool of jobs threads if jobs is greater than 1.
+    The results are returned in the same order as the items"""
+    if jobs <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key: while a call is in flight, the other calls with the same key
+    wait for it and share its result (or its exception) instead of running the function again.
+    Calls made after the call in flight has completed run the function again. It is thread-safe"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, func: Callable[[], _R]) -> _R:
+        """Runs func, unless a call with the same key is already in flight, in which case its result is returned"""
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
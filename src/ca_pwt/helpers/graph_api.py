@@ -1,20 +1,39 @@
-import requests
+import json
 import logging
 import time
 from abc import ABC, abstractmethod
 from enum import StrEnum
-from typing import Any, Callable
-from requests.models import Response
+from typing import Any, Protocol
+from collections.abc import Iterable, Iterator
+from urllib.parse import quote
+from requests.utils import requote_uri
 from ca_pwt.helpers.utils import assert_condition
-
-_REQUEST_TIMEOUT = 500
-_THROTTLING_STATUS_CODE = 429
-_THROTTLING_RETRY_AFTER_HEADER = "Retry-After"
-_THROTTLING_RETRY_AFTER_DEFAULT = 10
-_THROTTLING_MAX_RETRIES = 5
+from ca_pwt.helpers.transport import (
+    GraphTransport,
+    get_default_transport,
+    _AUTHORIZATION_HEADER,
+    _CONTENT_TYPE_HEADER,
+    _HTTP_OK,
+    _get_retry_after,
+    _is_throttled,
+    _GRAPH_API_BASE_URL,
+    _SERVICE_UNAVAILABLE_STATUS_CODE,
+)
+from ca_pwt.helpers.retry import RetryPolicy
+from ca_pwt.helpers.concurrency import map_in_order
 
 _HTTP_NOT_FOUND = 404
 
+_ODATA_NEXT_LINK = "@odata.nextLink"
+
+_BATCH_MAX_REQUESTS = 20
+
+# the API accepts up to 15 values in an `in` filter, and the length of the filter is kept well below
+# the url length limits
+_ODATA_IN_MAX_VALUES = 15
+_ODATA_IN_MAX_LENGTH = 1500
+_ODATA_MAX_PAGE_SIZE = 999
+
 
 class DuplicateActionEnum(StrEnum):
     IGNORE = "ignore"
@@ -23,12 +42,81 @@ class DuplicateActionEnum(StrEnum):
     FAIL = "fail"
 
 
+class HTTPResponse(Protocol):
+    """The subset of the response interface (shared by requests and httpx) used by APIResponse"""
+
+    status_code: int
+
+    @property
+    def headers(self) -> Any: ...
+
+    @property
+    def text(self) -> str: ...
+
+    def json(self, **kwargs: Any) -> Any: ...
+
+
+def _build_collection_url(
+    entity_url: str,
+    odata_filter: str | None = None,
+    odata_top: int | None = None,
+    select: list[str] | None = None,
+) -> str:
+    """Returns the url of an entity collection with the specified query parameters"""
+    url = f"{entity_url}?"
+
+    if odata_filter:
+        url += f"$filter={odata_filter}&"
+
+    if odata_top:
+        url += f"$top={odata_top}&"
+
+    if select:
+        url += f"$select={','.join(select)}&"
+
+    # remove the last character if it is a & or ?
+    if url[-1] in ["&", "?"]:
+        url = url[:-1]
+
+    return url
+
+
+def _add_select(url: str, select: list[str] | None) -> str:
+    """Adds the $select query parameter to the url, so only the specified attributes are returned"""
+    if not select:
+        return url
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}$select={','.join(select)}"
+
+
+def _build_in_filters(attrib_name: str, values: list[str]) -> list[str]:
+    """Returns the `attrib_name in ('a','b',...)` filters that match the values, split in chunks that respect
+    the limits of the API. The values are quoted and url encoded"""
+    filters: list[str] = []
+    chunk: list[str] = []
+    chunk_length = 0
+    for value in values:
+        quoted_value = "'" + quote(value.replace("'", "''"), safe="") + "'"
+        if chunk and (len(chunk) >= _ODATA_IN_MAX_VALUES or chunk_length + len(quoted_value) > _ODATA_IN_MAX_LENGTH):
+            filters.append(f"{attrib_name} in ({','.join(chunk)})")
+            chunk, chunk_length = [], 0
+        chunk.append(quoted_value)
+        chunk_length += len(quoted_value) + 1
+    if chunk:
+        filters.append(f"{attrib_name} in ({','.join(chunk)})")
+    return filters
+
+
 class APIResponse:
-    """A class to represent an API response"""
+    """A class to represent an API response.
+    The body is decoded only once, on first access, and the raw response is then released, so long runs do not
+    keep every response body alive"""
+
+    __slots__ = ("_body", "_raw_response", "expected_status_code", "status_code", "success")
 
     _logger = logging.getLogger(__name__)
 
-    def __init__(self, request_response: requests.Response, expected_status_code: int = 200):
+    def __init__(self, request_response: HTTPResponse, expected_status_code: int = 200):
         """Creates an API_Response object
         - request_response: the response from the API request
         - expected_status_code: the expected status code for the request
@@ -36,25 +124,46 @@ class APIResponse:
         the success property will be set to True
         """
         self.status_code = request_response.status_code
-        self.response: requests.Response | str | dict[str, Any] = request_response
         self.expected_status_code = expected_status_code
         self.success = self.status_code == self.expected_status_code
+        self._raw_response: HTTPResponse | None = request_response
+        self._body: Any = None
         if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(f"Status code: {self.status_code}")
-            self._logger.debug(f"Response: {self.response.text}")
 
-    def json(self):
-        """Returns the JSON representation of the response"""
-        # check if the self.response has a json() method. If so, use it
-        if hasattr(self.response, "json") and callable(self.response.json):
-            text = self.response.text
+    @classmethod
+    def from_values(cls, status_code: int, body: Any, expected_status_code: int = 200) -> "APIResponse":
+        """Creates an APIResponse object from a status code and an already decoded body
+        (e.g. a sub-response of a $batch request)"""
+        api_response = cls.__new__(cls)
+        api_response.status_code = status_code
+        api_response.expected_status_code = expected_status_code
+        api_response.success = status_code == expected_status_code
+        api_response._raw_response = None
+        api_response._body = body if body is not None else ""
+        return api_response
+
+    @property
+    def response(self) -> Any:
+        """The decoded body of the response: a dict for JSON objects, otherwise the text of the body"""
+        if self._raw_response is not None:
+            text = self._raw_response.text
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(f"Response: {text}")
             # check if the response is JSON
-            if text.startswith("{") and text.endswith("}"):
-                return self.response.json()
-            else:
-                return text
-        else:
-            return self.response
+            self._body = json.loads(text) if text.startswith("{") and text.endswith("}") else text
+            self._raw_response = None
+        return self._body
+
+    @response.setter
+    def response(self, body: Any):
+        """Replaces the body of the response (e.g. with the entity found in a collection)"""
+        self._raw_response = None
+        self._body = body
+
+    def json(self) -> Any:
+        """Returns the JSON representation of the response (decoded on first access)"""
+        return self.response
 
     def assert_success(self, error_message: str = ""):
         """Asserts that the request was successful
@@ -66,8 +175,20 @@ class APIResponse:
 
     def __str__(self) -> str:
         """Returns a string representation of the object"""
-        response_text = self.response.text if hasattr(self.response, "text") else self.response
-        return f"APIResponse: status_code={self.status_code}, success={self.success}, response={response_text}"
+        return f"APIResponse: status_code={self.status_code}, success={self.success}, response={self.response}"
+
+
+class KeyResolution:
+    """A class to represent the result of resolving many keys at once (see EntityAPI.resolve_keys)
+    - found: the value of each key that was found (the first one, if the key is ambiguous)
+    - ambiguous: all the values of the keys that matched more than one entity
+    - missing: the keys that were not found, or could not be looked up
+    """
+
+    def __init__(self) -> None:
+        self.found: dict[str, Any] = {}
+        self.ambiguous: dict[str, list[Any]] = {}
+        self.missing: list[str] = []
 
 
 class EntityAPI(ABC):
@@ -75,12 +196,17 @@ class EntityAPI(ABC):
 
     _logger = logging.getLogger(__name__)
 
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, *, transport: GraphTransport | None = None, jobs: int = 1):
         """Creates an EntityAPI object
         - access_token: the access token to use for requests to the API
+        - transport: the transport used to send requests (default: the transport shared by the whole process)
+        - jobs: the number of threads used to send independent requests of batched operations (default: 1)
         """
-        self.entity_url = f"https://graph.microsoft.com/v1.0/{self._get_entity_path()}"
+        assert_condition(jobs > 0, "jobs must be greater than 0")
         self.access_token = access_token
+        self.transport = transport if transport is not None else get_default_transport()
+        self.entity_url = f"{self.transport.base_url}/{self._get_entity_path()}"
+        self.jobs = jobs
         self.request_headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
@@ -91,42 +217,11 @@ class EntityAPI(ABC):
         """Returns the path to the entity in the Microsoft Graph API"""
         pass
 
-    def _request_with_throttling_control(self, func: Callable[..., Response], *args, **kwargs) -> Response:
-        """Sends a request to the API with throttling control"""
-        # set the number of retries to 0
-        retries = 0
-        # while we have not exceeded the maximum number of retries
-        while retries < _THROTTLING_MAX_RETRIES:
-            # send the request
-            response = func(*args, **kwargs)
-            # if the request failed with a throttling error
-            if response.status_code == _THROTTLING_STATUS_CODE:
-                # get the retry after header
-                retry_after_header = response.headers.get(_THROTTLING_RETRY_AFTER_HEADER)
-                if retry_after_header is not None:
-                    retry_after = int(retry_after_header)
-                else:
-                    retry_after = _THROTTLING_RETRY_AFTER_DEFAULT
-                # log the throttling error
-                self._logger.warning(
-                    f"Throttling error: {response.status_code}  {response.text}. "
-                    f"Retrying in {retry_after} seconds..."
-                )
-                # wait for the specified number of seconds
-                time.sleep(retry_after)
-                # increment the number of retries
-                retries += 1
-            else:
-                break
-        return response
-
     def _request_get(self, url: str) -> APIResponse:
         """Sends a GET request to the API"""
         self._logger.debug(f"GET {url}")
         return APIResponse(
-            self._request_with_throttling_control(
-                requests.get, url, headers=self.request_headers, timeout=_REQUEST_TIMEOUT
-            ),
+            self.transport.get(url, headers=self.request_headers),
             expected_status_code=200,
         )
 
@@ -134,9 +229,7 @@ class EntityAPI(ABC):
         """Sends a POST request to the API"""
         self._logger.debug(f"POST {url}")
         return APIResponse(
-            self._request_with_throttling_control(
-                requests.post, url, headers=self.request_headers, json=entity, timeout=_REQUEST_TIMEOUT
-            ),
+            self.transport.post(url, headers=self.request_headers, json=entity),
             expected_status_code=201,
         )
 
@@ -144,9 +237,7 @@ class EntityAPI(ABC):
         """Sends a DELETE request to the API"""
         self._logger.debug(f"DELETE {url}")
         return APIResponse(
-            self._request_with_throttling_control(
-                requests.delete, url, headers=self.request_headers, timeout=_REQUEST_TIMEOUT
-            ),
+            self.transport.delete(url, headers=self.request_headers),
             expected_status_code=204,
         )
 
@@ -154,55 +245,118 @@ class EntityAPI(ABC):
         """Sends a PATCH request to the API"""
         self._logger.debug(f"PATCH {url}")
         return APIResponse(
-            self._request_with_throttling_control(
-                requests.patch, url, headers=self.request_headers, json=entity, timeout=_REQUEST_TIMEOUT
-            ),
+            self.transport.patch(url, headers=self.request_headers, json=entity),
             expected_status_code=204,
         )
 
+    def _get_collection_url(
+        self,
+        odata_filter: str | None = None,
+        odata_top: int | None = None,
+        select: list[str] | None = None,
+    ) -> str:
+        """Returns the url of the entity collection with the specified query parameters"""
+        return _build_collection_url(self.entity_url, odata_filter=odata_filter, odata_top=odata_top, select=select)
+
+    def _iter_pages(self, url: str) -> Iterator[APIResponse]:
+        """Sends a GET request to the url and follows the @odata.nextLink of each page,
+        yielding the responses as they arrive. Stops at the first unsuccessful response (which is also yielded)
+        """
+        next_url: str | None = url
+        while next_url:
+            response = self._request_get(next_url)
+            yield response
+            if not response.success:
+                return
+            next_url = response.json().get(_ODATA_NEXT_LINK)
+
+    def iter_all(
+        self,
+        odata_filter: str | None = None,
+        select: list[str] | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[dict]:
+        """Iterates over all entities in the API, following @odata.nextLink until the last page.
+        Pages are only requested when the previous one has been consumed, so memory usage is bounded by
+        the page size and not by the number of entities
+        - odata_filter: the OData filter to apply
+        - select: the attributes to return (default: all attributes)
+        - page_size: the number of entities per page (default: the API default)
+        """
+        yield from self._iter_entities(
+            self._get_collection_url(odata_filter=odata_filter, odata_top=page_size, select=select)
+        )
+
+    def _iter_entities(self, url: str) -> Iterator[dict]:
+        """Iterates over the entities of the url and of all its next pages"""
+        for response in self._iter_pages(url):
+            response.assert_success(f"Error listing {self._get_entity_path()}")
+            yield from response.json()["value"]
+
     def get_all(
         self,
         odata_filter: str | None = None,
         odata_top: int | None = None,
+        select: list[str] | None = None,
     ) -> APIResponse:
-        """Returns all entities in the API"""
-        url = f"{self.entity_url}?"
-
-        if odata_filter:
-            url += f"$filter={odata_filter}&"
+        """Returns all entities in the API
+        If odata_top is specified, only the first page (with up to odata_top entities) is returned.
+        Otherwise, all the pages are followed and their entities are merged in the value property of the response
+        - select: the attributes to return (default: all attributes)
+        """
+        url = self._get_collection_url(odata_filter=odata_filter, odata_top=odata_top, select=select)
 
         if odata_top:
-            url += f"$top={odata_top}&"
+            return self._request_get(url)
+
+        entities: list[dict] = []
+        for response in self._iter_pages(url):
+            if not response.success:
+                return response
+            entities.extend(response.json()["value"])
+        response.response = {"value": entities}
+        return response
 
-        # remove the last character if it is a & or ?
-        # this is here for future use if we add more query parameters
-        if url[-1] in ["&", "?"]:
-            url = url[:-1]
+    def _get_entity_url(self, entity_id: str) -> str:
+        """Returns the url of the entity with the specified ID"""
+        return f"{self.entity_url}/{entity_id}"
 
-        return self._request_get(url)
+    def _create_batch_api(self) -> "BatchAPI":
+        """Returns a BatchAPI object that shares the access token, transport and jobs of this object"""
+        return BatchAPI(self.access_token, transport=self.transport, jobs=self.jobs)
 
-    def get_by_id(self, entity_id: str) -> APIResponse:
+    def get_by_id(self, entity_id: str, select: list[str] | None = None) -> APIResponse:
         """Returns an entity by its ID
-        Entity is returned as a JSON object in the response (response.json())"""
+        Entity is returned as a JSON object in the response (response.json())
+        - select: the attributes to return (default: all attributes)
+        """
         assert_condition(entity_id, "entity_id cannot be None")
-        url = f"{self.entity_url}/{entity_id}"
-        return self._request_get(url)
+        return self._request_get(_add_select(self._get_entity_url(entity_id), select))
+
+    def get_by_ids(self, entity_ids: list[str], select: list[str] | None = None) -> list[APIResponse]:
+        """Returns the entities with the specified IDs, packing the requests in $batch envelopes
+        The responses are returned in the same order as the IDs"""
+        assert_condition(all(entity_ids), "entity_ids cannot contain None")
+        return self._create_batch_api().execute(
+            [BatchRequest("GET", _add_select(self._get_entity_url(entity_id), select)) for entity_id in entity_ids]
+        )
 
-    def get_by_display_name(self, display_name: str) -> APIResponse:
+    def get_by_display_name(self, display_name: str, select: list[str] | None = None) -> APIResponse:
         """Gets the top entity found with the given display name
         Returns an API_Response object and the entity is in the json property of the API_Response object
         """
-        return self.get_top_entity(f"displayName eq '{display_name}'")
+        return self.get_top_entity(f"displayName eq '{display_name}'", select=select)
 
-    def get_top_entity(self, odata_filter: str, *, use_top: bool = True) -> APIResponse:
-        """Gets the top entity found with the given filter
-        Returns an API_Response object and the entity is in the json property of the API_Response object
-        If use_top is True, the $top query parameter is used to get only the top entity, otherwise all entities are
-        returned and the first one is returned
-        """
+    def get_by_display_names(self, display_names: list[str], select: list[str] | None = None) -> list[APIResponse]:
+        """Gets the top entity found for each of the given display names, packing the requests in $batch envelopes
+        The responses are returned in the same order as the display names"""
+        return self.get_top_entities(
+            [f"displayName eq '{display_name}'" for display_name in display_names], select=select
+        )
 
-        assert_condition(odata_filter, "odata_filter cannot be None")
-        response = self.get_all(odata_filter=odata_filter, odata_top=1 if use_top else None)
+    @staticmethod
+    def _to_top_entity_response(response: APIResponse) -> APIResponse:
+        """Transforms a successful collection response in a response with the first entity found"""
         # if the request was successful, transform the response to a dict
         if response.success:
             # move the value property to the response property
@@ -216,6 +370,106 @@ class EntityAPI(ABC):
                 response.response = value[0]
         return response
 
+    def get_top_entity(
+        self, odata_filter: str, *, use_top: bool = True, select: list[str] | None = None
+    ) -> APIResponse:
+        """Gets the top entity found with the given filter
+        Returns an API_Response object and the entity is in the json property of the API_Response object
+        If use_top is True, the $top query parameter is used to get only the top entity, otherwise all entities are
+        returned and the first one is returned
+        If select is specified, only those attributes of the entity are returned
+        """
+
+        assert_condition(odata_filter, "odata_filter cannot be None")
+        response = self.get_all(odata_filter=odata_filter, odata_top=1 if use_top else None, select=select)
+        return self._to_top_entity_response(response)
+
+    def get_top_entities(
+        self, odata_filters: list[str], *, use_top: bool = True, select: list[str] | None = None
+    ) -> list[APIResponse]:
+        """Gets the top entity found for each of the given filters, packing the requests in $batch envelopes
+        The responses are returned in the same order as the filters. See get_top_entity for the use_top parameter.
+        Note: when use_top is False, only the first page of each filter is considered
+        """
+        assert_condition(all(odata_filters), "odata_filters cannot contain None")
+        odata_top = 1 if use_top else None
+        responses = self._create_batch_api().execute(
+            [
+                BatchRequest(
+                    "GET", self._get_collection_url(odata_filter=odata_filter, odata_top=odata_top, select=select)
+                )
+                for odata_filter in odata_filters
+            ]
+        )
+        return [self._to_top_entity_response(response) for response in responses]
+
+    def resolve_keys(self, keys: list[str], key_attrib_name: str, value_attrib_name: str = "id") -> KeyResolution:
+        """Resolves many keys at once (e.g. display names to ids), looking up many keys per request with
+        `key_attrib_name in ('a','b',...)` filters, chunked to the limits of the API and packed in $batch envelopes.
+        Keys are matched case-insensitively, as the API does.
+        - keys: the values of key_attrib_name to look up (e.g. group names)
+        - key_attrib_name: the attribute used to filter the entities (e.g. displayName, userPrincipalName, appId)
+        - value_attrib_name: the attribute to return for each key (default: id)
+        """
+        assert_condition(all(keys), "keys cannot contain None")
+        unique_keys = list(dict.fromkeys(key.lower() for key in keys))
+        select = list(dict.fromkeys([key_attrib_name, value_attrib_name]))
+        odata_filters = _build_in_filters(key_attrib_name, unique_keys)
+        responses = self._create_batch_api().execute(
+            [
+                BatchRequest(
+                    "GET",
+                    self._get_collection_url(odata_filter=odata_filter, odata_top=_ODATA_MAX_PAGE_SIZE, select=select),
+                )
+                for odata_filter in odata_filters
+            ]
+        )
+
+        entities: list[dict] = []
+        for odata_filter, response in zip(odata_filters, responses):
+            if not response.success:
+                # the keys of this chunk are reported as missing, so the caller can look them up in another way
+                self._logger.warning(f"Could not resolve {self._get_entity_path()} with {odata_filter}: {response}")
+                continue
+            entities.extend(response.json()["value"])
+            next_link = response.json().get(_ODATA_NEXT_LINK)
+            if next_link:
+                entities.extend(self._iter_entities(next_link))
+        return self._match_keys(keys, entities, key_attrib_name, value_attrib_name)
+
+    def resolve_keys_by_listing(
+        self, keys: list[str], key_attrib_name: str, value_attrib_name: str = "id"
+    ) -> KeyResolution:
+        """Resolves many keys at once with a paged listing of all the entities (selecting only key_attrib_name and
+        value_attrib_name), which takes fewer requests than resolve_keys when the keys are many.
+        Keys are matched case-insensitively, as the API does (see resolve_keys for the parameters)"""
+        assert_condition(all(keys), "keys cannot contain None")
+        select = list(dict.fromkeys([key_attrib_name, value_attrib_name]))
+        entities = self.iter_all(select=select, page_size=_ODATA_MAX_PAGE_SIZE)
+        return self._match_keys(keys, entities, key_attrib_name, value_attrib_name)
+
+    @staticmethod
+    def _match_keys(
+        keys: list[str], entities: Iterable[dict], key_attrib_name: str, value_attrib_name: str
+    ) -> KeyResolution:
+        """Matches the keys with the key_attrib_name of the entities, case-insensitively"""
+        matches: dict[str, list[Any]] = {}
+        for entity in entities:
+            key_value = entity.get(key_attrib_name)
+            if key_value is not None:
+                matches.setdefault(str(key_value).lower(), []).append(entity.get(value_attrib_name))
+
+        result = KeyResolution()
+        for key in keys:
+            values = matches.get(key.lower())
+            if not values:
+                result.missing.append(key)
+                continue
+            result.found[key] = values[0]
+            if len(values) > 1:
+                result.ambiguous[key] = values
+        return result
+
     def create(self, entity: dict) -> APIResponse:
         """Creates an entity"""
         assert_condition(entity, "entity cannot be None")
@@ -260,12 +514,183 @@ class EntityAPI(ABC):
     def delete(self, entity_id: str) -> APIResponse:
         """Deletes an entity by its ID"""
         assert_condition(entity_id, "entity_id cannot be None")
-        url = f"{self.entity_url}/{entity_id}"
-        return self._request_delete(url)
+        return self._request_delete(self._get_entity_url(entity_id))
+
+    def delete_by_ids(self, entity_ids: list[str]) -> list[APIResponse]:
+        """Deletes the entities with the specified IDs, packing the requests in $batch envelopes
+        The responses are returned in the same order as the IDs"""
+        assert_condition(all(entity_ids), "entity_ids cannot contain None")
+        return self._create_batch_api().execute(
+            [
+                BatchRequest("DELETE", self._get_entity_url(entity_id), expected_status_code=204)
+                for entity_id in entity_ids
+            ]
+        )
 
     def update(self, entity_id: str, entity: dict) -> APIResponse:
         """Updates an entity by its ID"""
         assert_condition(entity_id, "entity_id cannot be None")
         assert_condition(entity, "entity cannot be None")
-        url = f"{self.entity_url}/{entity_id}"
-        return self._request_patch(url, entity)
+        return self._request_patch(self._get_entity_url(entity_id), entity)
+
+
+class BatchRequest:
+    """A class to represent a request to be sent inside a JSON $batch envelope"""
+
+    def __init__(self, method: str, url: str, body: dict | None = None, expected_status_code: int = 200):
+        """Creates a BatchRequest object
+        - method: the HTTP method (GET, POST, PATCH, DELETE)
+        - url: the url of the request, either absolute or relative to the Graph API version (e.g. /groups/<id>)
+        - body: the JSON body of the request, if any
+        - expected_status_code: the expected status code for the request
+        """
+        self.method = method.upper()
+        self.url = url
+        self.body = body
+        self.expected_status_code = expected_status_code
+
+    def get_absolute_url(self, base_url: str = _GRAPH_API_BASE_URL) -> str:
+        """Returns the absolute url of this request
+        - base_url: the base url of the API the request is sent to, including the version
+        """
+        return self.url if self.url.startswith(base_url) else f"{base_url}{self.url}"
+
+    def to_dict(self, request_id: str, base_url: str = _GRAPH_API_BASE_URL) -> dict[str, Any]:
+        """Returns the representation of this request inside a $batch envelope
+        - base_url: the base url of the API the envelope is sent to, including the version
+        """
+        url = self.url.removeprefix(base_url)
+        result: dict[str, Any] = {"id": request_id, "method": self.method, "url": requote_uri(url)}
+        if self.body is not None:
+            result["body"] = self.body
+            result["headers"] = {"Content-Type": "application/json"}
+        return result
+
+
+class BatchAPI(EntityAPI):
+    """A class to send independent requests to the Microsoft Graph API packed in JSON $batch envelopes
+    (up to 20 requests per round trip)"""
+
+    def _get_entity_path(self) -> str:
+        return "$batch"
+
+    def _send_envelope(self, batch_requests: dict[str, BatchRequest]) -> dict[str, dict]:
+        """Sends a $batch envelope with the specified requests (indexed by request id)
+        Returns the sub-responses indexed by request id"""
+        envelope = {
+            "requests": [
+                request.to_dict(request_id, self.transport.base_url) for request_id, request in batch_requests.items()
+            ]
+        }
+        self._logger.debug(f"POST {self.entity_url} ({len(batch_requests)} requests)")
+        response = APIResponse(
+            self.transport.post(self.entity_url, headers=self.request_headers, json=envelope),
+            expected_status_code=200,
+        )
+        response.assert_success("Error sending $batch request")
+        return {sub_response["id"]: sub_response for sub_response in response.json()["responses"]}
+
+    @staticmethod
+    def _is_retryable(request: BatchRequest, sub_response: dict) -> bool:
+        """Checks if a failed sub-request can be sent again"""
+        status_code = sub_response["status"]
+        if _is_throttled(status_code, sub_response.get("headers") or {}):
+            return True
+        return RetryPolicy.is_retryable_status(request.method, status_code)
+
+    def _get_cached_sub_response(self, request: BatchRequest) -> dict | None:
+        """Returns the sub-response of a GET request from the response cache of the transport, if any"""
+        if self.transport.response_cache is None or request.method != "GET":
+            return None
+        cached_response = self.transport.response_cache.get(
+            request.get_absolute_url(self.transport.base_url), self.request_headers[_AUTHORIZATION_HEADER]
+        )
+        if cached_response is None:
+            return None
+        return {"status": cached_response.status_code, "body": json.loads(cached_response.body)}
+
+    def _cache_sub_response(self, request: BatchRequest, sub_response: dict):
+        """Stores the sub-response of a successful GET request in the response cache of the transport, if any,
+        or drops the cached responses of the entity type written by any other request"""
+        if self.transport.response_cache is None:
+            return
+        if request.method != "GET":
+            self.transport.response_cache.invalidate(request.get_absolute_url(self.transport.base_url))
+            return
+        if sub_response["status"] != _HTTP_OK:
+            return
+        self.transport.response_cache.put(
+            request.get_absolute_url(self.transport.base_url),
+            self.request_headers[_AUTHORIZATION_HEADER],
+            sub_response["status"],
+            {_CONTENT_TYPE_HEADER: "application/json"},
+            json.dumps(sub_response.get("body")),
+        )
+
+    def execute(self, batch_requests: list[BatchRequest]) -> list[APIResponse]:
+        """Sends the requests in $batch envelopes of up to 20 requests and returns one APIResponse per request,
+        in the same order as the requests.
+        GET requests are answered from the response cache of the transport, if any and the response is fresh.
+        Sub-requests that were throttled or failed with a transient error are retried (and only those)
+        If jobs is greater than 1, the envelopes are sent concurrently by a pool of jobs threads"""
+        sub_responses: dict[str, dict] = {}
+        pending: list[str] = []
+        for index, request in enumerate(batch_requests):
+            cached_sub_response = self._get_cached_sub_response(request)
+            if cached_sub_response is not None:
+                sub_responses[str(index)] = cached_sub_response
+            else:
+                pending.append(str(index))
+        sent = pending
+        retries = 0
+        while pending:
+            envelopes = [
+                {
+                    request_id: batch_requests[int(request_id)]
+                    for request_id in pending[start : start + _BATCH_MAX_REQUESTS]
+                }
+                for start in range(0, len(pending), _BATCH_MAX_REQUESTS)
+            ]
+            for envelope_responses in map_in_order(self._send_envelope, envelopes, self.jobs):
+                sub_responses.update(envelope_responses)
+
+            retryable = [
+                request_id
+                for request_id in pending
+                if self._is_retryable(batch_requests[int(request_id)], sub_responses[request_id])
+            ]
+            if not retryable or retries >= self.transport.retry_policy.max_retries:
+                break
+
+            self._logger.warning(f"{len(retryable)} batched requests failed. Retrying...")
+            throttled_headers = [
+                sub_responses[request_id].get("headers") or {}
+                for request_id in retryable
+                if _is_throttled(sub_responses[request_id]["status"], sub_responses[request_id].get("headers") or {})
+            ]
+            if throttled_headers:
+                # the shared rate limiter holds the next envelopes for the longest Retry-After
+                self.transport.rate_limiter.on_throttled(
+                    max(_get_retry_after(headers) for headers in throttled_headers)
+                )
+            else:
+                if any(
+                    sub_responses[request_id]["status"] == _SERVICE_UNAVAILABLE_STATUS_CODE for request_id in retryable
+                ):
+                    # an overloaded API, so the shared rate is lowered too (without a Retry-After to wait for)
+                    self.transport.rate_limiter.on_throttled()
+                time.sleep(self.transport.retry_policy.get_backoff(retries))
+            retries += 1
+            pending = retryable
+
+        for request_id in sent:
+            self._cache_sub_response(batch_requests[int(request_id)], sub_responses[request_id])
+
+        return [
+            APIResponse.from_values(
+                sub_responses[str(index)]["status"],
+                sub_responses[str(index)].get("body"),
+                expected_status_code=request.expected_status_code,
+            )
+            for index, request in enumerate(batch_requests)
+        ]
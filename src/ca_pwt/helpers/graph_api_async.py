@@ -0,0 +1,466 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+from ca_pwt.helpers.utils import assert_condition
+from ca_pwt.helpers.graph_api import (
+    APIResponse,
+    DuplicateActionEnum,
+    EntityAPI,
+    _add_select,
+    _build_collection_url,
+    _GRAPH_API_BASE_URL,
+    _ODATA_NEXT_LINK,
+)
+from ca_pwt.helpers.rate_limiter import RateLimiter, get_default_rate_limiter
+from ca_pwt.helpers.retry import CircuitBreaker, RetryPolicy, _IDEMPOTENT_METHODS
+from ca_pwt.helpers.metrics import RequestMetrics, RequestRecord, get_default_metrics
+from ca_pwt.helpers.response_cache import ResponseCache
+from ca_pwt.helpers.transport import (
+    get_default_transport,
+    _get_coalescing_key,
+    _get_retry_after,
+    _is_throttled,
+    _CONTENT_TYPE_HEADER,
+    _HTTP_OK,
+    _SERVICE_UNAVAILABLE_STATUS_CODE,
+    _DEFAULT_CONNECT_TIMEOUT,
+    _DEFAULT_READ_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+_DEFAULT_MAX_CONCURRENCY = 16
+
+_T = TypeVar("_T")
+
+
+class AsyncGraphTransport:
+    """A class to represent the asyncio transport used to send requests to the Microsoft Graph API
+    It holds a pooled httpx.AsyncClient and a semaphore that bounds the number of in-flight requests
+    shared by all the AsyncEntityAPI objects using it"""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        pool_size: int | None = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        connect_timeout: float = _DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = _DEFAULT_READ_TIMEOUT,
+        coalesce_gets: bool = True,
+        response_cache: ResponseCache | None = None,
+        metrics: RequestMetrics | None = None,
+        base_url: str = _GRAPH_API_BASE_URL,
+        http2: bool = False,
+    ):
+        """Creates an AsyncGraphTransport object (needs the optional httpx dependency: pip install ca-pwt[async])
+        - max_concurrency: the maximum number of requests in flight at the same time
+        - pool_size: the maximum number of connections kept alive in the pool (default: max_concurrency)
+        - rate_limiter: the rate limiter that paces the requests (default: the one shared by the whole process)
+        - retry_policy, circuit_breaker, connect_timeout, read_timeout, coalesce_gets, response_cache, metrics,
+          base_url: see GraphTransport
+        - http2: if True, the requests are multiplexed over HTTP/2 connections (needs: pip install ca-pwt[http2])
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            msg = "The async API needs the httpx package. Install it with: pip install ca-pwt[async]"
+            raise ImportError(msg) from e
+
+        assert_condition(max_concurrency > 0, "max_concurrency must be greater than 0")
+        assert_condition(connect_timeout > 0 and read_timeout > 0, "timeouts must be greater than 0")
+        pool_size = pool_size or max_concurrency
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_default_rate_limiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.coalesce_gets = coalesce_gets
+        self.response_cache = response_cache
+        self.metrics = metrics if metrics is not None else get_default_metrics()
+        self.base_url = base_url.rstrip("/")
+        self._in_flight: dict[tuple[str, str], asyncio.Future] = {}
+        self.http2 = http2
+        try:
+            self.client: httpx.AsyncClient = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                http2=http2,
+            )
+        except ImportError as e:
+            msg = "HTTP/2 needs the h2 package. Install it with: pip install ca-pwt[http2]"
+            raise ImportError(msg) from e
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self._logger.debug(f"Created async transport with a maximum of {max_concurrency} concurrent requests")
+
+    def _get_timeout(self, deadline_at: float) -> "httpx.Timeout":
+        """Returns the timeouts of the next attempt, so a stalled read cannot outlive the deadline"""
+        import httpx
+
+        remaining = max(deadline_at - time.monotonic(), 0.001)
+        return httpx.Timeout(min(self.read_timeout, remaining), connect=min(self.connect_timeout, remaining))
+
+    async def request(self, method: str, url: str, *, idempotent: bool | None = None, **kwargs) -> "httpx.Response":
+        """Sends a request (see _send_with_retries). GET requests are answered from the response cache, if any and
+        the response is fresh, and the other requests drop the cached responses of the entity type they write.
+        If coalesce_gets is True, a GET request identical to one already in flight is not sent: the caller
+        awaits the request in flight and gets the same response
+        - idempotent: overrides the idempotency of the method (see GraphTransport.request)
+        """
+        import httpx
+
+        key = _get_coalescing_key(method, url, kwargs)
+        if key is None:
+            try:
+                return await self._send(method, url, idempotent=idempotent, **kwargs)
+            finally:
+                # even a failed write may have reached the API
+                if self.response_cache is not None and method.upper() != "GET":
+                    self.response_cache.invalidate(url)
+
+        if self.response_cache is not None:
+            cached_response = self.response_cache.get(*key)
+            if cached_response is not None:
+                self.metrics.record_cache_hit(method, url)
+                return httpx.Response(
+                    cached_response.status_code,
+                    headers=cached_response.headers,
+                    content=cached_response.body.encode(),
+                    request=httpx.Request(method, url),
+                )
+
+        if not self.coalesce_gets:
+            return await self._send_and_cache(key, method, url, **kwargs)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._send_and_cache(key, method, url, **kwargs))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # a cancelled caller must not cancel the request shared with the other callers
+        return await asyncio.shield(future)
+
+    async def _send_and_cache(self, key: tuple[str, str], method: str, url: str, **kwargs) -> "httpx.Response":
+        """Sends a GET request and stores its response in the response cache (if any), if successful"""
+        response = await self._send(method, url, **kwargs)
+        if self.response_cache is not None and response.status_code == _HTTP_OK:
+            headers = {_CONTENT_TYPE_HEADER: response.headers.get(_CONTENT_TYPE_HEADER, "application/json")}
+            self.response_cache.put(*key, response.status_code, headers, response.text)
+        return response
+
+    async def _send(self, method: str, url: str, *, idempotent: bool | None = None, **kwargs) -> "httpx.Response":
+        """Sends a request (see _send_with_retries), recording its metrics"""
+        record = RequestRecord(method, url)
+        try:
+            response = await self._send_with_retries(record, method, url, idempotent=idempotent, **kwargs)
+        except Exception:
+            self.metrics.record(record, None)
+            raise
+        self.metrics.record(
+            record,
+            response.status_code,
+            request_bytes=len(response.request.content),
+            response_bytes=len(response.content),
+        )
+        return response
+
+    async def _send_with_retries(
+        self, record: RequestRecord, method: str, url: str, *, idempotent: bool | None = None, **kwargs
+    ) -> "httpx.Response":
+        """Sends a request paced by the rate limiter, waiting for a free slot if max_concurrency requests are
+        already in flight. Failed requests are retried like in GraphTransport.request.
+        The concurrency slot is not held while waiting, so other requests can proceed"""
+        import httpx
+
+        if idempotent is None:
+            idempotent = method.upper() in _IDEMPOTENT_METHODS
+        deadline_at = record.started_at + self.retry_policy.deadline
+        while True:
+            self.circuit_breaker.before_request()
+            wait = self.rate_limiter.reserve()
+            record.throttle_wait += max(wait, 0.0)
+            await asyncio.sleep(wait)
+            try:
+                async with self.semaphore:
+                    response = await self.client.request(method, url, timeout=self._get_timeout(deadline_at), **kwargs)
+            except httpx.TransportError as e:
+                self.circuit_breaker.on_failure()
+                backoff = self.retry_policy.get_backoff(record.retries)
+                retryable = idempotent or isinstance(e, httpx.ConnectTimeout)
+                if not retryable or not self.retry_policy.can_retry(record.retries, deadline_at, backoff):
+                    raise
+                self._logger.warning(f"{method} {url} failed: {e!r}. Retrying in {backoff:.2f} seconds...")
+                record.backoff_wait += backoff
+                await asyncio.sleep(backoff)
+                record.retries += 1
+                continue
+
+            if _is_throttled(response.status_code, response.headers):
+                retry_after = _get_retry_after(response.headers)
+                record.throttled += 1
+                self.rate_limiter.on_throttled(retry_after)
+                if not self.retry_policy.can_retry(record.retries, deadline_at, retry_after):
+                    return response
+                self._logger.warning(
+                    f"Throttling error: {response.status_code}  {response.text}. Retrying in {retry_after} seconds..."
+                )
+                record.retries += 1
+                continue
+
+            if self.retry_policy.is_retryable_status(method, response.status_code, idempotent=idempotent):
+                self.circuit_breaker.on_failure()
+                if response.status_code == _SERVICE_UNAVAILABLE_STATUS_CODE:
+                    # an overloaded API, so the shared rate is lowered too (without a Retry-After to wait for)
+                    self.rate_limiter.on_throttled()
+                backoff = self.retry_policy.get_backoff(record.retries)
+                if not self.retry_policy.can_retry(record.retries, deadline_at, backoff):
+                    return response
+                self._logger.warning(
+                    f"Transient error: {response.status_code}  {response.text}. Retrying in {backoff:.2f} seconds..."
+                )
+                record.backoff_wait += backoff
+                await asyncio.sleep(backoff)
+                record.retries += 1
+                continue
+
+            self.circuit_breaker.on_success()
+            self.rate_limiter.on_success()
+            return response
+
+    async def aclose(self):
+        """Closes the client and all the pooled connections"""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncGraphTransport":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+class AsyncEntityAPI(ABC):
+    """An abstract class to represent an entity in the Microsoft Graph API, with asyncio methods.
+    It mirrors EntityAPI, but requests are sent through an AsyncGraphTransport, so many of them can be awaited
+    concurrently (e.g. with asyncio.gather) without spawning threads"""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self, access_token: str, *, transport: AsyncGraphTransport):
+        """Creates an AsyncEntityAPI object
+        - access_token: the access token to use for requests to the API
+        - transport: the async transport used to send requests
+        """
+        self.entity_url = f"{transport.base_url}/{self._get_entity_path()}"
+        self.access_token = access_token
+        self.transport = transport
+        self.request_headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json",
+        }
+
+    @abstractmethod
+    def _get_entity_path(self) -> str:
+        """Returns the path to the entity in the Microsoft Graph API"""
+        pass
+
+    async def _request(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """Sends a request to the API through the transport"""
+        return await self.transport.request(method, url, headers=self.request_headers, **kwargs)
+
+    async def _request_get(self, url: str) -> APIResponse:
+        """Sends a GET request to the API"""
+        self._logger.debug(f"GET {url}")
+        return APIResponse(await self._request("GET", url), expected_status_code=200)
+
+    async def _request_post(self, url: str, entity: dict) -> APIResponse:
+        """Sends a POST request to the API"""
+        self._logger.debug(f"POST {url}")
+        return APIResponse(await self._request("POST", url, json=entity), expected_status_code=201)
+
+    async def _request_delete(self, url: str) -> APIResponse:
+        """Sends a DELETE request to the API"""
+        self._logger.debug(f"DELETE {url}")
+        return APIResponse(await self._request("DELETE", url), expected_status_code=204)
+
+    async def _request_patch(self, url: str, entity: dict) -> APIResponse:
+        """Sends a PATCH request to the API"""
+        self._logger.debug(f"PATCH {url}")
+        return APIResponse(await self._request("PATCH", url, json=entity), expected_status_code=204)
+
+    def _get_collection_url(
+        self,
+        odata_filter: str | None = None,
+        odata_top: int | None = None,
+        select: list[str] | None = None,
+    ) -> str:
+        """Returns the url of the entity collection with the specified query parameters"""
+        return _build_collection_url(self.entity_url, odata_filter=odata_filter, odata_top=odata_top, select=select)
+
+    def _get_entity_url(self, entity_id: str) -> str:
+        """Returns the url of the entity with the specified ID"""
+        return f"{self.entity_url}/{entity_id}"
+
+    async def _iter_pages(self, url: str) -> AsyncIterator[APIResponse]:
+        """Async counterpart of EntityAPI._iter_pages"""
+        next_url: str | None = url
+        while next_url:
+            response = await self._request_get(next_url)
+            yield response
+            if not response.success:
+                return
+            next_url = response.json().get(_ODATA_NEXT_LINK)
+
+    async def iter_all(
+        self,
+        odata_filter: str | None = None,
+        select: list[str] | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Iterates over all entities in the API, following @odata.nextLink until the last page
+        See EntityAPI.iter_all"""
+        url = self._get_collection_url(odata_filter=odata_filter, odata_top=page_size, select=select)
+        async for response in self._iter_pages(url):
+            response.assert_success(f"Error listing {self._get_entity_path()}")
+            for entity in response.json()["value"]:
+                yield entity
+
+    async def get_all(
+        self, odata_filter: str | None = None, odata_top: int | None = None, select: list[str] | None = None
+    ) -> APIResponse:
+        """Returns all entities in the API. See EntityAPI.get_all"""
+        url = self._get_collection_url(odata_filter=odata_filter, odata_top=odata_top, select=select)
+
+        if odata_top:
+            return await self._request_get(url)
+
+        entities: list[dict] = []
+        async for response in self._iter_pages(url):
+            if not response.success:
+                return response
+            entities.extend(response.json()["value"])
+        response.response = {"value": entities}
+        return response
+
+    async def get_by_id(self, entity_id: str, select: list[str] | None = None) -> APIResponse:
+        """Returns an entity by its ID"""
+        assert_condition(entity_id, "entity_id cannot be None")
+        return await self._request_get(_add_select(self._get_entity_url(entity_id), select))
+
+    async def get_by_display_name(self, display_name: str, select: list[str] | None = None) -> APIResponse:
+        """Gets the top entity found with the given display name"""
+        return await self.get_top_entity(f"displayName eq '{display_name}'", select=select)
+
+    async def get_top_entity(
+        self, odata_filter: str, *, use_top: bool = True, select: list[str] | None = None
+    ) -> APIResponse:
+        """Gets the top entity found with the given filter. See EntityAPI.get_top_entity"""
+        assert_condition(odata_filter, "odata_filter cannot be None")
+        response = await self.get_all(odata_filter=odata_filter, odata_top=1 if use_top else None, select=select)
+        return EntityAPI._to_top_entity_response(response)
+
+    async def create(self, entity: dict) -> APIResponse:
+        """Creates an entity"""
+        assert_condition(entity, "entity cannot be None")
+        return await self._request_post(self.entity_url, entity)
+
+    async def create_checking_duplicates(
+        self, entity: dict, odata_filter: str, duplicate_action: DuplicateActionEnum = DuplicateActionEnum.IGNORE
+    ) -> APIResponse:
+        """Creates an entity checking for duplicates first and taking the specified action if a duplicate is found
+        See EntityAPI.create_checking_duplicates"""
+        assert_condition(entity, "entity cannot be None")
+        assert_condition(odata_filter, "odata_filter cannot be None")
+
+        if duplicate_action != DuplicateActionEnum.DUPLICATE:
+            existing_entity = await self.get_top_entity(odata_filter)
+            if existing_entity.success:
+                if duplicate_action == DuplicateActionEnum.IGNORE:
+                    self._logger.warning(
+                        f"Entity {self._get_entity_path()} with filter {odata_filter} already exists. Skipping..."
+                    )
+                    return existing_entity
+                elif duplicate_action == DuplicateActionEnum.OVERWRITE:
+                    existing_entity_id = existing_entity.json()["id"]
+                    self._logger.warning(
+                        f"Overwriting entity {self._get_entity_path()} with id {existing_entity_id}..."
+                    )
+                    response = await self.update(existing_entity_id, entity)
+                    response.assert_success()
+                    response.response = {"id": existing_entity_id}
+                    return response
+                elif duplicate_action == DuplicateActionEnum.FAIL:
+                    msg = f"Entity {self._get_entity_path()} with filter {odata_filter} already exists."
+                    raise ValueError(msg)
+                else:
+                    msg = f"Invalid duplicate_action: {duplicate_action}"
+                    raise ValueError(msg)
+        return await self.create(entity)
+
+    async def delete(self, entity_id: str) -> APIResponse:
+        """Deletes an entity by its ID"""
+        assert_condition(entity_id, "entity_id cannot be None")
+        return await self._request_delete(self._get_entity_url(entity_id))
+
+    async def update(self, entity_id: str, entity: dict) -> APIResponse:
+        """Updates an entity by its ID"""
+        assert_condition(entity_id, "entity_id cannot be None")
+        assert_condition(entity, "entity cannot be None")
+        return await self._request_patch(self._get_entity_url(entity_id), entity)
+
+
+async def gather_by_key(
+    items: list[_T], key_func: Callable[[_T], Any], func: Callable[[_T], Awaitable[Any]]
+) -> list[Any]:
+    """Awaits func for all the items concurrently, except for items with the same key, which are awaited in order
+    (e.g. entities with the same display name, so duplicate checks see the previously created entity).
+    Results are returned in the same order as the items"""
+    results: list[Any] = [None] * len(items)
+    indexes_by_key: dict[Any, list[int]] = {}
+    for index, item in enumerate(items):
+        indexes_by_key.setdefault(key_func(item), []).append(index)
+
+    async def run_sequentially(indexes: list[int]):
+        for index in indexes:
+            results[index] = await func(items[index])
+
+    await asyncio.gather(*(run_sequentially(indexes) for indexes in indexes_by_key.values()))
+    return results
+
+
+def run_async(
+    coroutine_func: Callable[..., Awaitable[_T]],
+    *args: Any,
+    max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    **kwargs: Any,
+) -> _T:
+    """Synchronous facade for the async variants (e.g. import_policies_async), to be used by the CLI
+    or any other synchronous code. An AsyncGraphTransport is created for the duration of the call
+    and passed to the coroutine function as the transport keyword argument.
+    It uses the retry policy, circuit breaker, timeouts, response cache, metrics, base url and HTTP version of the
+    default (synchronous) transport"""
+    default_transport = get_default_transport()
+
+    async def run() -> _T:
+        async with AsyncGraphTransport(
+            max_concurrency=max_concurrency,
+            retry_policy=default_transport.retry_policy,
+            circuit_breaker=default_transport.circuit_breaker,
+            connect_timeout=default_transport.connect_timeout,
+            read_timeout=default_transport.read_timeout,
+            response_cache=default_transport.response_cache,
+            metrics=default_transport.metrics,
+            base_url=default_transport.base_url,
+            http2=default_transport.http2,
+        ) as transport:
+            return await coroutine_func(*args, transport=transport, **kwargs)
+
+    return asyncio.run(run())
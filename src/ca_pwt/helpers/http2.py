@@ -0,0 +1,88 @@
+import time
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import TYPE_CHECKING
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from ca_pwt.helpers.utils import assert_condition
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class Http2Adapter(BaseAdapter):
+    """A requests adapter that sends the requests over HTTP/2 with a pooled httpx.Client, so concurrent requests
+    (e.g. from the worker threads of --jobs) are multiplexed over a few connections instead of one connection per
+    request in flight. Responses and errors are converted to their requests equivalents, so the transport retries
+    and throttles exactly like over HTTP/1.1 (needs the optional dependencies: pip install ca-pwt[http2])"""
+
+    def __init__(self, pool_size: int, *, client: "httpx.Client | None" = None):
+        """Creates an Http2Adapter object
+        - pool_size: the maximum number of connections (each one carries many concurrent requests)
+        - client: the httpx client used to send the requests (default: a new HTTP/2 client)
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            msg = "HTTP/2 needs the httpx and h2 packages. Install them with: pip install ca-pwt[http2]"
+            raise ImportError(msg) from e
+
+        assert_condition(pool_size > 0, "pool_size must be greater than 0")
+        super().__init__()
+        if client is None:
+            try:
+                client = httpx.Client(
+                    http2=True, limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+                )
+            except ImportError as e:
+                msg = "HTTP/2 needs the h2 package. Install it with: pip install ca-pwt[http2]"
+                raise ImportError(msg) from e
+        self.client = client
+
+    def send(  # noqa: PLR0917
+        self,
+        request: PreparedRequest,
+        stream: bool = False,  # noqa: FBT001, FBT002, ARG002
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,  # noqa: FBT001, FBT002, ARG002
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,  # noqa: ARG002
+        proxies: Mapping[str, str] | None = None,  # noqa: ARG002
+    ) -> Response:
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            httpx_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        started_at = time.perf_counter()
+        try:
+            httpx_response = self.client.request(
+                str(request.method),
+                str(request.url),
+                content=body,
+                headers=dict(request.headers),
+                timeout=httpx_timeout,
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request) from e
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request) from e
+
+        response = Response()
+        response.status_code = httpx_response.status_code
+        response.reason = httpx_response.reason_phrase
+        response.headers.update(httpx_response.headers)
+        response._content = httpx_response.content
+        response.encoding = httpx_response.encoding
+        response.url = str(request.url)
+        response.request = request
+        response.elapsed = timedelta(seconds=time.perf_counter() - started_at)
+        return response
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,254 @@
+import copy
+import json
+import math
+import re
+import threading
+import time
+from typing import Any
+from urllib.parse import urlparse
+from ca_pwt.helpers.utils import assert_condition, is_guid
+
+# upper bounds (in seconds) of the buckets of the latency histograms
+_LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+_LATENCY_PERCENTILES = [50, 90, 95, 99]
+# the status of requests that failed without a response (e.g. connection errors)
+_ERROR_STATUS = "error"
+_METRICS_FORMATS = ["json", "prometheus"]
+_PROMETHEUS_PREFIX = "ca_pwt_graph"
+
+_KEY_PATTERN = re.compile(r"\(.*\)")
+# the path segments that are not followed by a key, unlike collections (e.g. identity/conditionalAccess/policies)
+_SINGLETONS = ["identity", "conditionalAccess", "me"]
+_ACTIONS = ["delta", "getByIds"]
+
+
+def _is_action(segment: str) -> bool:
+    """Checks if the path segment is an action, a function, a cast or a system segment (e.g. $ref) rather than a key"""
+    return segment in _ACTIONS or segment.startswith(("$", "microsoft.graph.")) or "(" in segment
+
+
+def _get_endpoint(url: str) -> str:
+    """Returns the endpoint of a Graph API url: its path without the version, with ids and keys replaced by
+    placeholders (e.g. groups/{id}/members/$ref for https://graph.microsoft.com/v1.0/groups/<id>/members/$ref).
+    Any segment that follows a collection is a key (e.g. the UPN of users/<upn>), so no personal data ends up in
+    the endpoints and their number stays bounded"""
+    segments = [segment for segment in urlparse(url).path.split("/") if segment]
+    endpoint: list[str] = []
+    follows_collection = False
+    # skip the version (v1.0 or beta)
+    for segment in segments[1:]:
+        if is_guid(segment) or (follows_collection and not _is_action(segment)):
+            endpoint.append("{id}")
+            follows_collection = False
+        else:
+            endpoint.append(_KEY_PATTERN.sub("(...)", segment))
+            follows_collection = segment not in _SINGLETONS and not _is_action(segment)
+    return "/".join(endpoint)
+
+
+def _get_percentile(sorted_values: list[float], percentile: float) -> float:
+    """Returns the percentile of the sorted values (nearest rank)"""
+    rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class RequestRecord:
+    """A class to represent the measurements of a single request, including all its retries"""
+
+    def __init__(self, method: str, url: str):
+        self.method = method.upper()
+        self.url = url
+        self.started_at = time.monotonic()
+        self.retries = 0
+        self.throttled = 0
+        self.throttle_wait = 0.0
+        self.backoff_wait = 0.0
+
+
+class _EndpointMetrics:
+    """The metrics of the requests sent to an endpoint with a method"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.throttled = 0
+        self.throttle_wait = 0.0
+        self.backoff_wait = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_codes: dict[str, int] = {}
+        self.latencies: list[float] = []
+
+
+class RequestMetrics:
+    """Collects the metrics of the requests sent to the Microsoft Graph API, by endpoint and method:
+    number of requests, latency (including retries and waits), retries, time spent waiting for the rate limiter
+    (including the Retry-After pauses of throttled requests) and backing off, status codes, and bytes sent
+    and received.
+    A single object is meant to be shared by all the transports of the process. It is thread-safe"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], _EndpointMetrics] = {}
+
+    def _get_endpoint_metrics(self, method: str, url: str) -> _EndpointMetrics:
+        """Returns the metrics of the endpoint of the url (must be called with the lock held)"""
+        key = (_get_endpoint(url), method.upper())
+        endpoint_metrics = self._endpoints.get(key)
+        if endpoint_metrics is None:
+            endpoint_metrics = self._endpoints[key] = _EndpointMetrics()
+        return endpoint_metrics
+
+    def record(
+        self,
+        record: RequestRecord,
+        status_code: int | None,
+        *,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ):
+        """Records a completed request
+        - status_code: the status code of the final response, or None if the request failed without a response
+        - request_bytes, response_bytes: the size of the bodies sent and received
+        """
+        latency = time.monotonic() - record.started_at
+        status = str(status_code) if status_code is not None else _ERROR_STATUS
+        with self._lock:
+            endpoint_metrics = self._get_endpoint_metrics(record.method, record.url)
+            endpoint_metrics.count += 1
+            endpoint_metrics.retries += record.retries
+            endpoint_metrics.throttled += record.throttled
+            endpoint_metrics.throttle_wait += record.throttle_wait
+            endpoint_metrics.backoff_wait += record.backoff_wait
+            endpoint_metrics.request_bytes += request_bytes
+            endpoint_metrics.response_bytes += response_bytes
+            endpoint_metrics.status_codes[status] = endpoint_metrics.status_codes.get(status, 0) + 1
+            endpoint_metrics.latencies.append(latency)
+
+    def record_cache_hit(self, method: str, url: str):
+        """Records a request answered from the response cache, without calling the API"""
+        with self._lock:
+            self._get_endpoint_metrics(method, url).cache_hits += 1
+
+    def reset(self):
+        """Discards all the metrics collected so far"""
+        with self._lock:
+            self._endpoints = {}
+
+    def _snapshot(self) -> list[tuple[tuple[str, str], _EndpointMetrics]]:
+        """Returns a copy of the metrics of each endpoint and method, sorted by endpoint"""
+        with self._lock:
+            snapshot = []
+            for key, endpoint_metrics in sorted(self._endpoints.items()):
+                endpoint_metrics_copy = copy.copy(endpoint_metrics)
+                endpoint_metrics_copy.status_codes = dict(sorted(endpoint_metrics.status_codes.items()))
+                endpoint_metrics_copy.latencies = sorted(endpoint_metrics.latencies)
+                snapshot.append((key, endpoint_metrics_copy))
+            return snapshot
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the metrics as a dictionary, with an entry per endpoint and method"""
+        endpoints = []
+        for (endpoint, method), endpoint_metrics in self._snapshot():
+            latencies = endpoint_metrics.latencies
+            latency: dict[str, float] = {}
+            if latencies:
+                latency = {
+                    "min": latencies[0],
+                    "mean": sum(latencies) / len(latencies),
+                    **{f"p{p}": _get_percentile(latencies, p) for p in _LATENCY_PERCENTILES},
+                    "max": latencies[-1],
+                }
+            endpoints.append(
+                {
+                    "endpoint": endpoint,
+                    "method": method,
+                    "count": endpoint_metrics.count,
+                    "cache_hits": endpoint_metrics.cache_hits,
+                    "retries": endpoint_metrics.retries,
+                    "throttled": endpoint_metrics.throttled,
+                    "throttle_wait_seconds": endpoint_metrics.throttle_wait,
+                    "backoff_wait_seconds": endpoint_metrics.backoff_wait,
+                    "request_bytes": endpoint_metrics.request_bytes,
+                    "response_bytes": endpoint_metrics.response_bytes,
+                    "status_codes": endpoint_metrics.status_codes,
+                    "latency_seconds": latency,
+                }
+            )
+        return {"endpoints": endpoints}
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format"""
+        counters = [
+            ("requests_total", "count", "The number of requests sent"),
+            ("cache_hits_total", "cache_hits", "The number of requests answered from the response cache"),
+            ("retries_total", "retries", "The number of retries"),
+            ("throttled_total", "throttled", "The number of throttled responses"),
+            ("throttle_wait_seconds_total", "throttle_wait", "The time spent waiting for the rate limiter"),
+            ("backoff_wait_seconds_total", "backoff_wait", "The time spent backing off before retries"),
+            ("request_bytes_total", "request_bytes", "The number of bytes sent"),
+            ("response_bytes_total", "response_bytes", "The number of bytes received"),
+        ]
+        snapshot = self._snapshot()
+        lines: list[str] = []
+        for name, attribute, description in counters:
+            lines.append(f"# HELP {_PROMETHEUS_PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {_PROMETHEUS_PREFIX}_{name} counter")
+            for (endpoint, method), endpoint_metrics in snapshot:
+                value = getattr(endpoint_metrics, attribute)
+                lines.append(f'{_PROMETHEUS_PREFIX}_{name}{{endpoint="{endpoint}",method="{method}"}} {value}')
+
+        name = f"{_PROMETHEUS_PREFIX}_responses_total"
+        lines.append(f"# HELP {name} The number of responses by status code")
+        lines.append(f"# TYPE {name} counter")
+        for (endpoint, method), endpoint_metrics in snapshot:
+            labels = f'endpoint="{endpoint}",method="{method}"'
+            for status, count in endpoint_metrics.status_codes.items():
+                lines.append(f'{name}{{{labels},status="{status}"}} {count}')
+
+        name = f"{_PROMETHEUS_PREFIX}_request_duration_seconds"
+        lines.append(f"# HELP {name} The duration of the requests, including retries and waits")
+        lines.append(f"# TYPE {name} histogram")
+        for (endpoint, method), endpoint_metrics in snapshot:
+            labels = f'endpoint="{endpoint}",method="{method}"'
+            endpoint_latencies = endpoint_metrics.latencies
+            for bucket in _LATENCY_BUCKETS:
+                count = sum(1 for latency in endpoint_latencies if latency <= bucket)
+                lines.append(f'{name}_bucket{{{labels},le="{bucket}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {len(endpoint_latencies)}')
+            lines.append(f"{name}_sum{{{labels}}} {sum(endpoint_latencies)}")
+            lines.append(f"{name}_count{{{labels}}} {len(endpoint_latencies)}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, file_path: str, metrics_format: str = "json"):
+        """Writes the metrics to a file, as JSON or in the Prometheus text format"""
+        assert_condition(metrics_format in _METRICS_FORMATS, f"metrics_format must be in {_METRICS_FORMATS}")
+        with open(file_path, "w") as f:
+            if metrics_format == "json":
+                json.dump(self.to_dict(), f, indent=4)
+            else:
+                f.write(self.to_prometheus())
+
+
+_default_metrics: RequestMetrics | None = None
+_default_metrics_lock = threading.Lock()
+
+
+def get_default_metrics() -> RequestMetrics:
+    """Returns the metrics shared by all the transports in this process, creating them on first use"""
+    global _default_metrics  # noqa: PLW0603
+    with _default_metrics_lock:
+        if _default_metrics is None:
+            _default_metrics = RequestMetrics()
+        return _default_metrics
+
+
+def set_default_metrics(metrics: RequestMetrics | None) -> RequestMetrics | None:
+    """Replaces the metrics shared by all the transports in this process.
+    Returns the previous metrics (if any)"""
+    global _default_metrics  # noqa: PLW0603
+    with _default_metrics_lock:
+        previous = _default_metrics
+        _default_metrics = metrics
+        return previous
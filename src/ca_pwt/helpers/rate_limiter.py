@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+from ca_pwt.helpers.utils import assert_condition
+
+_DEFAULT_RATE = 20.0
+_DEFAULT_MIN_RATE = 1.0
+_DEFAULT_MAX_RATE = 100.0
+_DEFAULT_BURST = 20
+# additive increase: the rate grows by this number of requests per second...
+_DEFAULT_INCREASE_STEP = 1.0
+# ...after this number of consecutive successful requests
+_DEFAULT_INCREASE_AFTER = 20
+# multiplicative decrease: the rate is multiplied by this factor when the API throttles a request
+_DEFAULT_DECREASE_FACTOR = 0.5
+
+
+class RateLimiter:
+    """A token bucket that paces the requests sent to the Microsoft Graph API before the API throttles them.
+    The rate is adapted with AIMD (additive increase, multiplicative decrease): it is cut when a request is
+    throttled (429/503) and slowly raised again after sustained success.
+    A single object is meant to be shared by all the transports, EntityAPI objects and threads of the process,
+    so they all consume the same budget instead of retrying independently. It is thread-safe, and the
+    non-blocking reserve method can also be used from asyncio code"""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        rate: float = _DEFAULT_RATE,
+        *,
+        min_rate: float = _DEFAULT_MIN_RATE,
+        max_rate: float = _DEFAULT_MAX_RATE,
+        burst: int = _DEFAULT_BURST,
+        increase_step: float = _DEFAULT_INCREASE_STEP,
+        increase_after: int = _DEFAULT_INCREASE_AFTER,
+        decrease_factor: float = _DEFAULT_DECREASE_FACTOR,
+    ):
+        """Creates a RateLimiter object
+        - rate: the initial number of requests per second
+        - min_rate, max_rate: the bounds of the adapted rate
+        - burst: the maximum number of requests that can be sent at once after an idle period
+        - increase_step: the number of requests per second added to the rate after increase_after successes
+        - decrease_factor: the factor applied to the rate when a request is throttled
+        """
+        assert_condition(0 < min_rate <= max_rate, "min_rate must be greater than 0 and lower than max_rate")
+        assert_condition(burst > 0, "burst must be greater than 0")
+        assert_condition(0 < decrease_factor < 1, "decrease_factor must be between 0 and 1")
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.burst = burst
+        self.increase_step = increase_step
+        self.increase_after = increase_after
+        self.decrease_factor = decrease_factor
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Adds the tokens earned since the last update (must be called with the lock held)"""
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Reserves a token for a request and returns the number of seconds to wait before sending it.
+        It does not block, so it can be used both by threads (see acquire) and by asyncio tasks"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # tokens can go negative: each reservation queues behind the previous ones
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> float:
+        """Blocks until a request can be sent. Returns the number of seconds waited"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+    def on_success(self):
+        """Records a successful request, raising the rate after sustained success"""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.increase_after:
+                self._successes = 0
+                if self.rate < self.max_rate:
+                    self._refill(time.monotonic())
+                    self.rate = min(self.max_rate, self.rate + self.increase_step)
+                    self._logger.debug(f"Raising the request rate to {self.rate:.2f} requests/s")
+
+    def on_throttled(self, retry_after: float | None = None):
+        """Records a throttled request: the rate is cut and, if the API asked to wait (Retry-After),
+        no token is handed out until then"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._successes = 0
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            # drop any saved burst: it is what got us throttled
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            self._logger.warning(f"Request throttled. Lowering the request rate to {self.rate:.2f} requests/s")
+
+
+_default_rate_limiter: RateLimiter | None = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_default_rate_limiter() -> RateLimiter:
+    """Returns the rate limiter shared by all the transports in this process, creating it on first use"""
+    global _default_rate_limiter  # noqa: PLW0603
+    with _default_rate_limiter_lock:
+        if _default_rate_limiter is None:
+            _default_rate_limiter = RateLimiter()
+        return _default_rate_limiter
+
+
+def set_default_rate_limiter(rate_limiter: RateLimiter | None) -> RateLimiter | None:
+    """Replaces the rate limiter shared by all the transports in this process.
+    Returns the previous rate limiter (if any)"""
+    global _default_rate_limiter  # noqa: PLW0603
+    with _default_rate_limiter_lock:
+        previous = _default_rate_limiter
+        _default_rate_limiter = rate_limiter
+        return previous
@@ -0,0 +1,218 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+from urllib.parse import urlparse
+from ca_pwt.helpers.utils import assert_condition
+
+_DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+# seconds a cached response is fresh, by entity type (the first segment of the url path)
+_DEFAULT_TTL = 3600.0
+_DEFAULT_TTLS = {
+    # built-in objects that almost never change
+    "directoryRoleTemplates": 7 * 24 * 3600.0,
+    "directoryRoles": 24 * 3600.0,
+    "servicePrincipals": 24 * 3600.0,
+}
+# when the cache is over its size, the least recently used entries are evicted down to this fraction of the size
+_EVICTION_TARGET = 0.9
+
+_CACHE_FILE_EXTENSION = ".json"
+
+
+def _get_tenant(authorization: str) -> str:
+    """Returns the tenant of the access token of the Authorization header (the tid claim of the JWT),
+    so cached responses can be shared across runs (and tokens) of the same tenant.
+    Tokens that are not JWTs are hashed, so their responses are only shared with the same token"""
+    token = authorization.removeprefix("Bearer ")
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return str(claims["tid"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _get_entity_type(url: str) -> str:
+    """Returns the entity type of a Graph API url (e.g. groups for https://graph.microsoft.com/v1.0/groups/<id>)"""
+    segments = [segment for segment in urlparse(url).path.split("/") if segment]
+    # skip the version (v1.0 or beta)
+    entity = segments[1] if len(segments) > 1 else ""
+    return entity.split("(")[0]
+
+
+def _is_cacheable(url: str) -> bool:
+    """Checks if the response of the url can be cached (delta queries are never cached, as they return
+    the changes since the previous query)"""
+    return not any(segment.startswith("delta") for segment in urlparse(url).path.split("/"))
+
+
+def _is_empty_collection(body: str) -> bool:
+    """Checks if the body is an empty collection (e.g. a $filter that found nothing), which is not cached
+    as the entity may be created right after the lookup"""
+    try:
+        content = json.loads(body)
+    except ValueError:
+        return False
+    return isinstance(content, dict) and content.get("value") == [] and "@odata.nextLink" not in content
+
+
+class CachedResponse:
+    """A class to represent a response read from the cache"""
+
+    def __init__(self, status_code: int, headers: dict[str, str], body: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+
+class ResponseCache:
+    """A disk-backed cache of the successful GET responses of the Microsoft Graph API, so repeated runs do not
+    look up the same directory objects again.
+    Responses are keyed by tenant and url (including the query, e.g. $select), each entity type has its own
+    time to live, and the least recently used responses are evicted when the cache grows over max_size bytes.
+    Empty collections are not cached, and writing an entity type drops all its cached responses (see invalidate).
+    It is thread-safe, and can be shared by several processes (files are replaced atomically)"""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        default_ttl: float = _DEFAULT_TTL,
+        ttls: dict[str, float] | None = None,
+        bypass: bool = False,
+    ):
+        """Creates a ResponseCache object
+        - directory: the directory where the responses are stored (created if it does not exist)
+        - max_size: the maximum size of the cache in bytes
+        - default_ttl: the number of seconds a response is fresh, for the entity types not in ttls
+        - ttls: the number of seconds a response is fresh, by entity type (default: built-in objects live longer)
+        - bypass: if True, cached responses are ignored (but fresh responses are still stored)
+        """
+        assert_condition(max_size > 0, "max_size must be greater than 0")
+        self.directory = directory
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = ttls if ttls is not None else dict(_DEFAULT_TTLS)
+        self.bypass = bypass
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._scan())
+
+    def _scan(self) -> list[os.DirEntry]:
+        """Returns the entries of the cache directory"""
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(_CACHE_FILE_EXTENSION)]
+
+    def _get_path(self, url: str, authorization: str) -> str:
+        """Returns the path of the file that stores the response of the url
+        (prefixed by the entity type, so all the responses of an entity type can be found without reading them)"""
+        key = hashlib.sha256(f"{_get_tenant(authorization)}|{url}".encode()).hexdigest()
+        return os.path.join(self.directory, f"{_get_entity_type(url)}-{key}{_CACHE_FILE_EXTENSION}")
+
+    def get_ttl(self, url: str) -> float:
+        """Returns the number of seconds the response of the url is fresh"""
+        return self.ttls.get(_get_entity_type(url), self.default_ttl)
+
+    def get(self, url: str, authorization: str) -> CachedResponse | None:
+        """Returns the cached response of the url, or None if it is not cached, expired or bypassed
+        - authorization: the Authorization header of the request, which identifies the tenant
+        """
+        if self.bypass or not _is_cacheable(url):
+            return None
+        path = self._get_path(url, authorization)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url or time.time() - entry["stored_at"] > self.get_ttl(url):
+            return None
+        try:
+            # mark the entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        self._logger.debug(f"Cache hit: {url}")
+        return CachedResponse(entry["status_code"], entry["headers"], entry["body"])
+
+    def put(self, url: str, authorization: str, status_code: int, headers: dict[str, str], body: str):
+        """Stores the response of the url, evicting the least recently used responses if needed"""
+        if not _is_cacheable(url) or _is_empty_collection(body):
+            return
+        path = self._get_path(url, authorization)
+        entry: dict[str, Any] = {
+            "url": url,
+            "stored_at": time.time(),
+            "status_code": status_code,
+            "headers": headers,
+            "body": body,
+        }
+        content = json.dumps(entry).encode()
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            try:
+                previous_size = os.path.getsize(path)
+            except OSError:
+                previous_size = 0
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+            self._size += len(content) - previous_size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self):
+        """Deletes the least recently used responses until the cache is below its eviction target
+        (must be called with the lock held)"""
+        entries = sorted(self._scan(), key=lambda entry: entry.stat().st_mtime)
+        self._size = sum(entry.stat().st_size for entry in entries)
+        target = self.max_size * _EVICTION_TARGET
+        evicted = 0
+        for entry in entries:
+            if self._size <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._size -= size
+            evicted += 1
+        self._logger.debug(f"Evicted {evicted} responses from the cache")
+
+    def invalidate(self, url: str):
+        """Deletes all the cached responses of the entity type of the url (of every tenant), as a write to an
+        entity (e.g. POST /groups) may change any lookup of its type (e.g. GET /groups?$filter=...)"""
+        prefix = f"{_get_entity_type(url)}-"
+        with self._lock:
+            invalidated = 0
+            for entry in self._scan():
+                if not entry.name.startswith(prefix):
+                    continue
+                try:
+                    size = entry.stat().st_size
+                    os.remove(entry.path)
+                except OSError:
+                    continue
+                self._size -= size
+                invalidated += 1
+        if invalidated:
+            self._logger.debug(f"Invalidated {invalidated} cached responses of {prefix[:-1]}")
+
+    def clear(self):
+        """Deletes all the cached responses"""
+        with self._lock:
+            for entry in self._scan():
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+            self._size = 0
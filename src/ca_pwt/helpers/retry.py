@@ -0,0 +1,134 @@
+import logging
+import random
+import threading
+import time
+from ca_pwt.helpers.utils import assert_condition
+
+_DEFAULT_MAX_RETRIES = 5
+_DEFAULT_BACKOFF_BASE = 0.5
+_DEFAULT_BACKOFF_MAX = 30.0
+# overall time budget of a request, including all its retries
+_DEFAULT_DEADLINE = 300.0
+
+_DEFAULT_FAILURE_THRESHOLD = 5
+_DEFAULT_RESET_TIMEOUT = 30.0
+
+# transient server errors, retried only for idempotent methods (a POST may have been applied before failing)
+_RETRYABLE_STATUS_CODES = [500, 502, 503, 504]
+_IDEMPOTENT_METHODS = ["GET", "PUT", "DELETE"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is not sent because the circuit breaker is open"""
+
+    pass
+
+
+class RetryPolicy:
+    """A class to represent how failed requests are retried: capped exponential backoff with full jitter,
+    bounded by a maximum number of retries and an overall deadline per request"""
+
+    def __init__(
+        self,
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        *,
+        backoff_base: float = _DEFAULT_BACKOFF_BASE,
+        backoff_max: float = _DEFAULT_BACKOFF_MAX,
+        deadline: float = _DEFAULT_DEADLINE,
+    ):
+        """Creates a RetryPolicy object
+        - max_retries: the maximum number of times a request is retried
+        - backoff_base: the upper bound (in seconds) of the first backoff, doubled on every retry
+        - backoff_max: the maximum backoff (in seconds)
+        - deadline: the maximum time (in seconds) spent on a request, including all its retries
+        """
+        assert_condition(max_retries >= 0, "max_retries cannot be negative")
+        assert_condition(backoff_base >= 0, "backoff_base cannot be negative")
+        assert_condition(deadline > 0, "deadline must be greater than 0")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+
+    def get_backoff(self, retries: int) -> float:
+        """Returns the number of seconds to wait before the next retry, after the specified number of retries.
+        Full jitter spreads the retries of concurrent requests instead of sending them again all at once"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**retries))  # noqa: S311
+
+    def can_retry(self, retries: int, deadline_at: float, wait: float = 0) -> bool:
+        """Checks if a request can be retried after waiting the specified number of seconds
+        - retries: the number of retries already done
+        - deadline_at: the time (as returned by time.monotonic) when the request must be given up
+        """
+        return retries < self.max_retries and time.monotonic() + wait < deadline_at
+
+    @staticmethod
+    def is_retryable_status(method: str, status_code: int, *, idempotent: bool | None = None) -> bool:
+        """Checks if a response with the specified status code is a transient error that can be retried
+        - idempotent: overrides the idempotency of the method (e.g. True for POST actions that only read)
+        """
+        if idempotent is None:
+            idempotent = method.upper() in _IDEMPOTENT_METHODS
+        return status_code in _RETRYABLE_STATUS_CODES and idempotent
+
+
+class CircuitBreaker:
+    """A circuit breaker that fails fast once the API is clearly down, instead of piling up retries.
+    After failure_threshold consecutive failures (connection errors or transient server errors) the circuit opens
+    and requests fail with CircuitOpenError. After reset_timeout seconds a single trial request is let through:
+    the circuit closes if it succeeds and opens again if it fails. The other requests are not held while the trial
+    request is in flight: they fail fast with CircuitOpenError, as if the circuit had opened again, for up to
+    another reset_timeout seconds (or until the trial request succeeds). It is thread-safe"""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self, failure_threshold: int = _DEFAULT_FAILURE_THRESHOLD, reset_timeout: float = _DEFAULT_RESET_TIMEOUT
+    ):
+        """Creates a CircuitBreaker object
+        - failure_threshold: the number of consecutive failures that opens the circuit
+        - reset_timeout: the number of seconds the circuit stays open before a trial request is let through
+        """
+        assert_condition(failure_threshold > 0, "failure_threshold must be greater than 0")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Checks if the circuit is open"""
+        return self._opened_at is not None
+
+    def before_request(self):
+        """Checks if a request can be sent, raising CircuitOpenError if the circuit is open"""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            now = time.monotonic()
+            remaining = self._opened_at + self.reset_timeout - now
+            if remaining > 0:
+                msg = f"The Graph API looks unavailable ({self._failures} consecutive failures). "
+                msg += f"Requests are suspended for {remaining:.0f} more seconds"
+                raise CircuitOpenError(msg)
+            # half-open: let this request through and restart the timeout, so the other requests keep failing fast
+            # (they are not held) until it succeeds (see on_success) or another reset_timeout seconds pass
+            self._opened_at = now
+
+    def on_success(self):
+        """Records a successful request, closing the circuit"""
+        with self._lock:
+            if self._opened_at is not None:
+                self._logger.info("The Graph API is available again")
+            self._failures = 0
+            self._opened_at = None
+
+    def on_failure(self):
+        """Records a failed request, opening the circuit after failure_threshold consecutive failures"""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    self._logger.error(f"{self._failures} consecutive failures. Suspending requests to the Graph API")
+                self._opened_at = time.monotonic()
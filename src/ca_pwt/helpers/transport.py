@@ -0,0 +1,290 @@
+import logging
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from collections.abc import Mapping
+from requests.models import Response
+from ca_pwt.helpers.utils import assert_condition
+from ca_pwt.helpers.rate_limiter import RateLimiter, get_default_rate_limiter
+from ca_pwt.helpers.retry import CircuitBreaker, RetryPolicy, _IDEMPOTENT_METHODS
+from ca_pwt.helpers.concurrency import SingleFlight
+from ca_pwt.helpers.http2 import Http2Adapter
+from ca_pwt.helpers.metrics import RequestMetrics, RequestRecord, get_default_metrics
+from ca_pwt.helpers.response_cache import CachedResponse, ResponseCache
+
+_GRAPH_API_BASE_URL = "https://graph.microsoft.com/v1.0"
+
+_DEFAULT_POOL_SIZE = 10
+
+# seconds to establish a connection, and to wait for data on an established connection
+_DEFAULT_CONNECT_TIMEOUT = 10.0
+_DEFAULT_READ_TIMEOUT = 60.0
+
+_THROTTLING_STATUS_CODE = 429
+_SERVICE_UNAVAILABLE_STATUS_CODE = 503
+_THROTTLING_RETRY_AFTER_HEADER = "Retry-After"
+_THROTTLING_RETRY_AFTER_DEFAULT = 10
+
+_AUTHORIZATION_HEADER = "Authorization"
+_CONTENT_TYPE_HEADER = "Content-Type"
+_HTTP_OK = 200
+
+
+def _get_retry_after(headers: Mapping[str, str]) -> float:
+    """Returns the number of seconds to wait before retrying a throttled request, from the response headers"""
+    retry_after_header = headers.get(_THROTTLING_RETRY_AFTER_HEADER)
+    if retry_after_header is not None:
+        try:
+            return float(retry_after_header)
+        except ValueError:
+            pass
+    return _THROTTLING_RETRY_AFTER_DEFAULT
+
+
+def _get_coalescing_key(method: str, url: str, kwargs: dict) -> tuple[str, str] | None:
+    """Returns the key that identifies identical requests (same url and token), or None if the request
+    must not be shared with other callers or cached (only plain GET requests are)"""
+    if method.upper() != "GET" or not set(kwargs) <= {"headers"}:
+        return None
+    headers = kwargs.get("headers") or {}
+    return url, headers.get(_AUTHORIZATION_HEADER, "")
+
+
+def _build_response(cached_response: CachedResponse, url: str) -> Response:
+    """Builds a requests Response from a cached response"""
+    response = Response()
+    response.status_code = cached_response.status_code
+    response.headers.update(cached_response.headers)
+    response._content = cached_response.body.encode()
+    response.encoding = "utf-8"
+    response.url = url
+    return response
+
+
+def _is_throttled(status_code: int, headers: Mapping[str, str]) -> bool:
+    """Checks if the API throttled a request: a 429, or a 503 with a Retry-After header"""
+    return status_code == _THROTTLING_STATUS_CODE or (
+        status_code == _SERVICE_UNAVAILABLE_STATUS_CODE and _THROTTLING_RETRY_AFTER_HEADER in headers
+    )
+
+
+class GraphTransport:
+    """A class to represent the HTTP transport used to send requests to the Microsoft Graph API
+    It holds a pooled requests.Session, so connections are kept alive and reused between requests
+    instead of paying a new TCP+TLS handshake on every call"""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        pool_size: int = _DEFAULT_POOL_SIZE,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        connect_timeout: float = _DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = _DEFAULT_READ_TIMEOUT,
+        coalesce_gets: bool = True,
+        response_cache: ResponseCache | None = None,
+        metrics: RequestMetrics | None = None,
+        base_url: str = _GRAPH_API_BASE_URL,
+        http2: bool = False,
+    ):
+        """Creates a GraphTransport object
+        - pool_size: the maximum number of connections kept alive in the pool
+        - rate_limiter: the rate limiter that paces the requests (default: the one shared by the whole process)
+        - retry_policy: how failed requests are retried (default: RetryPolicy())
+        - circuit_breaker: the circuit breaker that fails fast when the API is down (default: CircuitBreaker())
+        - connect_timeout, read_timeout: the socket timeouts (in seconds) of each attempt
+        - coalesce_gets: if True, concurrent identical GET requests (same url and token) share a single request
+        - response_cache: the cache of the successful GET responses (default: no cache)
+        - metrics: where the metrics of the requests are recorded (default: the metrics shared by the whole process)
+        - base_url: the base url of the API, including the version (e.g. to point at a local mock server)
+        - http2: if True, https requests are multiplexed over HTTP/2 connections (see Http2Adapter)
+        """
+        assert_condition(pool_size > 0, "pool_size must be greater than 0")
+        assert_condition(connect_timeout > 0 and read_timeout > 0, "timeouts must be greater than 0")
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_default_rate_limiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.coalesce_gets = coalesce_gets
+        self.response_cache = response_cache
+        self.metrics = metrics if metrics is not None else get_default_metrics()
+        self.base_url = base_url.rstrip("/")
+        self._single_flight = SingleFlight()
+        self.http2 = http2
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if http2:
+            # HTTP/2 is only negotiated over TLS, so plain http (e.g. a local mock server) stays on HTTP/1.1
+            self.session.mount("https://", Http2Adapter(pool_size))
+        self._logger.debug(f"Created transport with a pool size of {pool_size} (HTTP/2: {http2})")
+
+    def _get_timeout(self, deadline_at: float) -> tuple[float, float]:
+        """Returns the socket timeouts of the next attempt, so a stalled read cannot outlive the deadline"""
+        remaining = max(deadline_at - time.monotonic(), 0.001)
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+
+    def request(self, method: str, url: str, *, idempotent: bool | None = None, **kwargs) -> Response:
+        """Sends a request using the pooled session (see _send_with_retries).
+        GET requests are answered from the response cache, if any and the response is fresh, and the other
+        requests drop the cached responses of the entity type they write.
+        If coalesce_gets is True, a GET request identical to one already in flight is not sent: the caller waits
+        for the request in flight and gets the same response (which must not be modified)
+        - idempotent: overrides the idempotency of the method, which decides if failed requests are retried
+        (e.g. True for POST actions that only read, like getByIds; default: only GET, PUT and DELETE are)
+        """
+        key = _get_coalescing_key(method, url, kwargs)
+        if key is None:
+            try:
+                return self._send(method, url, idempotent=idempotent, **kwargs)
+            finally:
+                # even a failed write may have reached the API
+                if self.response_cache is not None and method.upper() != "GET":
+                    self.response_cache.invalidate(url)
+
+        if self.response_cache is not None:
+            cached_response = self.response_cache.get(*key)
+            if cached_response is not None:
+                self.metrics.record_cache_hit(method, url)
+                return _build_response(cached_response, url)
+
+        if self.coalesce_gets:
+            return self._single_flight.do(key, lambda: self._send_and_cache(key, method, url, **kwargs))
+        return self._send_and_cache(key, method, url, **kwargs)
+
+    def _send_and_cache(self, key: tuple[str, str], method: str, url: str, **kwargs) -> Response:
+        """Sends a GET request and stores its response in the response cache (if any), if successful"""
+        response = self._send(method, url, **kwargs)
+        if self.response_cache is not None and response.status_code == _HTTP_OK:
+            headers = {_CONTENT_TYPE_HEADER: response.headers.get(_CONTENT_TYPE_HEADER, "application/json")}
+            self.response_cache.put(*key, response.status_code, headers, response.text)
+        return response
+
+    def _send(self, method: str, url: str, *, idempotent: bool | None = None, **kwargs) -> Response:
+        """Sends a request (see _send_with_retries), recording its metrics"""
+        record = RequestRecord(method, url)
+        try:
+            response = self._send_with_retries(record, method, url, idempotent=idempotent, **kwargs)
+        except Exception:
+            self.metrics.record(record, None)
+            raise
+        request_body = response.request.body if response.request is not None else None
+        self.metrics.record(
+            record,
+            response.status_code,
+            request_bytes=len(request_body or b""),
+            response_bytes=len(response.content),
+        )
+        return response
+
+    def _send_with_retries(
+        self, record: RequestRecord, method: str, url: str, *, idempotent: bool | None = None, **kwargs
+    ) -> Response:
+        """Sends a request using the pooled session, paced by the rate limiter.
+        Throttled requests, and idempotent requests that failed with a transient error (5xx, connection reset,
+        read timeout), are retried with exponential backoff until the retry policy gives up.
+        Connection timeouts are retried for all methods, as the request never reached the API.
+        Raises CircuitOpenError without sending the request if the API is down"""
+        if idempotent is None:
+            idempotent = method.upper() in _IDEMPOTENT_METHODS
+        deadline_at = record.started_at + self.retry_policy.deadline
+        while True:
+            self.circuit_breaker.before_request()
+            record.throttle_wait += self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, timeout=self._get_timeout(deadline_at), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.circuit_breaker.on_failure()
+                backoff = self.retry_policy.get_backoff(record.retries)
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if not retryable or not self.retry_policy.can_retry(record.retries, deadline_at, backoff):
+                    raise
+                self._logger.warning(f"{method} {url} failed: {e}. Retrying in {backoff:.2f} seconds...")
+                record.backoff_wait += backoff
+                time.sleep(backoff)
+                record.retries += 1
+                continue
+
+            if _is_throttled(response.status_code, response.headers):
+                # the API is up, so the circuit breaker is left alone
+                retry_after = _get_retry_after(response.headers)
+                record.throttled += 1
+                self.rate_limiter.on_throttled(retry_after)
+                if not self.retry_policy.can_retry(record.retries, deadline_at, retry_after):
+                    return response
+                self._logger.warning(
+                    f"Throttling error: {response.status_code}  {response.text}. Retrying in {retry_after} seconds..."
+                )
+                record.retries += 1
+                continue
+
+            if self.retry_policy.is_retryable_status(method, response.status_code, idempotent=idempotent):
+                self.circuit_breaker.on_failure()
+                if response.status_code == _SERVICE_UNAVAILABLE_STATUS_CODE:
+                    # an overloaded API, so the shared rate is lowered too (without a Retry-After to wait for)
+                    self.rate_limiter.on_throttled()
+                backoff = self.retry_policy.get_backoff(record.retries)
+                if not self.retry_policy.can_retry(record.retries, deadline_at, backoff):
+                    return response
+                self._logger.warning(
+                    f"Transient error: {response.status_code}  {response.text}. Retrying in {backoff:.2f} seconds..."
+                )
+                record.backoff_wait += backoff
+                time.sleep(backoff)
+                record.retries += 1
+                continue
+
+            self.circuit_breaker.on_success()
+            self.rate_limiter.on_success()
+            return response
+
+    def get(self, url: str, **kwargs) -> Response:
+        """Sends a GET request using the pooled session"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        """Sends a POST request using the pooled session"""
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        """Sends a PATCH request using the pooled session"""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        """Sends a DELETE request using the pooled session"""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        """Closes the session and all the pooled connections"""
+        self.session.close()
+
+
+_default_transport: GraphTransport | None = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> GraphTransport:
+    """Returns the transport shared by all the EntityAPI objects in this process,
+    creating it on first use"""
+    global _default_transport  # noqa: PLW0603
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = GraphTransport()
+        return _default_transport
+
+
+def set_default_transport(transport: GraphTransport | None) -> GraphTransport | None:
+    """Replaces the transport shared by all the EntityAPI objects in this process.
+    Returns the previous transport (if any), so the caller can close or restore it"""
+    global _default_transport  # noqa: PLW0603
+    with _default_transport_lock:
+        previous = _default_transport
+        _default_transport = transport
+        return previous
@@ -1,5 +1,8 @@
+import re
 from typing import Any
 
+_GUID_PATTERN = re.compile(r"^[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$")
+
 
 def ensure_list(source: list[dict] | dict) -> list[dict]:
     """Ensures that the source is a list.
@@ -43,3 +46,8 @@ def assert_condition(condition: Any, message: str):
     """Asserts a condition and raises an AssertionError if it is False"""
     if not condition:
         raise AssertionError(message)
+
+
+def is_guid(value: str) -> bool:
+    """Checks if the value is a guid (e.g. an object id, as opposed to a name or a keyword like All)"""
+    return bool(_GUID_PATTERN.match(value))
@@ -0,0 +1,207 @@
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any
+from ca_pwt.helpers.utils import assert_condition
+
+_logger = logging.getLogger(__name__)
+
+# the types of objects referenced by policies, each one with its own namespace
+_OBJECT_TYPES = ["groups", "users", "roles", "applications"]
+
+
+class BuiltinCatalog:
+    """A read-only catalog of well-known objects (e.g. the built-in roles), by guid and by attribute.
+    The catalog is only loaded (and its reverse index built) on first use, so commands that do not map policies
+    do not pay for it. It is thread-safe"""
+
+    def __init__(self, load: Callable[[], Mapping[str, str]]):
+        """Creates a BuiltinCatalog object
+        - load: returns the attributes of the objects by their guids (called once, on first use)
+        """
+        self._load = load
+        self._lock = threading.Lock()
+        self._attributes: Mapping[str, str] | None = None
+        self._ids: Mapping[str, str] | None = None
+
+    def _get_index(self, *, to_guids: bool) -> Mapping[str, str]:
+        with self._lock:
+            if self._attributes is None or self._ids is None:
+                attributes = dict(self._load())
+                self._attributes = MappingProxyType(attributes)
+                self._ids = MappingProxyType({attribute: object_id for object_id, attribute in attributes.items()})
+            return self._ids if to_guids else self._attributes
+
+    def get(self, key: str, *, to_guids: bool) -> str | None:
+        """Returns the guid of an attribute (to_guids=True) or the attribute of a guid (to_guids=False),
+        or None if it is not in the catalog"""
+        return self._get_index(to_guids=to_guids).get(key)
+
+    def to_dict(self) -> Mapping[str, str]:
+        """Returns the attributes of the objects by their guids (read-only)"""
+        return self._get_index(to_guids=False)
+
+
+def _load_builtin_roles() -> Mapping[str, str]:
+    from ca_pwt.builtin_roles import _BUILTIN_ROLES_ID_NAME
+
+    return _BUILTIN_ROLES_ID_NAME
+
+
+def _load_builtin_apps() -> Mapping[str, str]:
+    from ca_pwt.builtin_apps import _BUILTIN_APPS_ID_NAME
+
+    return _BUILTIN_APPS_ID_NAME
+
+
+# the well-known objects of each type, shared by the whole process
+_BUILTIN_CATALOGS = {
+    "roles": BuiltinCatalog(_load_builtin_roles),
+    "applications": BuiltinCatalog(_load_builtin_apps),
+}
+
+
+def get_builtin_catalog(object_type: str) -> BuiltinCatalog | None:
+    """Returns the catalog of the well-known objects of a type (the built-in roles and applications),
+    or None if the type has none"""
+    assert_condition(object_type in _OBJECT_TYPES, f"object_type must be in {_OBJECT_TYPES}")
+    return _BUILTIN_CATALOGS.get(object_type)
+
+
+class LookupCache:
+    """A cache of the guids and attributes (e.g. display names) of the objects referenced by policies.
+    Each type of object (groups, users, roles and applications) has its own namespace, so a group and a role with
+    the same name never collide, and each namespace keeps an id -> attribute and an attribute -> id index in sync,
+    so the same cache serves both directions. Keys that could not be resolved are cached as None (but are not
+    saved). The built-in roles and applications can be layered under the cache (see BuiltinCatalog): they are
+    found as if they were cached, but are neither copied into the cache nor saved. It is thread-safe"""
+
+    def __init__(self, *, builtins: bool = False) -> None:
+        """Creates an empty LookupCache object
+        - builtins: if True, the built-in roles and applications are layered under the cache
+        """
+        self._lock = threading.RLock()
+        self._builtin_catalogs = _BUILTIN_CATALOGS if builtins else {}
+        # object type -> {id: attribute} and {attribute: id}
+        self._attributes: dict[str, dict[str, str | None]] = {object_type: {} for object_type in _OBJECT_TYPES}
+        self._ids: dict[str, dict[str, str | None]] = {object_type: {} for object_type in _OBJECT_TYPES}
+
+    def _get_index(self, object_type: str, *, to_guids: bool) -> dict[str, str | None]:
+        assert_condition(object_type in _OBJECT_TYPES, f"object_type must be in {_OBJECT_TYPES}")
+        return self._ids[object_type] if to_guids else self._attributes[object_type]
+
+    def has(self, object_type: str, key: str, *, to_guids: bool) -> bool:
+        """Checks if the key is cached (even if it could not be resolved)
+        - to_guids: if True, the key is an attribute (e.g. a group name); otherwise, it is a guid
+        """
+        with self._lock:
+            if key in self._get_index(object_type, to_guids=to_guids):
+                return True
+        return self._get_builtin(object_type, key, to_guids=to_guids) is not None
+
+    def get(self, object_type: str, key: str, *, to_guids: bool) -> str | None:
+        """Returns the guid of an attribute (to_guids=True) or the attribute of a guid (to_guids=False),
+        or None if it is not cached or could not be resolved"""
+        with self._lock:
+            index = self._get_index(object_type, to_guids=to_guids)
+            if key in index:
+                return index[key]
+        return self._get_builtin(object_type, key, to_guids=to_guids)
+
+    def _get_builtin(self, object_type: str, key: str, *, to_guids: bool) -> str | None:
+        """Returns the value of a key in the built-in catalog of the type, if it is layered under the cache"""
+        builtin_catalog = self._builtin_catalogs.get(object_type)
+        return builtin_catalog.get(key, to_guids=to_guids) if builtin_catalog is not None else None
+
+    def add(self, object_type: str, object_id: str, attribute: str):
+        """Caches the guid and the current attribute of an object, in both directions.
+        If the object was renamed, its guid maps to the new attribute, but the previous attribute still maps
+        to the guid, as any other alias of the object"""
+        with self._lock:
+            self._attributes[object_type][object_id] = attribute
+            self._ids[object_type][attribute] = object_id
+
+    def set(self, object_type: str, key: str, value: str | None, *, to_guids: bool):
+        """Caches the value of a key: its guid (to_guids=True) or its attribute (to_guids=False).
+        None means the key could not be resolved.
+        An attribute resolved to a guid is an alias of the object (e.g. a case variant of its name), so it does not
+        replace the attribute of the guid, if it is already known"""
+        if value is None:
+            with self._lock:
+                self._get_index(object_type, to_guids=to_guids)[key] = None
+        elif to_guids:
+            with self._lock:
+                self._get_index(object_type, to_guids=True)[key] = value
+                attributes = self._attributes[object_type]
+                if attributes.get(value) is None:
+                    attributes[value] = key
+        else:
+            self.add(object_type, key, value)
+
+    def update(self, object_type: str, attributes: dict[str, str]):
+        """Caches many objects at once
+        - attributes: the attributes of the objects by their guids
+        """
+        with self._lock:
+            for object_id, attribute in attributes.items():
+                self.add(object_type, object_id, attribute)
+
+    def get_not_found(self, *, to_guids: bool) -> dict[str, list[str]]:
+        """Returns the keys that could not be resolved, by type of object (only the types with such keys)
+        - to_guids: if True, the attributes that could not be resolved; otherwise, the guids
+        """
+        with self._lock:
+            not_found = {
+                object_type: [
+                    key for key, value in self._get_index(object_type, to_guids=to_guids).items() if value is None
+                ]
+                for object_type in _OBJECT_TYPES
+            }
+        return {object_type: keys for object_type, keys in not_found.items() if keys}
+
+    def to_dict(self) -> dict[str, dict[str, str]]:
+        """Returns the objects that were resolved, as their attributes by their guids for each type of object
+        (without the built-in ones). It is all that is needed to restore the cache in both directions"""
+        with self._lock:
+            return {
+                object_type: {key: value for key, value in attributes.items() if value is not None}
+                for object_type, attributes in self._attributes.items()
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], *, builtins: bool = False) -> "LookupCache":
+        """Creates a LookupCache object from the output of to_dict.
+        Flat dictionaries of guids and attributes (the format of previous versions) are still accepted:
+        as the type of their objects is unknown, their entries are added to every namespace
+        - builtins: if True, the built-in roles and applications are layered under the cache
+        """
+        lookup_cache = cls(builtins=builtins)
+        if all(isinstance(value, str) for value in data.values()):
+            for object_type in _OBJECT_TYPES:
+                lookup_cache.update(object_type, data)
+        else:
+            for object_type, attributes in data.items():
+                assert_condition(object_type in _OBJECT_TYPES, f"object types must be in {_OBJECT_TYPES}")
+                lookup_cache.update(object_type, attributes)
+        return lookup_cache
+
+    @classmethod
+    def load(cls, file_path: str, *, builtins: bool = False) -> "LookupCache":
+        """Loads a lookup cache from a JSON file (see to_dict), returning an empty cache if the file does not exist
+        - builtins: if True, the built-in roles and applications are layered under the cache
+        """
+        if not os.path.exists(file_path):
+            _logger.warning(f"File {file_path} does not exist. Returning empty lookup cache.")
+            return cls(builtins=builtins)
+        with open(file_path) as f:
+            return cls.from_dict(json.load(f), builtins=builtins)
+
+    def save(self, file_path: str):
+        """Stores the objects that were resolved in a JSON file (see to_dict)"""
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+        os.replace(temp_path, file_path)
@@ -0,0 +1,172 @@
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from ca_pwt.helpers.response_cache import _get_tenant
+from ca_pwt.helpers.utils import assert_condition
+from ca_pwt.lookup_cache import LookupCache
+
+_logger = logging.getLogger(__name__)
+
+# names and ids rarely change, so the resolved objects are kept for a week by default
+_DEFAULT_TTL = 7 * 24 * 3600.0
+# missing objects may be created at any time, so the keys that could not be resolved are checked again sooner
+_DEFAULT_NOT_FOUND_TTL = 24 * 3600.0
+# how long a process waits for another one to release the database before failing
+_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS lookups (
+        tenant TEXT NOT NULL,
+        object_type TEXT NOT NULL,
+        object_id TEXT NOT NULL,
+        attribute TEXT NOT NULL,
+        resolved_at REAL NOT NULL,
+        PRIMARY KEY (tenant, object_type, object_id)
+    )
+    """,
+    # the keys (guids or attributes, see to_guids) that could not be resolved
+    """
+    CREATE TABLE IF NOT EXISTS not_found (
+        tenant TEXT NOT NULL,
+        object_type TEXT NOT NULL,
+        key TEXT NOT NULL,
+        to_guids INTEGER NOT NULL,
+        checked_at REAL NOT NULL,
+        PRIMARY KEY (tenant, object_type, key, to_guids)
+    )
+    """,
+]
+
+
+class LookupStore:
+    """A persistent store of the objects resolved by the policy mappings (their guids and attributes, see
+    LookupCache), in an embedded SQLite database, so later runs do not look them up again.
+    Objects are stored by tenant and type of object, with the time they were resolved, and expire after the TTL.
+    The keys that could not be resolved (e.g. deleted groups) are stored too, with a shorter TTL.
+    Several processes can share the same database file"""
+
+    def __init__(
+        self,
+        file_path: str,
+        access_token: str,
+        *,
+        ttl: float = _DEFAULT_TTL,
+        not_found_ttl: float = _DEFAULT_NOT_FOUND_TTL,
+        recheck_not_found: bool = False,
+    ):
+        """Creates a LookupStore object, creating the database if it does not exist
+        - file_path: the SQLite database file
+        - access_token: the access token of the tenant whose objects are loaded and stored
+        - ttl: the number of seconds a resolved object is used (default: a week)
+        - not_found_ttl: the number of seconds a key that could not be resolved is not looked up again
+          (default: a day)
+        - recheck_not_found: if True, the keys that could not be resolved are not loaded, so they are looked up again
+        """
+        assert_condition(ttl >= 0, "ttl cannot be negative")
+        assert_condition(not_found_ttl >= 0, "not_found_ttl cannot be negative")
+        self.file_path = file_path
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        self.recheck_not_found = recheck_not_found
+        self._tenant = _get_tenant(f"Bearer {access_token}")
+        # the objects known to be stored, so only the new or changed ones are written
+        self._stored: dict[str, dict[str, str]] = {}
+        # the keys that could not be resolved known to be stored (object type, key, to_guids), and the ones
+        # that are not checked again because they were loaded in the lookup cache
+        self._stored_not_found: set[tuple[str, str, bool]] = set()
+        self._unchecked_not_found: set[tuple[str, str, bool]] = set()
+        with closing(self._connect()) as connection, connection:
+            # readers do not block the writer (and vice versa) in write-ahead logging mode
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a connection to the database, waiting for other processes to release it if needed"""
+        return sqlite3.connect(self.file_path, timeout=_BUSY_TIMEOUT)
+
+    def load(self, lookup_cache: LookupCache) -> LookupCache:
+        """Adds the objects of the tenant and the keys that could not be resolved that did not expire
+        to the lookup cache. Objects that are already in the lookup cache are kept as they are"""
+        now = time.time()
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT object_type, object_id, attribute FROM lookups WHERE tenant = ? AND resolved_at >= ?",
+                (self._tenant, now - self.ttl),
+            ).fetchall()
+            not_found_rows = connection.execute(
+                "SELECT object_type, key, to_guids FROM not_found WHERE tenant = ? AND checked_at >= ?",
+                (self._tenant, now - self.not_found_ttl),
+            ).fetchall()
+        for object_type, object_id, attribute in rows:
+            if not lookup_cache.has(object_type, object_id, to_guids=False):
+                lookup_cache.add(object_type, object_id, attribute)
+        self._stored = lookup_cache.to_dict()
+        self._stored_not_found = {(object_type, key, bool(to_guids)) for object_type, key, to_guids in not_found_rows}
+        self._unchecked_not_found = set()
+        if not self.recheck_not_found:
+            for object_type, key, to_guids in self._stored_not_found:
+                if not lookup_cache.has(object_type, key, to_guids=to_guids):
+                    lookup_cache.set(object_type, key, None, to_guids=to_guids)
+                    self._unchecked_not_found.add((object_type, key, to_guids))
+        _logger.debug(
+            f"Loaded {len(rows)} objects and {len(self._unchecked_not_found)} missing keys from {self.file_path}"
+        )
+        return lookup_cache
+
+    def save(self, lookup_cache: LookupCache):
+        """Stores the objects of the lookup cache that were resolved since it was loaded (see load) and the keys
+        that could not be resolved, and removes the ones that expired"""
+        now = time.time()
+        rows = [
+            (self._tenant, object_type, object_id, attribute, now)
+            for object_type, attributes in lookup_cache.to_dict().items()
+            for object_id, attribute in attributes.items()
+            if self._stored.get(object_type, {}).get(object_id) != attribute
+        ]
+        not_found = {
+            (object_type, key, to_guids)
+            for to_guids in [True, False]
+            for object_type, keys in lookup_cache.get_not_found(to_guids=to_guids).items()
+            for key in keys
+        }
+        # the keys that were loaded as not found keep the time they were checked, so they expire
+        not_found_rows = [
+            (self._tenant, object_type, key, to_guids, now)
+            for object_type, key, to_guids in not_found - self._unchecked_not_found
+        ]
+        # the keys that were stored as not found but have been resolved since
+        resolved = {
+            (object_type, key, to_guids)
+            for object_type, key, to_guids in self._stored_not_found
+            if lookup_cache.get(object_type, key, to_guids=to_guids) is not None
+        }
+        resolved_rows = [(self._tenant, object_type, key, to_guids) for object_type, key, to_guids in resolved]
+        # the connection commits the changes at once (or none of them), so concurrent processes never see half of them
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT INTO lookups (tenant, object_type, object_id, attribute, resolved_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (tenant, object_type, object_id) "
+                "DO UPDATE SET attribute = excluded.attribute, resolved_at = excluded.resolved_at",
+                rows,
+            )
+            connection.executemany(
+                "INSERT INTO not_found (tenant, object_type, key, to_guids, checked_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (tenant, object_type, key, to_guids) DO UPDATE SET checked_at = excluded.checked_at",
+                not_found_rows,
+            )
+            connection.executemany(
+                "DELETE FROM not_found WHERE tenant = ? AND object_type = ? AND key = ? AND to_guids = ?",
+                resolved_rows,
+            )
+            connection.execute("DELETE FROM lookups WHERE resolved_at < ?", (now - self.ttl,))
+            connection.execute("DELETE FROM not_found WHERE checked_at < ?", (now - self.not_found_ttl,))
+        for _, object_type, object_id, attribute, _ in rows:
+            self._stored.setdefault(object_type, {})[object_id] = attribute
+        self._stored_not_found = (self._stored_not_found - resolved) | not_found
+        self._unchecked_not_found |= not_found
+        _logger.debug(f"Stored {len(rows)} objects and {len(not_found_rows)} missing keys in {self.file_path}")
@@ -0,0 +1,446 @@
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlencode, urlparse
+import click
+from ca_pwt.helpers.transport import _SERVICE_UNAVAILABLE_STATUS_CODE, _THROTTLING_STATUS_CODE
+from ca_pwt.helpers.utils import assert_condition
+
+_logger = logging.getLogger(__name__)
+
+_API_VERSION = "v1.0"
+_DEFAULT_PAGE_SIZE = 100
+_DEFAULT_RETRY_AFTER = 1.0
+
+_POLICIES_PATH = "identity/conditionalAccess/policies"
+# the collections of the in-memory tenant, and the @odata.type of their entities (for getByIds)
+_COLLECTIONS = {
+    _POLICIES_PATH: "conditionalAccessPolicy",
+    "groups": "group",
+    "users": "user",
+    "directoryRoles": "directoryRole",
+    "directoryRoleTemplates": "directoryRoleTemplate",
+    "servicePrincipals": "servicePrincipal",
+}
+
+_EQ_FILTER = re.compile(r"^(\w+) eq '(.*)'$")
+_IN_FILTER = re.compile(r"^(\w+) in \((.*)\)$")
+_STARTSWITH_FILTER = re.compile(r"^startswith\((\w+),\s*'(.*)'\)$")
+_QUOTED_VALUE = re.compile(r"'((?:[^']|'')*)'")
+_KEY_SEGMENT = re.compile(r"^(\w+)\((\w+)='\{?(.*?)\}?'\)$")
+
+# a response of the mock: status code, JSON body (or None) and headers
+_MockResponse = tuple[int, Any, dict[str, str]]
+
+
+def _error(status_code: int, code: str, message: str, headers: dict[str, str] | None = None) -> _MockResponse:
+    return status_code, {"error": {"code": code, "message": message}}, headers or {}
+
+
+def _unquote_odata(value: str) -> str:
+    return value.replace("''", "'")
+
+
+def _match_filter(entity: dict, odata_filter: str) -> bool:
+    """Checks if the entity matches the filter (only the eq, in and startswith operators are supported,
+    and values are compared case-insensitively, like the API does for most attributes)"""
+    match = _EQ_FILTER.match(odata_filter)
+    if match:
+        return str(entity.get(match[1], "")).lower() == _unquote_odata(match[2]).lower()
+    match = _IN_FILTER.match(odata_filter)
+    if match:
+        values = [_unquote_odata(value).lower() for value in _QUOTED_VALUE.findall(match[2])]
+        return str(entity.get(match[1], "")).lower() in values
+    match = _STARTSWITH_FILTER.match(odata_filter)
+    if match:
+        return str(entity.get(match[1], "")).lower().startswith(_unquote_odata(match[2]).lower())
+    msg = f"Unsupported filter: {odata_filter}"
+    raise ValueError(msg)
+
+
+def _project(entity: dict, select: str | None) -> dict:
+    """Returns the attributes of the entity listed in $select (default: all attributes)"""
+    if not select:
+        return dict(entity)
+    attributes = select.split(",")
+    return {key: value for key, value in entity.items() if key in attributes or key.startswith("@odata")}
+
+
+class _TokenBucket:
+    """The rate limit of a resource: returns the number of seconds to wait when it is exceeded"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+
+    def take(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class MockGraph:
+    """An in-memory stand-in for the Microsoft Graph API endpoints used by this project (conditional access
+    policies, groups, users, directory roles and role templates, service principals, getByIds and $batch),
+    with configurable faults to load test concurrency and retries reproducibly.
+    Requests are handled by the handle method, which MockGraphServer exposes over HTTP. It is thread-safe"""
+
+    def __init__(
+        self,
+        tenant: dict[str, list[dict]] | None = None,
+        *,
+        throttle_rate: float = 0,
+        unavailable_rate: float = 0,
+        retry_after: float = _DEFAULT_RETRY_AFTER,
+        rate_limits: dict[str, float] | None = None,
+        seed: int | None = None,
+    ):
+        """Creates a MockGraph object
+        - tenant: the initial entities, by collection (e.g. {"groups": [{"id": "...", "displayName": "..."}]})
+        - throttle_rate: the probability that a request is throttled with a 429 response
+        - unavailable_rate: the probability that a request fails with a 503 response
+        - retry_after: the Retry-After header (in seconds) of the injected 429 and 503 responses
+        - rate_limits: the maximum number of requests per second, by collection (e.g. {"groups": 10}); requests
+          over the limit are throttled with a 429 response
+        - seed: the seed of the fault injection, so runs are reproducible
+        """
+        assert_condition(0 <= throttle_rate <= 1 and 0 <= unavailable_rate <= 1, "rates must be between 0 and 1")
+        self.throttle_rate = throttle_rate
+        self.unavailable_rate = unavailable_rate
+        self.retry_after = retry_after
+        self.base_url = f"https://graph.microsoft.com/{_API_VERSION}"
+        self.collections: dict[str, dict[str, dict]] = {path: {} for path in _COLLECTIONS}
+        self.members: dict[str, list[str]] = {}
+        # the number of requests received and throttled, by collection
+        self.request_counts: dict[str, int] = {}
+        self.throttled_counts: dict[str, int] = {}
+        self._rate_limits = {path: _TokenBucket(rate) for path, rate in (rate_limits or {}).items()}
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.RLock()
+        for path, entities in (tenant or {}).items():
+            assert_condition(path in _COLLECTIONS, f"Unknown collection: {path}")
+            for entity in entities:
+                self.add(path, entity)
+
+    def add(self, path: str, entity: dict) -> dict:
+        """Adds an entity to a collection, generating its id if it has none"""
+        entity = {"id": str(uuid.uuid4()), **entity}
+        with self._lock:
+            self.collections[path][entity["id"]] = entity
+        return entity
+
+    def _split_path(self, path: str) -> tuple[str, list[str]]:
+        """Returns the collection of a path (relative to the API version) and the remaining segments"""
+        path = path.strip("/")
+        for collection in sorted(self.collections, key=len, reverse=True):
+            if path == collection or path.startswith(collection + "/") or path.startswith(collection + "("):
+                rest = path[len(collection) :]
+                if rest.startswith("("):
+                    return collection, [rest]
+                return collection, [segment for segment in rest.split("/") if segment]
+        segments = path.split("/")
+        return segments[0], segments[1:]
+
+    def _inject_fault(self, collection: str) -> _MockResponse | None:
+        """Returns an injected 429/503 response, or None if the request is let through"""
+        with self._lock:
+            self.request_counts[collection] = self.request_counts.get(collection, 0) + 1
+            retry_after: float | None = None
+            status_code = _THROTTLING_STATUS_CODE
+            bucket = self._rate_limits.get(collection)
+            wait = bucket.take() if bucket is not None else 0
+            if wait > 0:
+                retry_after = max(math.ceil(wait), 1)
+            elif self._random.random() < self.throttle_rate:
+                retry_after = self.retry_after
+            elif self._random.random() < self.unavailable_rate:
+                retry_after = self.retry_after
+                status_code = _SERVICE_UNAVAILABLE_STATUS_CODE
+            if retry_after is None:
+                return None
+            self.throttled_counts[collection] = self.throttled_counts.get(collection, 0) + 1
+        code = "TooManyRequests" if status_code == _THROTTLING_STATUS_CODE else "ServiceUnavailable"
+        return _error(status_code, code, "Injected fault", {"Retry-After": f"{retry_after:g}"})
+
+    def handle(self, method: str, url: str, body: Any = None) -> _MockResponse:
+        """Handles a request
+        - url: the url of the request, relative to the API version (e.g. /groups?$filter=...)
+        - body: the JSON body of the request, if any
+        """
+        parsed_url = urlparse(url)
+        collection, segments = self._split_path(unquote(parsed_url.path))
+        fault = self._inject_fault(collection)
+        if fault is not None:
+            return fault
+        query = {key: values[0] for key, values in parse_qs(parsed_url.query).items()}
+        method = method.upper()
+        try:
+            if collection == "$batch" and method == "POST":
+                return self._handle_batch(body)
+            if collection == "directoryObjects" and segments == ["getByIds"] and method == "POST":
+                return self._handle_get_by_ids(body)
+            if collection not in self.collections:
+                return _error(400, "BadRequest", f"Resource not found for the segment '{collection}'")
+            if not segments:
+                if method == "GET":
+                    return self._handle_list(collection, query)
+                if method == "POST":
+                    return 201, self.add(collection, body), {}
+            elif collection == "groups" and segments[1:] == ["members", "$ref"] and method == "POST":
+                return self._handle_add_member(segments[0], body)
+            elif len(segments) == 1:
+                return self._handle_entity(method, collection, segments[0], query, body)
+        except ValueError as e:
+            return _error(400, "BadRequest", str(e))
+        return _error(405, "MethodNotAllowed", f"{method} {parsed_url.path} is not supported")
+
+    def _find(self, collection: str, key: str) -> dict | None:
+        """Returns the entity of the collection with the key: an id, userPrincipalName or (appId='...')"""
+        entities = self.collections[collection]
+        match = _KEY_SEGMENT.match(f"{collection}{key}") if key.startswith("(") else None
+        if match:
+            return next((entity for entity in entities.values() if entity.get(match[2]) == match[3]), None)
+        if key in entities:
+            return entities[key]
+        if collection == "users":
+            return next(
+                (entity for entity in entities.values() if entity.get("userPrincipalName", "").lower() == key.lower()),
+                None,
+            )
+        return None
+
+    def _handle_list(self, collection: str, query: dict[str, str]) -> _MockResponse:
+        with self._lock:
+            entities = list(self.collections[collection].values())
+        if "$filter" in query:
+            entities = [entity for entity in entities if _match_filter(entity, query["$filter"])]
+        page_size = int(query.get("$top", _DEFAULT_PAGE_SIZE))
+        skip = int(query.get("$skiptoken", 0))
+        body: dict[str, Any] = {
+            "value": [_project(entity, query.get("$select")) for entity in entities[skip : skip + page_size]]
+        }
+        if skip + page_size < len(entities):
+            next_query = {**query, "$skiptoken": str(skip + page_size)}
+            body["@odata.nextLink"] = f"{self.base_url}/{collection}?{urlencode(next_query)}"
+        return 200, body, {}
+
+    def _handle_entity(self, method: str, collection: str, key: str, query: dict[str, str], body: Any) -> _MockResponse:
+        with self._lock:
+            entity = self._find(collection, key)
+            if entity is None:
+                return _error(404, "Request_ResourceNotFound", f"Resource '{key}' does not exist")
+            if method == "GET":
+                return 200, _project(entity, query.get("$select")), {}
+            if method == "PATCH":
+                entity.update(body or {})
+                return 204, None, {}
+            if method == "DELETE":
+                del self.collections[collection][entity["id"]]
+                return 204, None, {}
+        return _error(405, "MethodNotAllowed", f"{method} is not supported")
+
+    def _handle_add_member(self, group_id: str, body: Any) -> _MockResponse:
+        with self._lock:
+            if group_id not in self.collections["groups"]:
+                return _error(404, "Request_ResourceNotFound", f"Resource '{group_id}' does not exist")
+            member_id = str(body["@odata.id"]).rstrip("/").split("/")[-1]
+            self.members.setdefault(group_id, []).append(member_id)
+        return 204, None, {}
+
+    def _handle_get_by_ids(self, body: Any) -> _MockResponse:
+        types = set(body.get("types") or [])
+        value = []
+        with self._lock:
+            for entity_id in body["ids"]:
+                for collection, odata_type in _COLLECTIONS.items():
+                    if types and odata_type not in types:
+                        continue
+                    entity = self.collections[collection].get(entity_id)
+                    if entity is not None:
+                        value.append({"@odata.type": f"#microsoft.graph.{odata_type}", **entity})
+                        break
+        return 200, {"value": value}, {}
+
+    def _handle_batch(self, body: Any) -> _MockResponse:
+        responses = []
+        for request in body["requests"]:
+            status_code, sub_body, headers = self.handle(request["method"], request["url"], request.get("body"))
+            sub_response: dict[str, Any] = {"id": request["id"], "status": status_code, "headers": headers}
+            if sub_body is not None:
+                sub_response["body"] = sub_body
+            responses.append(sub_response)
+        return 200, {"responses": responses}, {}
+
+
+class _MockGraphRequestHandler(BaseHTTPRequestHandler):
+    """Serves the requests of a MockGraphServer"""
+
+    server: "_MockGraphHTTPServer"
+
+    def _handle(self):
+        mock_server = self.server.mock_server
+        if mock_server.latency or mock_server.jitter:
+            time.sleep(mock_server.latency + mock_server.jitter * random.random())  # noqa: S311
+        prefix = f"/{_API_VERSION}"
+        if not self.path.startswith(prefix + "/"):
+            status_code, body, headers = _error(404, "NotFound", f"{self.path} is not under {prefix}")
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            request_body = json.loads(self.rfile.read(length)) if length else None
+            status_code, body, headers = mock_server.graph.handle(
+                self.command, self.path.removeprefix(prefix), request_body
+            )
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status_code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _handle  # noqa: N815
+    do_POST = _handle  # noqa: N815
+    do_PATCH = _handle  # noqa: N815
+    do_DELETE = _handle  # noqa: N815
+
+    def log_message(self, format: str, *args: Any):  # noqa: A002
+        _logger.debug(format % args)
+
+
+class _MockGraphHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    mock_server: "MockGraphServer"
+
+
+class MockGraphServer:
+    """A local HTTP server that serves a MockGraph, so the real EntityAPI classes and CLI commands can be pointed
+    at it (with the base_url of the transport, or the --graph_url option of the CLI)"""
+
+    def __init__(
+        self,
+        graph: MockGraph | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        jitter: float = 0,
+    ):
+        """Creates a MockGraphServer object
+        - graph: the mock that handles the requests (default: an empty tenant without faults)
+        - host, port: the address to listen on (default: a free port on the loopback interface)
+        - latency: the number of seconds each response is delayed
+        - jitter: the maximum number of seconds randomly added to the latency of each response
+        """
+        assert_condition(latency >= 0 and jitter >= 0, "latency and jitter cannot be negative")
+        self.graph = graph if graph is not None else MockGraph()
+        self.latency = latency
+        self.jitter = jitter
+        self._http_server = _MockGraphHTTPServer((host, port), _MockGraphRequestHandler)
+        self._http_server.mock_server = self
+        self._thread: threading.Thread | None = None
+        self.graph.base_url = self.base_url
+
+    @property
+    def base_url(self) -> str:
+        """The base url of the API served, including the version"""
+        host, port = self._http_server.server_address[:2]
+        return f"http://{host!s}:{port}/{_API_VERSION}"
+
+    def start(self) -> "MockGraphServer":
+        """Starts serving requests in a background thread"""
+        self._thread = threading.Thread(target=self._http_server.serve_forever, daemon=True)
+        self._thread.start()
+        _logger.info(f"Mock Graph API listening on {self.base_url}")
+        return self
+
+    def serve_forever(self):
+        """Serves requests in the current thread, until interrupted"""
+        try:
+            self._http_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._http_server.server_close()
+
+    def stop(self):
+        """Stops serving requests started with start"""
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+    def __enter__(self) -> "MockGraphServer":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+@click.command("mock-graph", help="Runs a local mock of the Graph API endpoints used by ca-pwt, for load tests")
+@click.option("--host", default="127.0.0.1", help="The address to listen on")
+@click.option("--port", default=8000, type=click.IntRange(min=0), help="The port to listen on")
+@click.option(
+    "--tenant_file",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help='A JSON file with the initial entities by collection (e.g. {"groups": [{"displayName": "Sales"}]})',
+)
+@click.option("--latency", default=0.0, type=click.FloatRange(min=0), help="The seconds each response is delayed")
+@click.option("--jitter", default=0.0, type=click.FloatRange(min=0), help="The maximum random seconds added")
+@click.option("--throttle_rate", default=0.0, type=click.FloatRange(0, 1), help="The probability of a 429")
+@click.option("--unavailable_rate", default=0.0, type=click.FloatRange(0, 1), help="The probability of a 503")
+@click.option("--retry_after", default=_DEFAULT_RETRY_AFTER, help="The Retry-After of the injected faults")
+@click.option(
+    "--rate_limit",
+    multiple=True,
+    help="The maximum requests per second of a collection, as COLLECTION=RATE (e.g. groups=10). Can be repeated",
+)
+@click.option("--seed", default=None, type=int, help="The seed of the fault injection")
+def mock_graph_cmd(
+    *,
+    host: str,
+    port: int,
+    tenant_file: str | None,
+    latency: float,
+    jitter: float,
+    throttle_rate: float,
+    unavailable_rate: float,
+    retry_after: float,
+    rate_limit: tuple[str, ...],
+    seed: int | None,
+):
+    tenant = None
+    if tenant_file:
+        with open(tenant_file) as f:
+            tenant = json.load(f)
+    rate_limits = {}
+    for limit in rate_limit:
+        collection, _, rate = limit.partition("=")
+        rate_limits[collection] = float(rate)
+    graph = MockGraph(
+        tenant,
+        throttle_rate=throttle_rate,
+        unavailable_rate=unavailable_rate,
+        retry_after=retry_after,
+        rate_limits=rate_limits,
+        seed=seed,
+    )
+    server = MockGraphServer(graph, host=host, port=port, latency=latency, jitter=jitter)
+    click.echo(f"Mock Graph API listening on {server.base_url} (use --graph_url {server.base_url}). Ctrl+C to stop")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    mock_graph_cmd()
@@ -1,8 +1,13 @@
+import asyncio
+import functools
 import logging
 from ca_pwt.helpers.utils import remove_element_from_dict, cleanup_odata_dict, ensure_list
 from ca_pwt.helpers.graph_api import EntityAPI, DuplicateActionEnum
 from ca_pwt.policies_mappings import replace_attrs_with_guids_in_policies
+from ca_pwt.helpers.graph_api_async import AsyncEntityAPI, AsyncGraphTransport, gather_by_key
 from ca_pwt.groups import get_groups_by_ids
+from ca_pwt.directory_index import DirectoryIndex
+from ca_pwt.lookup_cache import LookupCache
 from typing import Any
 from ca_pwt.helpers.graph_api import _HTTP_NOT_FOUND
 
@@ -14,6 +19,11 @@ class PoliciesAPI(EntityAPI):
         return "identity/conditionalAccess/policies"
 
 
+class AsyncPoliciesAPI(AsyncEntityAPI):
+    def _get_entity_path(self) -> str:
+        return "identity/conditionalAccess/policies"
+
+
 def load_policies(input_file: str) -> list[dict]:
     """Loads policies from the specified file.
     It also cleans up the dictionary to remove unnecessary elements."""
@@ -56,31 +66,31 @@ def cleanup_policies(policies: list[dict]) -> list[dict]:
 
 def export_policies(access_token: str, odata_filter: str | None = None) -> list[dict]:
     """Exports all policies with the specified filter. Filter is
-    an OData filter string."""
+    an OData filter string. All the result pages are followed."""
     policies_api = PoliciesAPI(access_token=access_token)
-    response = policies_api.get_all(odata_filter=odata_filter)
-    response.assert_success()
-    policies = response.json()
-
+    # pages are streamed and only the policies themselves are kept
+    policies = [cleanup_odata_dict(policy) for policy in policies_api.iter_all(odata_filter=odata_filter)]
     _logger.debug(f"Obtained policies: {policies}")
-    policies = cleanup_odata_dict(policies)
-    policies = ensure_list(policies)
-    _logger.debug(f"Formatted policies: {policies}")
     return policies
 
 
 def import_policies(
     access_token: str,
     policies: list[dict],
-    lookup_cache: dict[str, str] | None = None,
+    lookup_cache: LookupCache | None = None,
     duplicate_action: DuplicateActionEnum = DuplicateActionEnum.IGNORE,
+    *,
+    jobs: int = 1,
+    directory_index: DirectoryIndex | None = None,
 ) -> list[tuple[str, str]]:
     """Imports the specified policies. If allow_duplicates is False,
     it will skip policies that already exist (using the display name as
     the key). Returns a list of tuples with the display name and id of the
     imported policies.
     It also cleans up the dictionary to remove unnecessary elements that
-    are not allowed when importing."""
+    are not allowed when importing.
+    If jobs is greater than 1, the lookups are sent concurrently by a pool of jobs threads.
+    If directory_index is specified, names are resolved against it before calling the API."""
 
     policies_api = PoliciesAPI(access_token=access_token)
     policies = replace_attrs_with_guids_in_policies(
@@ -91,6 +101,8 @@ def import_policies(
         lookup_roles=True,
         lookup_applications=True,
         lookup_cache=lookup_cache,
+        jobs=jobs,
+        directory_index=directory_index,
     )
     # make sure the policies are cleaned up
     policies = cleanup_policies(policies)
@@ -106,16 +118,96 @@ def import_policies(
     return created_policies
 
 
+async def export_policies_async(
+    access_token: str, odata_filter: str | None = None, *, transport: AsyncGraphTransport
+) -> list[dict]:
+    """Async variant of export_policies"""
+    policies_api = AsyncPoliciesAPI(access_token=access_token, transport=transport)
+    policies = [cleanup_odata_dict(policy) async for policy in policies_api.iter_all(odata_filter=odata_filter)]
+    _logger.debug(f"Obtained policies: {policies}")
+    return policies
+
+
+async def import_policies_async(
+    access_token: str,
+    policies: list[dict],
+    lookup_cache: LookupCache | None = None,
+    duplicate_action: DuplicateActionEnum = DuplicateActionEnum.IGNORE,
+    *,
+    transport: AsyncGraphTransport,
+    jobs: int = 1,
+    directory_index: DirectoryIndex | None = None,
+) -> list[tuple[str, str]]:
+    """Async variant of import_policies: the policies are created concurrently (bounded by the transport),
+    except for policies with the same display name, which are created in order.
+    The lookups are resolved as in import_policies (jobs and directory_index have the same meaning), in a worker
+    thread, so they do not block the event loop"""
+
+    policies_api = AsyncPoliciesAPI(access_token=access_token, transport=transport)
+    # the lookups are resolved upfront in $batch requests, before any policy is created
+    policies = await asyncio.get_running_loop().run_in_executor(
+        None,
+        functools.partial(
+            replace_attrs_with_guids_in_policies,
+            access_token,
+            policies,
+            lookup_groups=True,
+            lookup_users=True,
+            lookup_roles=True,
+            lookup_applications=True,
+            lookup_cache=lookup_cache,
+            jobs=jobs,
+            directory_index=directory_index,
+        ),
+    )
+    policies = cleanup_policies(policies)
+
+    async def import_policy(policy: dict) -> tuple[str, str]:
+        display_name: str = str(policy.get("displayName"))
+        response = await policies_api.create_checking_duplicates(
+            policy, f"displayName eq '{display_name}'", duplicate_action
+        )
+        response.assert_success(error_message=f"Error creating policy with display name '{display_name}'")
+        policy_id = response.json()["id"]
+        _logger.info("Policy created successfully with id %s", policy_id)
+        return (policy_id, display_name)
+
+    return await gather_by_key(policies, lambda policy: str(policy.get("displayName")), import_policy)
+
+
 def get_groups_in_policies(
     access_token: str,
     policies: list[dict],
-    lookup_cache: dict[str, str] | None = None,
+    lookup_cache: LookupCache | None = None,
     *,
     ignore_not_found: bool = False,
+    jobs: int = 1,
+    select: list[str] | None = None,
+    directory_index: DirectoryIndex | None = None,
 ) -> list[dict]:
     """Obtains all groups referenced by the policies in the policies dict.
     If ignore_not_found is True, groups that are not found are ignored.
+    If jobs is greater than 1, the requests are sent concurrently by a pool of jobs threads.
+    If select is specified, only those attributes of the groups are returned (default: all attributes,
+    as needed to import the groups in another tenant).
+    If directory_index is specified, group names are resolved against it before calling the API.
     Returns a dictionary with the groups."""
+    groups_found = get_group_ids_in_policies(
+        access_token, policies, lookup_cache=lookup_cache, jobs=jobs, directory_index=directory_index
+    )
+    return get_groups_by_ids(access_token, groups_found, ignore_not_found=ignore_not_found, jobs=jobs, select=select)
+
+
+def get_group_ids_in_policies(
+    access_token: str,
+    policies: list[dict],
+    lookup_cache: LookupCache | None = None,
+    *,
+    jobs: int = 1,
+    directory_index: DirectoryIndex | None = None,
+) -> list[str]:
+    """Obtains the ids of all groups referenced by the policies in the policies dict
+    (group names are looked up and replaced by their ids, against the directory index first if specified)."""
     # make sure that all groups are in the key format
     policies = replace_attrs_with_guids_in_policies(
         access_token,
@@ -125,6 +217,8 @@ def get_groups_in_policies(
         lookup_roles=False,
         lookup_applications=False,
         lookup_cache=lookup_cache,
+        jobs=jobs,
+        directory_index=directory_index,
     )
 
     groups_found: list[str] = []
@@ -141,7 +235,7 @@ def get_groups_in_policies(
         add_groups(users.get("excludeGroups"))
         add_groups(users.get("includeGroups"))
     _logger.debug(f"Groups found in policies: {groups_found}")
-    return get_groups_by_ids(access_token, groups_found, ignore_not_found=ignore_not_found)
+    return groups_found
 
 
 def delete_policies(access_token: str, policies: list[dict]):
@@ -150,9 +244,10 @@ def delete_policies(access_token: str, policies: list[dict]):
     entity_api = PoliciesAPI(access_token=access_token)
 
     ids = [entity["id"] for entity in policies]
+    # requests are packed in $batch envelopes to save round trips
+    responses = entity_api.delete_by_ids(ids)
 
-    for entity_id in ids:
-        response = entity_api.delete(entity_id)
+    for entity_id, response in zip(ids, responses):
         if response.status_code == _HTTP_NOT_FOUND:
             _logger.warning(f"Policy with id {entity_id} was not found.")
             continue
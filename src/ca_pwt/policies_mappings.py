@@ -1,127 +1,428 @@
 import logging
-import json
-import os
+import threading
 from ca_pwt.groups import GroupsAPI
 from ca_pwt.users import UsersAPI
 from ca_pwt.directory_roles import (
+    DirectoryRoleIndex,
     DirectoryRolesAPI,
     DirectoryRoleTemplatesAPI,
-    _BUILTIN_ROLES_ID_NAME,
-    _BUILTIN_ROLES_NAME_ID,
+    get_directory_role_index,
 )
-from ca_pwt.applications import ServicePrincipalsAPI, _BUILTIN_APPS_ID_NAME, _BUILTIN_APPS_NAME_ID
+from ca_pwt.applications import ServicePrincipalsAPI
+from ca_pwt.directory_objects import DirectoryObjectsAPI, _ODATA_TYPE
+from ca_pwt.directory_index import DirectoryIndex
+from ca_pwt.lookup_cache import LookupCache
 from typing import Callable
-from ca_pwt.helpers.graph_api import APIResponse
-from copy import deepcopy
+from ca_pwt.helpers.graph_api import APIResponse, EntityAPI
+from ca_pwt.helpers.concurrency import map_in_order
+from ca_pwt.helpers.transport import GraphTransport
+from ca_pwt.helpers.utils import assert_condition, is_guid
 
 _logger = logging.getLogger(__name__)
 
-
-def _graph_api_lookup(functions: list[Callable[[str], APIResponse]], key: str, attrib_name: str) -> str | None:
+# a resolver receives many keys at once and returns the values of the keys (None if it could not resolve them)
+_Resolver = Callable[[list[str]], dict[str, str | None]]
+
+# the nodes of the policies that reference each type of object: (parent node, attributes node, guids node)
+_POLICY_REFERENCES = {
+    "groups": [("users", "excludeGroupNames", "excludeGroups"), ("users", "includeGroupNames", "includeGroups")],
+    "users": [("users", "excludeUserNames", "excludeUsers"), ("users", "includeUserNames", "includeUsers")],
+    "roles": [("users", "excludeRoleNames", "excludeRoles"), ("users", "includeRoleNames", "includeRoles")],
+    # in CA policies, applications are represented by service principals app id
+    "applications": [
+        ("applications", "excludeApplicationNames", "excludeApplications"),
+        ("applications", "includeApplicationNames", "includeApplications"),
+    ],
+}
+
+# the strategies to look up the keys of a type of object in the API (see LookupThresholds)
+_LOOKUP_STRATEGIES = ["point", "bulk", "prefetch"]
+# a few keys are looked up one by one (packed in $batch envelopes), so each response can be cached and reused
+_DEFAULT_POINT_MAX_KEYS = 3
+# many keys are resolved with a listing of all the objects, which takes a request per 999 objects of the tenant
+# instead of a request per 15 keys
+_DEFAULT_PREFETCH_MIN_KEYS = 500
+
+# the most resolvers of a stage that run concurrently (groups, users, roles and applications), which share the
+# jobs threads with the requests they send
+_MAX_CONCURRENT_RESOLVERS = 4
+
+# the API rejects `in` filters on these attributes with values that are not guids (e.g. "All")
+_GUID_ATTRIBUTES = ["id", "appId"]
+
+# the attribute that replaces the id of each type of directory object in the policies
+_DIRECTORY_OBJECT_ATTRIBUTES = {
+    "#microsoft.graph.group": "displayName",
+    "#microsoft.graph.user": "userPrincipalName",
+    "#microsoft.graph.directoryRole": "displayName",
+    "#microsoft.graph.directoryRoleTemplate": "displayName",
+}
+
+
+def _graph_api_batch_lookup(
+    functions: list[Callable[..., list[APIResponse]]], keys: list[str], attrib_name: str
+) -> dict[str, str | None]:
+    """Looks up the keys with each of the functions until one of them finds them and returns their attrib_name.
+    Each function receives all the keys that the previous functions could not resolve (and select=[attrib_name],
+    so only that attribute is downloaded) and returns one response per key"""
+    result: dict[str, str | None] = dict.fromkeys(keys)
+    pending = keys
     for func in functions:
-        response = func(key)
-        if response.success:
-            return response.json()[attrib_name]
+        if not pending:
+            break
+        not_found = []
+        for key, response in zip(pending, func(pending, select=[attrib_name])):
+            if response.success:
+                result[key] = response.json()[attrib_name]
+            else:
+                not_found.append(key)
+        pending = not_found
+    for key in pending:
+        _logger.warning(f"Could not lookup '{key}' with {[func.__name__ for func in functions]}.")
+    return result
+
+
+def _graph_api_bulk_lookup(
+    api: EntityAPI,
+    keys: list[str],
+    key_attrib_name: str,
+    attrib_name: str,
+    fallback_functions: list[Callable[..., list[APIResponse]]] | None = None,
+    *,
+    by_listing: bool = False,
+) -> dict[str, str | None]:
+    """Resolves all the keys with a few `key_attrib_name in (...)` requests (see EntityAPI.resolve_keys), or with
+    a paged listing of all the entities if by_listing is True (see EntityAPI.resolve_keys_by_listing).
+    Ambiguous keys are reported and resolved to the first entity found, as the single lookups do.
+    Missing keys are looked up with the fallback functions (see _graph_api_batch_lookup), if any"""
+    result: dict[str, str | None] = dict.fromkeys(keys)
+    if key_attrib_name in _GUID_ATTRIBUTES:
+        resolvable_keys = [key for key in keys if is_guid(key)]
+        not_resolvable_keys = [key for key in keys if not is_guid(key)]
+    else:
+        resolvable_keys, not_resolvable_keys = keys, []
+
+    missing = not_resolvable_keys
+    if resolvable_keys:
+        if by_listing:
+            resolution = api.resolve_keys_by_listing(resolvable_keys, key_attrib_name, attrib_name)
         else:
-            _logger.warning(f"Could not lookup '{key}' with {func.__name__}. Response: {response}")
-    return None
+            resolution = api.resolve_keys(resolvable_keys, key_attrib_name, attrib_name)
+        for key, values in resolution.ambiguous.items():
+            _logger.warning(f"'{key}' matches {len(values)} entities by {key_attrib_name}: {values}. Using {values[0]}")
+        result.update(resolution.found)
+        missing = missing + resolution.missing
+
+    if missing:
+        if fallback_functions:
+            result.update(_graph_api_batch_lookup(fallback_functions, missing, attrib_name))
+        else:
+            _logger.warning(f"Could not lookup {missing} by {key_attrib_name}.")
+    return result
 
 
-def _replace_with_key_value_lookup(
-    parent_node: dict,
-    key_value_pairs: list[tuple[str, str]],
-    lookup_func: Callable[[str], str | None],
-    lookup_cache: dict | None = None,
-) -> dict:
-    """
-    Creates a node in parent_node with the name values_node_name with the equivalent values of
-    the node with the name keys_node_name, but looked up with the lookup_func.
-    Usefull for replacing groupIds with groupNames (or vice versa) and similar scenarios.
+def _role_index_lookup(
+    role_index: DirectoryRoleIndex,
+    roles_api: DirectoryRolesAPI,
+    role_templates_api: DirectoryRoleTemplatesAPI,
+    keys: list[str],
+    *,
+    to_guids: bool,
+) -> dict[str, str | None]:
+    """Resolves role display names (to_guids=True) or ids (to_guids=False) with the role index of the tenant,
+    which lists the directory roles and role templates only once"""
+    result = role_index.resolve(roles_api, role_templates_api, keys, to_guids=to_guids)
+    missing = [key for key, value in result.items() if value is None]
+    if missing:
+        _logger.warning(f"Could not lookup roles {missing} in the directory roles and role templates.")
+    return result
+
+
+def _graph_api_directory_objects_lookup(api: DirectoryObjectsAPI, keys: list[str]) -> dict[str, str | None]:
+    """Resolves ids of any type (groups, users, roles) with a few getByIds requests, classifying each object
+    by its @odata.type to pick the attribute that replaces it. Only the ids that were resolved are returned,
+    so the others can still be looked up by type"""
+    result: dict[str, str | None] = {}
+    guid_keys = [key for key in keys if is_guid(key)]
+    if not guid_keys:
+        return result
+    for key, response in zip(guid_keys, api.get_by_ids(guid_keys)):
+        if response.success:
+            entity = response.json()
+            attrib_name = _DIRECTORY_OBJECT_ATTRIBUTES.get(entity.get(_ODATA_TYPE))
+            if attrib_name and entity.get(attrib_name):
+                result[key] = entity[attrib_name]
+    return result
+
+
+class LookupThresholds:
+    """The thresholds that choose how the unique keys of a type of object are looked up in the API,
+    depending on how many they are:
+    - point: a request per key (packed in $batch envelopes), for a few keys
+    - bulk: a request per 15 keys, with `in` filters (packed in $batch envelopes)
+    - prefetch: a paged listing of all the objects of the type (only the looked up attributes), for many keys
     """
-    if lookup_cache is None:
-        lookup_cache = {}
-
-    for keys_node_name, values_node_name in key_value_pairs:
-        _logger.debug(f"Replacing {keys_node_name} with {values_node_name}...")
-        if keys_node_name in parent_node:
-            # create the values node if it doesn't exist
-            if values_node_name not in parent_node:
-                parent_node[values_node_name] = []
-
-            # this will contain the keys that have been mapped
-            mapped_elements = []
-
-            keys = parent_node[keys_node_name]
-            for key in keys:
-                if key in lookup_cache:
-                    value = lookup_cache[key]
-                    _logger.debug(f"Found {key} in cache: {value}")
+
+    def __init__(
+        self,
+        *,
+        point_max_keys: int = _DEFAULT_POINT_MAX_KEYS,
+        prefetch_min_keys: int = _DEFAULT_PREFETCH_MIN_KEYS,
+    ):
+        """Creates a LookupThresholds object
+        - point_max_keys: the maximum number of keys looked up one by one
+        - prefetch_min_keys: the minimum number of keys resolved with a listing of all the objects
+        """
+        assert_condition(point_max_keys >= 0, "point_max_keys cannot be negative")
+        assert_condition(prefetch_min_keys > point_max_keys, "prefetch_min_keys must be greater than point_max_keys")
+        self.point_max_keys = point_max_keys
+        self.prefetch_min_keys = prefetch_min_keys
+
+    def choose_strategy(self, keys_count: int, strategies: list[str]) -> str:
+        """Returns the strategy to look up keys_count keys, among the strategies available for their type"""
+        if keys_count <= self.point_max_keys and "point" in strategies:
+            return "point"
+        if keys_count >= self.prefetch_min_keys and "prefetch" in strategies:
+            return "prefetch"
+        if "bulk" in strategies:
+            return "bulk"
+        return strategies[0]
+
+
+_default_lookup_thresholds: LookupThresholds | None = None
+_default_lookup_thresholds_lock = threading.Lock()
+
+
+def get_default_lookup_thresholds() -> LookupThresholds:
+    """Returns the lookup thresholds used by the policy mappings in this process, creating them on first use"""
+    global _default_lookup_thresholds  # noqa: PLW0603
+    with _default_lookup_thresholds_lock:
+        if _default_lookup_thresholds is None:
+            _default_lookup_thresholds = LookupThresholds()
+        return _default_lookup_thresholds
+
+
+def set_default_lookup_thresholds(lookup_thresholds: LookupThresholds | None) -> LookupThresholds | None:
+    """Replaces the lookup thresholds used by the policy mappings in this process.
+    Returns the previous lookup thresholds (if any)"""
+    global _default_lookup_thresholds  # noqa: PLW0603
+    with _default_lookup_thresholds_lock:
+        previous = _default_lookup_thresholds
+        _default_lookup_thresholds = lookup_thresholds
+        return previous
+
+
+def _get_strategy_resolver(
+    reference_type: str, strategies: dict[str, _Resolver], lookup_thresholds: LookupThresholds
+) -> _Resolver:
+    """Returns a resolver that looks up the keys of a type of reference with the strategy that suits their number"""
+    assert_condition(all(strategy in _LOOKUP_STRATEGIES for strategy in strategies), "unknown lookup strategy")
+
+    def resolve(keys: list[str]) -> dict[str, str | None]:
+        strategy = lookup_thresholds.choose_strategy(len(keys), list(strategies))
+        _logger.info(f"Looking up {len(keys)} {reference_type} with the {strategy} strategy")
+        return strategies[strategy](keys)
+
+    return resolve
+
+
+def _get_api_jobs(jobs: int) -> int:
+    """Returns the number of threads of each API used by the resolvers: the resolvers of a stage already run
+    concurrently, so each API gets its share of the jobs threads (instead of up to jobs x jobs threads in total)"""
+    return max(jobs // _MAX_CONCURRENT_RESOLVERS, 1)
+
+
+def _get_reference_nodes(reference_type: str, *, to_guids: bool) -> list[tuple[str, str, str]]:
+    """Returns the nodes of the policies that reference the type of object: (parent node, keys node, values node)"""
+    return [
+        (
+            (parent_node_name, attrs_node_name, guids_node_name)
+            if to_guids
+            else (parent_node_name, guids_node_name, attrs_node_name)
+        )
+        for parent_node_name, attrs_node_name, guids_node_name in _POLICY_REFERENCES[reference_type]
+    ]
+
+
+def _collect_references(
+    policies: list[dict], reference_types: list[str], lookup_cache: LookupCache, *, to_guids: bool
+) -> dict[str, list[str]]:
+    """First pass: returns the unique keys of each type of reference found in the policies (in the order they
+    appear) that are not in the lookup cache yet.
+    When replacing guids, the keys that are not guids (keywords like "All" or "GuestsOrExternalUsers") are skipped,
+    as they do not reference any object"""
+    references: dict[str, list[str]] = {}
+    for reference_type in reference_types:
+        # a dict is used to get the unique keys while keeping their order
+        unique_keys: dict[str, None] = {}
+        for parent_node_name, keys_node_name, _ in _get_reference_nodes(reference_type, to_guids=to_guids):
+            for policy in policies:
+                for key in policy["conditions"][parent_node_name].get(keys_node_name) or []:
+                    if not to_guids and not is_guid(key):
+                        continue
+                    if not lookup_cache.has(reference_type, key, to_guids=to_guids):
+                        unique_keys[key] = None
+        references[reference_type] = list(unique_keys)
+    return references
+
+
+def _resolve_references(
+    references: dict[str, list[str]],
+    stages: list[dict[tuple[str, ...], _Resolver]],
+    lookup_cache: LookupCache,
+    *,
+    to_guids: bool,
+    jobs: int = 1,
+) -> LookupCache:
+    """Second pass: resolves the keys of each type of reference in bulk, stage by stage. Each resolver of a stage
+    receives at once all the keys of its types of reference that the previous stages could not resolve
+    (so a resolver may serve several types, e.g. getByIds). The resolvers of a stage are independent, so they
+    are called concurrently if jobs is greater than 1. Keys that could not be resolved are cached as None,
+    so they are not looked up again"""
+    pending = {reference_type: keys for reference_type, keys in references.items() if keys}
+    for stage in stages:
+        resolvers = [
+            (reference_types, resolver)
+            for reference_types, resolver in stage.items()
+            if any(reference_type in pending for reference_type in reference_types)
+        ]
+
+        def resolve(resolver_item: tuple[tuple[str, ...], _Resolver]) -> dict[str, str | None]:
+            reference_types, resolver = resolver_item
+            # a dict is used to get the unique keys while keeping their order
+            keys = list(
+                dict.fromkeys(key for reference_type in reference_types for key in pending.get(reference_type, []))
+            )
+            _logger.debug(f"Resolving {len(keys)} keys of {list(reference_types)}...")
+            return resolver(keys)
+
+        for (reference_types, _), values in zip(resolvers, map_in_order(resolve, resolvers, jobs)):
+            for reference_type in reference_types:
+                if reference_type not in pending:
+                    continue
+                not_resolved = []
+                for key in pending[reference_type]:
+                    value = values.get(key)
+                    if value is None:
+                        not_resolved.append(key)
+                    else:
+                        lookup_cache.set(reference_type, key, value, to_guids=to_guids)
+                if not_resolved:
+                    pending[reference_type] = not_resolved
                 else:
-                    _logger.debug(f"Looking up {key}...")
-                    value = lookup_func(key)
-                    lookup_cache[key] = value
-
-                # we'll only add the value if it's not None
-                if value:
-                    parent_node[values_node_name].append(value)
-                    mapped_elements.append(key)
-
-            # remove all keys that have been mapped
-            for key in mapped_elements:
-                keys.remove(key)
-
-            _logger.debug(f"Keys for {keys_node_name}: {keys}")
-            _logger.debug(f"values for {values_node_name}: {parent_node[values_node_name]}")
-
-            # remove the keys node if it's empty
-            if not keys:
-                _logger.debug(f"Removing {keys_node_name}...")
-                parent_node.pop(keys_node_name)
-
-            # remove the values node if it's empty
-            if not parent_node[values_node_name]:
-                _logger.debug(f"Removing {values_node_name}...")
-                parent_node.pop(values_node_name)
+                    pending.pop(reference_type)
+
+    for reference_type, keys in pending.items():
+        for key in keys:
+            lookup_cache.set(reference_type, key, None, to_guids=to_guids)
     return lookup_cache
 
 
-def load_lookup_cache_from_file(
-    file_path: str,
+def _rewrite_references(
+    policies: list[dict], reference_types: list[str], lookup_cache: LookupCache, *, to_guids: bool
+) -> list[dict]:
+    """Third pass: replaces the keys of the policies with their values in the lookup cache, without any lookup.
+    e.g.: "includeGroupNames": ["<group-name>"] -> "includeGroups": ["<group-id>"]
+    The keys that could not be resolved are left in their node"""
+    for policy in policies:
+        for reference_type in reference_types:
+            for parent_node_name, keys_node_name, values_node_name in _get_reference_nodes(
+                reference_type, to_guids=to_guids
+            ):
+                parent_node = policy["conditions"][parent_node_name]
+                if keys_node_name not in parent_node:
+                    continue
+                values = parent_node.get(values_node_name, [])
+                not_resolved = []
+                for key in parent_node[keys_node_name]:
+                    value = lookup_cache.get(reference_type, key, to_guids=to_guids)
+                    if value:
+                        values.append(value)
+                    else:
+                        not_resolved.append(key)
+                # the nodes are removed if they end up empty
+                parent_node[values_node_name] = values
+                if not values:
+                    parent_node.pop(values_node_name)
+                parent_node[keys_node_name] = not_resolved
+                if not not_resolved:
+                    parent_node.pop(keys_node_name)
+    return policies
+
+
+def _map_references(
+    policies: list[dict],
+    reference_types: list[str],
+    stages: list[dict[tuple[str, ...], _Resolver]],
+    lookup_cache: LookupCache,
     *,
-    reverse_format: bool = False,
-) -> dict[str, str]:
+    to_guids: bool,
+    jobs: int = 1,
+) -> list[dict]:
+    """Maps the references of the policies in three passes: collects the unique keys of all the policies,
+    resolves them in bulk and rewrites the policies. So the number of requests depends on the number of
+    unique keys, not on the number of policies or on their order"""
+    references = _collect_references(policies, reference_types, lookup_cache, to_guids=to_guids)
+    _logger.info(f"Resolving {sum(len(keys) for keys in references.values())} unique references...")
+    _resolve_references(references, stages, lookup_cache, to_guids=to_guids, jobs=jobs)
+    return _rewrite_references(policies, reference_types, lookup_cache, to_guids=to_guids)
+
+
+def load_lookup_cache_from_file(file_path: str) -> LookupCache:
     """Loads a lookup cache from a json file
-    The file should be a dictionary with the keys being the values to lookup and the values being the values to replace
-    if reverse_format is True, the keys and values will be reversed,
-    so the keys will be the values to replace and the values
-    will be the values to lookup"""
-
-    # check if the file exists
-    if not os.path.exists(file_path):
-        _logger.warning(f"File {file_path} does not exist. Returning empty lookup cache.")
-        return {}
-
-    with open(file_path) as f:
-        data = json.load(f)
-        if reverse_format:
-            return {v: k for k, v in data.items()}
-        else:
-            return data
+    The file should be a dictionary with the attributes of the objects by their guids for each type of object
+    (groups, users, roles and applications), as saved by LookupCache.save. The same file serves both directions.
+    e.g. {"groups": {"00000000-0000-0000-0000-000000000000": "All Users"}}
+    The built-in roles and apps are layered under the loaded cache (see create_lookup_cache)"""
+    return LookupCache.load(file_path, builtins=True)
+
+
+def create_lookup_cache() -> LookupCache:
+    """Creates a lookup cache with known objects, like the built-in roles and apps,
+    so we don't have to make a call to the graph api for each one of them.
+    They are layered under the cache (loaded on first use and shared by all the caches), not copied into it"""
+    return LookupCache(builtins=True)
+
+
+def _get_reference_types(
+    *, lookup_groups: bool, lookup_users: bool, lookup_roles: bool, lookup_applications: bool
+) -> list[str]:
+    """Returns the types of reference to look up"""
+    return [
+        reference_type
+        for reference_type, lookup in [
+            ("groups", lookup_groups),
+            ("users", lookup_users),
+            ("roles", lookup_roles),
+            ("applications", lookup_applications),
+        ]
+        if lookup
+    ]
 
 
 def replace_attrs_with_guids_in_policies(
     access_token: str,
     policies: list[dict],
-    lookup_cache: dict[str, str] | None = None,
+    lookup_cache: LookupCache | None = None,
     *,
     lookup_groups: bool = True,
     lookup_users: bool = True,
     lookup_roles: bool = True,
     lookup_applications: bool = True,
+    jobs: int = 1,
+    directory_index: DirectoryIndex | None = None,
+    transport: GraphTransport | None = None,
+    lookup_thresholds: LookupThresholds | None = None,
 ) -> list[dict]:
     """Replaces attributes with guids in a policies file (e.g. group names by group ids)
     This is useful when you want to import a policies file that was exported from
     a different tenant and groups have different ids.
+    The unique attributes of all the policies are resolved together, many per request, before the policies
+    are rewritten. If jobs is greater than 1, independent lookups are sent concurrently by a pool of jobs threads.
+    If a directory index is specified, groups, users and applications are resolved against it first,
+    and only the keys that are not found there are looked up in the API.
+    The keys of each type are looked up one by one, many per request or with a listing of all the objects of the
+    type, depending on how many they are (see LookupThresholds; default: get_default_lookup_thresholds()).
     """
 
     _logger.info("Replacing attributes with guids...")
@@ -131,71 +432,87 @@ def replace_attrs_with_guids_in_policies(
         _logger.debug(f"Lookup cache: {lookup_cache}")
 
     if lookup_cache is None:
-        # we'll initialize the lookup cache with known objects, like the built-in roles
-        # so we don't have to make a call to the graph api for each one of them
-        lookup_cache = deepcopy(_BUILTIN_ROLES_NAME_ID)
-        # append the built-in apps
-        lookup_cache.update(_BUILTIN_APPS_NAME_ID)
-
-    groups_api = GroupsAPI(access_token=access_token)
-    users_api = UsersAPI(access_token=access_token)
-    dir_roles_api: DirectoryRolesAPI = DirectoryRolesAPI(access_token)
-    dir_role_templates_api: DirectoryRoleTemplatesAPI = DirectoryRoleTemplatesAPI(access_token)
-    svc_principals_api = ServicePrincipalsAPI(access_token=access_token)
-
-    for policy in policies:
-        # let's transform groupIds to groupNames if any
-        conditions = policy["conditions"]
-        users = conditions["users"]
-        if lookup_groups:
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=users,
-                key_value_pairs=[
-                    ("excludeGroupNames", "excludeGroups"),
-                    ("includeGroupNames", "includeGroups"),
-                ],
-                lookup_func=lambda key: _graph_api_lookup([groups_api.get_by_display_name], key, "id"),
-                lookup_cache=lookup_cache,
-            )
-        if lookup_users:
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=users,
-                key_value_pairs=[
-                    ("excludeUserNames", "excludeUsers"),
-                    ("includeUserNames", "includeUsers"),
-                ],
-                lookup_func=lambda key: _graph_api_lookup([users_api.get_by_id], key, "id"),
-                lookup_cache=lookup_cache,
-            )
-        if lookup_roles:
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=users,
-                key_value_pairs=[
-                    ("includeRoleNames", "includeRoles"),
-                    ("excludeRoleNames", "excludeRoles"),
-                ],
-                lookup_func=lambda key: _graph_api_lookup(
-                    [
-                        dir_roles_api.get_by_display_name,
-                        dir_role_templates_api.get_by_display_name,
-                    ],
-                    key,
-                    "id",
+        lookup_cache = create_lookup_cache()
+    if lookup_thresholds is None:
+        lookup_thresholds = get_default_lookup_thresholds()
+
+    api_jobs = _get_api_jobs(jobs)
+    groups_api = GroupsAPI(access_token=access_token, transport=transport, jobs=api_jobs)
+    users_api = UsersAPI(access_token=access_token, transport=transport, jobs=api_jobs)
+    role_index = get_directory_role_index(access_token, transport=transport)
+    dir_roles_api = DirectoryRolesAPI(access_token, transport=transport)
+    dir_role_templates_api = DirectoryRoleTemplatesAPI(access_token, transport=transport)
+    svc_principals_api = ServicePrincipalsAPI(access_token=access_token, transport=transport, jobs=api_jobs)
+
+    stages: list[dict[tuple[str, ...], _Resolver]] = []
+    if directory_index is not None:
+        # resolve the keys against the local index first, without calling the API
+        stages.append(
+            {
+                ("groups",): lambda keys: directory_index.resolve("groups", "displayName", "id", keys),
+                ("users",): lambda keys: directory_index.resolve("users", "userPrincipalName", "id", keys),
+                ("applications",): lambda keys: directory_index.resolve(
+                    "servicePrincipals", "displayName", "appId", keys
                 ),
-                lookup_cache=lookup_cache,
-            )
-        if lookup_applications:
-            applications = conditions["applications"]
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=applications,
-                key_value_pairs=[
-                    ("includeApplicationNames", "includeApplications"),
-                    ("excludeApplicationNames", "excludeApplications"),
-                ],
-                # in CA policies, applications are represented by service principals app id
-                lookup_func=lambda key: _graph_api_lookup([svc_principals_api.get_by_display_name], key, "appId"),
-                lookup_cache=lookup_cache,
-            )
+            }
+        )
+    # then the remaining keys by type, with the strategy that suits their number (see LookupThresholds),
+    # packing the lookups in $batch requests
+    stages.append(
+        {
+            ("groups",): _get_strategy_resolver(
+                "groups",
+                {
+                    "point": lambda keys: _graph_api_batch_lookup([groups_api.get_by_display_names], keys, "id"),
+                    "bulk": lambda keys: _graph_api_bulk_lookup(groups_api, keys, "displayName", "id"),
+                    "prefetch": lambda keys: _graph_api_bulk_lookup(
+                        groups_api, keys, "displayName", "id", by_listing=True
+                    ),
+                },
+                lookup_thresholds,
+            ),
+            # users can also be referenced by id, so the keys that are not UPNs are looked up by id
+            # (the users endpoint accepts both)
+            ("users",): _get_strategy_resolver(
+                "users",
+                {
+                    "point": lambda keys: _graph_api_batch_lookup([users_api.get_by_ids], keys, "id"),
+                    "bulk": lambda keys: _graph_api_bulk_lookup(
+                        users_api, keys, "userPrincipalName", "id", [users_api.get_by_ids]
+                    ),
+                    "prefetch": lambda keys: _graph_api_bulk_lookup(
+                        users_api, keys, "userPrincipalName", "id", [users_api.get_by_ids], by_listing=True
+                    ),
+                },
+                lookup_thresholds,
+            ),
+            # there are only a few roles, so they are all listed once and resolved locally
+            ("roles",): lambda keys: _role_index_lookup(
+                role_index, dir_roles_api, dir_role_templates_api, keys, to_guids=True
+            ),
+            ("applications",): _get_strategy_resolver(
+                "applications",
+                {
+                    "point": lambda keys: _graph_api_batch_lookup(
+                        [svc_principals_api.get_by_display_names], keys, "appId"
+                    ),
+                    "bulk": lambda keys: _graph_api_bulk_lookup(svc_principals_api, keys, "displayName", "appId"),
+                    "prefetch": lambda keys: _graph_api_bulk_lookup(
+                        svc_principals_api, keys, "displayName", "appId", by_listing=True
+                    ),
+                },
+                lookup_thresholds,
+            ),
+        }
+    )
+
+    reference_types = _get_reference_types(
+        lookup_groups=lookup_groups,
+        lookup_users=lookup_users,
+        lookup_roles=lookup_roles,
+        lookup_applications=lookup_applications,
+    )
+    policies = _map_references(policies, reference_types, stages, lookup_cache, to_guids=True, jobs=jobs)
 
     if _logger.isEnabledFor(logging.DEBUG):
         _logger.debug(f"Source: {policies}")
@@ -206,18 +523,28 @@ def replace_attrs_with_guids_in_policies(
 def replace_guids_with_attrs_in_policies(
     access_token: str,
     policies: list[dict],
-    lookup_cache: dict[str, str] | None = None,
+    lookup_cache: LookupCache | None = None,
     *,
     lookup_groups: bool = True,
     lookup_users: bool = True,
     lookup_roles: bool = True,
     lookup_applications: bool = True,
+    jobs: int = 1,
+    directory_index: DirectoryIndex | None = None,
+    transport: GraphTransport | None = None,
+    lookup_thresholds: LookupThresholds | None = None,
 ) -> list[dict]:
     """Replaces guids with attributes in a policies file
     e.g.: "includeGroups": ["<group-id>"] -> "includeGroupNames": ["<group-name>"]
     This is useful when you want to export a policies file that can be imported in a
     different tenant and groups have different ids or when you want to maintain a policies
     file in a source control system and you want to use group names instead of ids.
+    The unique guids of all the policies are resolved together, many per request, before the policies
+    are rewritten. If jobs is greater than 1, independent lookups are sent concurrently by a pool of jobs threads.
+    If a directory index is specified, groups, users and applications are resolved against it first,
+    and only the keys that are not found there are looked up in the API.
+    The keys of each type are looked up one by one, many per request or with a listing of all the objects of the
+    type, depending on how many they are (see LookupThresholds; default: get_default_lookup_thresholds()).
     """
     _logger.info("Replacing guids with attributes in policies file...")
 
@@ -225,68 +552,101 @@ def replace_guids_with_attrs_in_policies(
         _logger.debug(f"Source: {policies}")
 
     if lookup_cache is None:
-        # we'll initialize the lookup cache with known objects, like the built-in roles
-        # so we don't have to make a call to the graph api for each one of them
-        lookup_cache = deepcopy(_BUILTIN_ROLES_ID_NAME)
-        # append the built-in apps
-        lookup_cache.update(_BUILTIN_APPS_ID_NAME)
-
-    groups_api: GroupsAPI = GroupsAPI(access_token)
-    users_api: UsersAPI = UsersAPI(access_token)
-    dir_roles_api: DirectoryRolesAPI = DirectoryRolesAPI(access_token)
-    dir_role_templates_api: DirectoryRoleTemplatesAPI = DirectoryRoleTemplatesAPI(access_token)
-    svc_principals_api: ServicePrincipalsAPI = ServicePrincipalsAPI(access_token)
-
-    for policy in policies:
-        # let's transform groupIds to groupNames if any
-        conditions = policy["conditions"]
-        users = conditions["users"]
-        if lookup_groups:
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=users,
-                key_value_pairs=[
-                    ("excludeGroups", "excludeGroupNames"),
-                    ("includeGroups", "includeGroupNames"),
-                ],
-                lookup_func=lambda key: _graph_api_lookup([groups_api.get_by_id], key, "displayName"),
-                lookup_cache=lookup_cache,
-            )
-        if lookup_users:
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=users,
-                key_value_pairs=[
-                    ("excludeUsers", "excludeUserNames"),
-                    ("includeUsers", "includeUserNames"),
-                ],
-                lookup_func=lambda key: _graph_api_lookup([users_api.get_by_id], key, "userPrincipalName"),
-                lookup_cache=lookup_cache,
-            )
-        if lookup_roles:
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=users,
-                key_value_pairs=[
-                    ("excludeRoles", "excludeRoleNames"),
-                    ("includeRoles", "includeRoleNames"),
-                ],
-                lookup_func=lambda key: _graph_api_lookup(
-                    [dir_roles_api.get_by_id, dir_role_templates_api.get_by_id],
-                    key,
-                    "displayName",
+        lookup_cache = create_lookup_cache()
+    if lookup_thresholds is None:
+        lookup_thresholds = get_default_lookup_thresholds()
+
+    api_jobs = _get_api_jobs(jobs)
+    groups_api = GroupsAPI(access_token, transport=transport, jobs=api_jobs)
+    users_api = UsersAPI(access_token, transport=transport, jobs=api_jobs)
+    role_index = get_directory_role_index(access_token, transport=transport)
+    dir_roles_api = DirectoryRolesAPI(access_token, transport=transport)
+    dir_role_templates_api = DirectoryRoleTemplatesAPI(access_token, transport=transport)
+    svc_principals_api = ServicePrincipalsAPI(access_token, transport=transport, jobs=api_jobs)
+    directory_objects_api = DirectoryObjectsAPI(access_token, transport=transport, jobs=api_jobs)
+
+    stages: list[dict[tuple[str, ...], _Resolver]] = []
+    if directory_index is not None:
+        # resolve the keys against the local index first, without calling the API
+        stages.append(
+            {
+                ("groups",): lambda keys: directory_index.resolve("groups", "id", "displayName", keys),
+                ("users",): lambda keys: directory_index.resolve("users", "id", "userPrincipalName", keys),
+                ("applications",): lambda keys: directory_index.resolve(
+                    "servicePrincipals", "appId", "displayName", keys
                 ),
-                lookup_cache=lookup_cache,
-            )
-        if lookup_applications:
-            applications = conditions["applications"]
-            lookup_cache = _replace_with_key_value_lookup(
-                parent_node=applications,
-                key_value_pairs=[
-                    ("excludeApplications", "excludeApplicationNames"),
-                    ("includeApplications", "includeApplicationNames"),
-                ],
-                # in CA policies, applications are represented by service principals app id
-                lookup_func=lambda key: _graph_api_lookup([svc_principals_api.get_by_app_id], key, "displayName"),
-                lookup_cache=lookup_cache,
-            )
+            }
+        )
+    # then the ids of all the groups and users at once, up to 1000 ids per request, and the roles (they are all
+    # listed once and resolved locally)
+    stages.append(
+        {
+            ("groups", "users"): lambda keys: _graph_api_directory_objects_lookup(directory_objects_api, keys),
+            ("roles",): lambda keys: _role_index_lookup(
+                role_index, dir_roles_api, dir_role_templates_api, keys, to_guids=False
+            ),
+        }
+    )
+    # then the remaining keys by type, with the strategy that suits their number (see LookupThresholds),
+    # packing the lookups in $batch requests
+    stages.append(
+        {
+            ("groups",): _get_strategy_resolver(
+                "groups",
+                {
+                    "point": lambda keys: _graph_api_batch_lookup([groups_api.get_by_ids], keys, "displayName"),
+                    "bulk": lambda keys: _graph_api_bulk_lookup(
+                        groups_api, keys, "id", "displayName", [groups_api.get_by_ids]
+                    ),
+                    "prefetch": lambda keys: _graph_api_bulk_lookup(
+                        groups_api, keys, "id", "displayName", [groups_api.get_by_ids], by_listing=True
+                    ),
+                },
+                lookup_thresholds,
+            ),
+            ("users",): _get_strategy_resolver(
+                "users",
+                {
+                    "point": lambda keys: _graph_api_batch_lookup([users_api.get_by_ids], keys, "userPrincipalName"),
+                    "bulk": lambda keys: _graph_api_bulk_lookup(
+                        users_api, keys, "id", "userPrincipalName", [users_api.get_by_ids]
+                    ),
+                    "prefetch": lambda keys: _graph_api_bulk_lookup(
+                        users_api, keys, "id", "userPrincipalName", [users_api.get_by_ids], by_listing=True
+                    ),
+                },
+                lookup_thresholds,
+            ),
+            ("applications",): _get_strategy_resolver(
+                "applications",
+                {
+                    "point": lambda keys: _graph_api_batch_lookup(
+                        [svc_principals_api.get_by_app_ids], keys, "displayName"
+                    ),
+                    "bulk": lambda keys: _graph_api_bulk_lookup(
+                        svc_principals_api, keys, "appId", "displayName", [svc_principals_api.get_by_app_ids]
+                    ),
+                    "prefetch": lambda keys: _graph_api_bulk_lookup(
+                        svc_principals_api,
+                        keys,
+                        "appId",
+                        "displayName",
+                        [svc_principals_api.get_by_app_ids],
+                        by_listing=True,
+                    ),
+                },
+                lookup_thresholds,
+            ),
+        }
+    )
+
+    reference_types = _get_reference_types(
+        lookup_groups=lookup_groups,
+        lookup_users=lookup_users,
+        lookup_roles=lookup_roles,
+        lookup_applications=lookup_applications,
+    )
+    policies = _map_references(policies, reference_types, stages, lookup_cache, to_guids=False, jobs=jobs)
 
     if _logger.isEnabledFor(logging.DEBUG):
         _logger.debug(f"Output: {policies}")
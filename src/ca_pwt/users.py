@@ -1,23 +1,19 @@
-from ca_pwt.helpers.graph_api import APIResponse, EntityAPI
-from ca_pwt.helpers.utils import assert_condition
+from ca_pwt.helpers.graph_api import EntityAPI
 
 
 class UsersAPI(EntityAPI):
     def _get_entity_path(self) -> str:
         return "users"
 
-    def get_by_id(self, entity_id: str) -> APIResponse:
-        """Returns a user by their ID which can be the id attribute
+    def _get_entity_url(self, entity_id: str) -> str:
+        """Returns the url of a user by their ID which can be the id attribute
         or the userPrincipalName attribute
         """
 
-        assert_condition(entity_id, "entity_id cannot be None")
-
         # encode the hash symbol in the entity_id
         entity_id = entity_id.replace("#", "%23")
 
         if entity_id.startswith("$"):
-            url = f"{self.entity_url}({entity_id})"
+            return f"{self.entity_url}({entity_id})"
         else:
-            url = f"{self.entity_url}/{entity_id}"
-        return self._request_get(url)
+            return f"{self.entity_url}/{entity_id}"
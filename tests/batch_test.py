@@ -0,0 +1,131 @@
+import json
+import re
+from urllib.parse import unquote
+from src.ca_pwt.helpers.graph_api import BatchAPI, BatchRequest, _build_in_filters
+from src.ca_pwt.groups import GroupsAPI
+from src.ca_pwt.users import UsersAPI
+from src.ca_pwt.policies_mappings import _graph_api_batch_lookup, _graph_api_bulk_lookup
+from .fake_graph import create_fake_transport
+
+
+def _batch_handler(sub_handler):
+    """Creates a handler that answers $batch envelopes calling sub_handler for each sub-request"""
+
+    def handler(request):
+        envelope = json.loads(request.body)
+        responses = [{"id": sub_request["id"], **sub_handler(sub_request)} for sub_request in envelope["requests"]]
+        return 200, {"responses": list(reversed(responses))}, {}
+
+    return handler
+
+
+def test_batch_splits_requests_in_envelopes_of_20():
+    transport, adapter = create_fake_transport(
+        _batch_handler(lambda sub_request: {"status": 200, "body": {"id": sub_request["url"].split("/")[-1]}})
+    )
+    groups_api = GroupsAPI("token", transport=transport)
+    ids = [str(index) for index in range(45)]
+
+    responses = groups_api.get_by_ids(ids)
+
+    assert len(adapter.requests) == 3
+    assert [len(json.loads(request.body)["requests"]) for request in adapter.requests] == [20, 20, 5]
+    assert [response.json()["id"] for response in responses] == ids
+    assert all(response.success for response in responses)
+    assert json.loads(adapter.requests[0].body)["requests"][0]["url"] == "/groups/0"
+
+
+def test_batch_retries_only_throttled_sub_requests(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    attempts: dict[str, int] = {}
+
+    def sub_handler(sub_request):
+        url = sub_request["url"]
+        attempts[url] = attempts.get(url, 0) + 1
+        if url == "/groups/throttled" and attempts[url] == 1:
+            return {"status": 429, "headers": {"Retry-After": "1"}, "body": {"error": {"code": "TooManyRequests"}}}
+        if url == "/groups/missing":
+            return {"status": 404, "body": {"error": {"code": "Request_ResourceNotFound"}}}
+        return {"status": 200, "body": {"id": url}}
+
+    transport, adapter = create_fake_transport(_batch_handler(sub_handler))
+    batch_api = BatchAPI("token", transport=transport)
+
+    responses = batch_api.execute([BatchRequest("GET", f"/groups/{key}") for key in ["ok", "throttled", "missing"]])
+
+    assert [response.status_code for response in responses] == [200, 200, 404]
+    assert attempts == {"/groups/ok": 1, "/groups/throttled": 2, "/groups/missing": 1}
+    assert len(json.loads(adapter.requests[1].body)["requests"]) == 1
+
+
+def test_batch_lookups_select_only_the_looked_up_attribute():
+    transport, adapter = create_fake_transport(
+        _batch_handler(lambda _: {"status": 200, "body": {"id": "1", "displayName": "test"}})
+    )
+    groups_api = GroupsAPI("token", transport=transport)
+
+    assert _graph_api_batch_lookup([groups_api.get_by_ids], ["1"], "displayName") == {"1": "test"}
+    assert json.loads(adapter.requests[0].body)["requests"][0]["url"] == "/groups/1?$select=displayName"
+
+
+def test_batch_request_encodes_filters_and_bodies():
+    request = BatchRequest("post", "https://graph.microsoft.com/v1.0/groups?$filter=displayName eq 'a b'", {"a": 1})
+
+    sub_request = request.to_dict("1")
+
+    assert sub_request["method"] == "POST"
+    assert sub_request["url"] == "/groups?$filter=displayName%20eq%20'a%20b'"
+    assert sub_request["headers"] == {"Content-Type": "application/json"}
+
+
+def test_in_filters_are_chunked_and_quoted():
+    filters = _build_in_filters("displayName", [f"group {index}" for index in range(20)] + ["o'brien"])
+
+    assert len(filters) == 2
+    assert filters[0].startswith("displayName in ('group%200','group%201',")
+    assert filters[1].endswith(",'o%27%27brien')")
+
+
+def test_resolve_keys_reports_missing_and_ambiguous_keys():
+    directory = [
+        {"id": "1", "displayName": "Finance"},
+        {"id": "2", "displayName": "HR"},
+        {"id": "3", "displayName": "hr"},
+    ]
+
+    def sub_handler(sub_request):
+        names = re.search(r"displayName in \((.*)\)", unquote(sub_request["url"])).group(1)
+        names = [name.strip("'").lower() for name in names.split(",")]
+        return {
+            "status": 200,
+            "body": {"value": [group for group in directory if group["displayName"].lower() in names]},
+        }
+
+    transport, adapter = create_fake_transport(_batch_handler(sub_handler))
+    groups_api = GroupsAPI("token", transport=transport)
+
+    resolution = groups_api.resolve_keys(["finance", "HR", "Sales"], "displayName")
+
+    assert len(adapter.requests) == 1
+    assert resolution.found == {"finance": "1", "HR": "2"}
+    assert resolution.ambiguous == {"HR": ["2", "3"]}
+    assert resolution.missing == ["Sales"]
+
+
+def test_bulk_lookup_falls_back_for_keys_that_are_not_guids():
+    user_id = "00000000-0000-0000-0000-000000000001"
+
+    def sub_handler(sub_request):
+        if sub_request["url"].startswith("/users?"):
+            return {"status": 200, "body": {"value": [{"id": user_id, "userPrincipalName": "a@contoso.com"}]}}
+        return {"status": 404, "body": {"error": {"code": "Request_ResourceNotFound"}}}
+
+    transport, adapter = create_fake_transport(_batch_handler(sub_handler))
+    users_api = UsersAPI("token", transport=transport)
+
+    result = _graph_api_bulk_lookup(users_api, [user_id, "All"], "id", "userPrincipalName", [users_api.get_by_ids])
+
+    assert result == {user_id: "a@contoso.com", "All": None}
+    assert [sub_request["url"] for sub_request in json.loads(adapter.requests[1].body)["requests"]] == [
+        "/users/All?$select=userPrincipalName"
+    ]
@@ -0,0 +1,63 @@
+import os
+import pytest
+from src.ca_pwt.helpers.cassette import Cassette, use_cassette
+from src.ca_pwt.groups import GroupsAPI
+from .fake_graph import create_fake_transport
+
+_GROUP_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _record(tmp_path, handler, func) -> str:
+    """Runs func with a GroupsAPI whose requests are served by the handler and recorded; returns the cassette file"""
+    file_path = os.path.join(tmp_path, "cassette.json")
+    transport, _ = create_fake_transport(handler)
+    cassette = Cassette(file_path)
+    use_cassette(transport, cassette, "record")
+    func(GroupsAPI("secret-token", transport=transport))
+    cassette.save()
+    return file_path
+
+
+def test_recorded_interactions_are_replayed_offline(tmp_path):
+    file_path = _record(
+        tmp_path,
+        lambda _: (201, {"id": _GROUP_ID, "displayName": "Sales"}, {"Content-Type": "application/json"}),
+        lambda groups_api: groups_api.create({"displayName": "Sales", "mailEnabled": False}),
+    )
+    with open(file_path) as f:
+        assert "secret-token" not in f.read()
+
+    transport, adapter = create_fake_transport(lambda _: (500, None, {}))
+    use_cassette(transport, Cassette(file_path), "replay", latency=0)
+    # JSON bodies match regardless of the order of their keys
+    response = GroupsAPI("other-token", transport=transport).create({"mailEnabled": False, "displayName": "Sales"})
+
+    assert response.success
+    assert response.json()["id"] == _GROUP_ID
+    assert adapter.requests == []
+
+
+def test_identical_requests_are_replayed_in_order(tmp_path):
+    display_names = ["Sales", "Finance"]
+    file_path = _record(
+        tmp_path,
+        lambda _: (200, {"id": _GROUP_ID, "displayName": display_names.pop(0)}, {}),
+        lambda groups_api: [groups_api.get_by_id(_GROUP_ID) for _ in range(2)],
+    )
+
+    transport, _ = create_fake_transport(lambda _: (500, None, {}), coalesce_gets=False)
+    use_cassette(transport, Cassette(file_path), "replay", latency=0)
+    groups_api = GroupsAPI("token", transport=transport)
+
+    # the last response is repeated once the recorded ones are exhausted
+    assert [groups_api.get_by_id(_GROUP_ID).json()["displayName"] for _ in range(3)] == ["Sales", "Finance", "Finance"]
+
+
+def test_requests_that_were_not_recorded_fail(tmp_path):
+    file_path = _record(tmp_path, lambda _: (200, {"id": _GROUP_ID}, {}), lambda api: api.get_by_id(_GROUP_ID))
+
+    transport, _ = create_fake_transport(lambda _: (500, None, {}))
+    use_cassette(transport, Cassette(file_path), "replay", latency=0)
+
+    with pytest.raises(ValueError, match="No recorded response"):
+        GroupsAPI("token", transport=transport).get_by_id("other-id")
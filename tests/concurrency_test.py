@@ -0,0 +1,87 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.ca_pwt.helpers.concurrency import SingleFlight, map_in_order
+from src.ca_pwt.lookup_cache import LookupCache
+from src.ca_pwt.policies_mappings import _resolve_references
+
+
+def test_map_in_order_keeps_the_order_of_the_items():
+    def slow_double(value: int) -> int:
+        # later items finish first
+        time.sleep((10 - value) / 1000)
+        return value * 2
+
+    assert map_in_order(slow_double, list(range(10)), jobs=4) == [value * 2 for value in range(10)]
+
+
+def test_map_in_order_uses_threads_only_when_jobs_is_greater_than_1():
+    thread_ids: set[int] = set()
+
+    def record_thread(_: int) -> None:
+        thread_ids.add(threading.get_ident())
+
+    map_in_order(record_thread, list(range(5)), jobs=1)
+    assert thread_ids == {threading.get_ident()}
+
+
+def test_resolve_references_resolves_each_key_once_per_stage():
+    calls: list[tuple[str, list[str]]] = []
+    lock = threading.Lock()
+
+    def resolver(name: str, known: dict[str, str]):
+        def resolve(keys: list[str]) -> dict[str, str | None]:
+            with lock:
+                calls.append((name, keys))
+            return {key: known.get(key) for key in keys}
+
+        return resolve
+
+    stages = [
+        {("groups", "users"): resolver("shared", {"a": "A"})},
+        {("groups",): resolver("groups", {"b": "B"}), ("users",): resolver("users", {"c": "C"})},
+    ]
+    lookup_cache = LookupCache()
+
+    _resolve_references(
+        {"groups": ["a", "b", "unknown"], "users": ["a", "c"]}, stages, lookup_cache, to_guids=False, jobs=4
+    )
+
+    assert lookup_cache.to_dict() == {
+        "groups": {"a": "A", "b": "B"},
+        "users": {"a": "A", "c": "C"},
+        "roles": {},
+        "applications": {},
+    }
+    assert lookup_cache.has("groups", "unknown", to_guids=False)
+    # each stage only receives the keys that the previous stages could not resolve
+    assert sorted(calls) == [("groups", ["b", "unknown"]), ("shared", ["a", "b", "unknown", "c"]), ("users", ["c"])]
+
+
+def test_single_flight_shares_the_call_in_flight():
+    single_flight = SingleFlight()
+    calls = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_call() -> int:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait()
+        return 42
+
+    def follow() -> int:
+        started.wait()
+        return single_flight.do("key", slow_call)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(single_flight.do, "key", slow_call)
+        followers = [executor.submit(follow) for _ in range(3)]
+        # let the followers join the call in flight before releasing it
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    assert results == [42, 42, 42, 42]
+    assert calls == 1
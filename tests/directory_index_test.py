@@ -0,0 +1,139 @@
+import os
+from src.ca_pwt.directory_index import DirectoryIndex
+from src.ca_pwt.helpers.response_cache import _is_cacheable
+from src.ca_pwt.lookup_cache import LookupCache
+from src.ca_pwt.policies_mappings import replace_attrs_with_guids_in_policies
+from .fake_graph import create_fake_token, create_fake_transport
+
+_GROUP_1 = "00000000-0000-0000-0000-000000000001"
+_GROUP_2 = "00000000-0000-0000-0000-000000000002"
+_GROUP_3 = "00000000-0000-0000-0000-000000000003"
+_DELTA_URL = "https://graph.microsoft.com/v1.0/groups/delta"
+
+
+class _DeltaHandler:
+    """Serves the delta queries of groups: the initial listing in two pages, then the pending changes"""
+
+    def __init__(self):
+        self.changes: list[dict] = []
+        self.expired = False
+
+    def __call__(self, request):
+        url = request.url
+        if "deltatoken=" in url:
+            if self.expired:
+                return 410, {"error": {"code": "SyncStateNotFound", "message": "expired"}}, {}
+            body = {"value": self.changes, "@odata.deltaLink": f"{_DELTA_URL}?$deltatoken=2"}
+            self.changes = []
+            return 200, body, {}
+        if "skiptoken=" in url:
+            value = [{"id": _GROUP_2, "displayName": "Finance"}]
+            return 200, {"value": value, "@odata.deltaLink": f"{_DELTA_URL}?$deltatoken=1"}, {}
+        value = [{"id": _GROUP_1, "displayName": "Sales"}]
+        return 200, {"value": value, "@odata.nextLink": f"{_DELTA_URL}?$skiptoken=1"}, {}
+
+
+def _create_index(tmp_path, handler, tenant: str = "tenant") -> tuple[DirectoryIndex, list]:
+    transport, adapter = create_fake_transport(handler)
+    directory_index = DirectoryIndex(
+        os.path.join(tmp_path, "index.json"), create_fake_token(tenant), entity_types=["groups"], transport=transport
+    )
+    return directory_index, adapter.requests
+
+
+def test_refresh_builds_the_index_from_all_the_pages(tmp_path):
+    directory_index, requests = _create_index(tmp_path, _DeltaHandler())
+
+    directory_index.refresh()
+
+    assert requests[0].url == f"{_DELTA_URL}?$select=id,displayName"
+    assert len(requests) == 2
+    assert directory_index.resolve("groups", "displayName", "id", ["SALES", "Finance", "HR"]) == {
+        "SALES": _GROUP_1,
+        "Finance": _GROUP_2,
+    }
+    assert directory_index.resolve("groups", "id", "displayName", [_GROUP_2]) == {_GROUP_2: "Finance"}
+
+
+def test_refresh_applies_only_the_changes(tmp_path):
+    handler = _DeltaHandler()
+    directory_index, requests = _create_index(tmp_path, handler)
+    directory_index.refresh()
+    handler.changes = [
+        {"id": _GROUP_1, "@removed": {"reason": "changed"}},
+        {"id": _GROUP_2, "displayName": "Accounting"},
+        {"id": _GROUP_3, "displayName": "HR"},
+    ]
+
+    directory_index.refresh()
+
+    assert len(requests) == 3
+    assert "deltatoken=1" in requests[2].url
+    assert directory_index.resolve("groups", "displayName", "id", ["Sales", "Finance", "Accounting", "HR"]) == {
+        "Accounting": _GROUP_2,
+        "HR": _GROUP_3,
+    }
+
+
+def test_refresh_rebuilds_the_index_when_the_delta_link_expired(tmp_path):
+    handler = _DeltaHandler()
+    directory_index, requests = _create_index(tmp_path, handler)
+    directory_index.refresh()
+    handler.expired = True
+
+    directory_index.refresh()
+
+    assert [request.url for request in requests[3:]] == [
+        f"{_DELTA_URL}?$select=id,displayName",
+        f"{_DELTA_URL}?$skiptoken=1",
+    ]
+    assert directory_index.resolve("groups", "displayName", "id", ["Sales"]) == {"Sales": _GROUP_1}
+
+
+def test_resolve_leaves_out_ambiguous_keys(tmp_path):
+    handler = _DeltaHandler()
+    directory_index, _ = _create_index(tmp_path, handler)
+    directory_index.refresh()
+    handler.changes = [{"id": _GROUP_3, "displayName": "sales"}]
+    directory_index.refresh()
+
+    assert directory_index.resolve("groups", "displayName", "id", ["Sales", "Finance"]) == {"Finance": _GROUP_2}
+
+
+def test_saved_index_is_only_loaded_for_the_same_tenant(tmp_path):
+    directory_index, _ = _create_index(tmp_path, _DeltaHandler())
+    directory_index.refresh()
+    directory_index.save()
+
+    same_tenant_index, requests = _create_index(tmp_path, _DeltaHandler())
+    same_tenant_index.refresh()
+    other_tenant_index, other_requests = _create_index(tmp_path, _DeltaHandler(), tenant="other")
+    other_tenant_index.refresh()
+
+    assert len(requests) == 1
+    assert "deltatoken=1" in requests[0].url
+    assert len(other_requests) == 2
+
+
+def test_replace_attrs_with_guids_uses_the_directory_index(tmp_path):
+    directory_index, _ = _create_index(tmp_path, _DeltaHandler())
+    directory_index.refresh()
+    policies = [{"conditions": {"users": {"includeGroupNames": ["Sales", "Finance"]}}}]
+
+    policies = replace_attrs_with_guids_in_policies(
+        "token",
+        policies,
+        lookup_groups=True,
+        lookup_users=False,
+        lookup_roles=False,
+        lookup_applications=False,
+        lookup_cache=LookupCache(),
+        directory_index=directory_index,
+    )
+
+    assert policies[0]["conditions"]["users"]["includeGroups"] == [_GROUP_1, _GROUP_2]
+
+
+def test_delta_queries_are_not_cacheable():
+    assert not _is_cacheable(f"{_DELTA_URL}?$deltatoken=1")
+    assert _is_cacheable("https://graph.microsoft.com/v1.0/groups?$filter=displayName eq 'delta'")
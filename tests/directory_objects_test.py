@@ -0,0 +1,69 @@
+import json
+from src.ca_pwt.directory_objects import DirectoryObjectsAPI
+from src.ca_pwt.policies_mappings import _graph_api_directory_objects_lookup
+from .fake_graph import create_fake_transport
+
+_GROUP_ID = "00000000-0000-0000-0000-000000000001"
+_USER_ID = "00000000-0000-0000-0000-000000000002"
+_ROLE_ID = "00000000-0000-0000-0000-000000000003"
+_MISSING_ID = "00000000-0000-0000-0000-000000000004"
+
+_DIRECTORY = {
+    _GROUP_ID: {"@odata.type": "#microsoft.graph.group", "id": _GROUP_ID, "displayName": "Finance"},
+    _USER_ID: {"@odata.type": "#microsoft.graph.user", "id": _USER_ID, "userPrincipalName": "a@contoso.com"},
+    _ROLE_ID: {"@odata.type": "#microsoft.graph.directoryRoleTemplate", "id": _ROLE_ID, "displayName": "Reader"},
+}
+
+
+def _get_by_ids_handler(request):
+    ids = json.loads(request.body)["ids"]
+    return 200, {"value": [_DIRECTORY[entity_id] for entity_id in ids if entity_id in _DIRECTORY]}, {}
+
+
+def test_get_by_ids_sends_up_to_1000_ids_per_request():
+    transport, adapter = create_fake_transport(_get_by_ids_handler)
+    api = DirectoryObjectsAPI("token", transport=transport)
+    ids = [f"00000000-0000-0000-0001-{index:012d}" for index in range(1500)]
+
+    responses = api.get_by_ids(ids, types=["group"])
+
+    assert [len(json.loads(request.body)["ids"]) for request in adapter.requests] == [1000, 500]
+    assert json.loads(adapter.requests[0].body)["types"] == ["group"]
+    assert adapter.requests[0].url.endswith("/directoryObjects/getByIds")
+    assert all(response.status_code == 404 for response in responses)
+
+
+def test_get_by_ids_keeps_the_order_and_skips_keys_that_are_not_guids():
+    transport, adapter = create_fake_transport(_get_by_ids_handler)
+    api = DirectoryObjectsAPI("token", transport=transport)
+
+    responses = api.get_by_ids([_USER_ID, "All", _GROUP_ID, _MISSING_ID], select=["displayName"])
+
+    assert [response.status_code for response in responses] == [200, 404, 200, 404]
+    assert responses[2].json() == {"@odata.type": "#microsoft.graph.group", "displayName": "Finance"}
+    assert json.loads(adapter.requests[0].body)["ids"] == [_USER_ID, _GROUP_ID, _MISSING_ID]
+
+
+def test_get_by_ids_is_retried_on_transient_errors():
+    statuses = [503, 504]
+
+    def handler(request):
+        return (statuses.pop(0), {"error": {}}, {}) if statuses else _get_by_ids_handler(request)
+
+    transport, adapter = create_fake_transport(handler)
+    api = DirectoryObjectsAPI("token", transport=transport)
+
+    [response] = api.get_by_ids([_GROUP_ID])
+
+    assert response.json()["displayName"] == "Finance"
+    assert len(adapter.requests) == 3
+
+
+def test_directory_objects_lookup_classifies_by_type():
+    transport, adapter = create_fake_transport(_get_by_ids_handler)
+    api = DirectoryObjectsAPI("token", transport=transport)
+
+    result = _graph_api_directory_objects_lookup(api, [_GROUP_ID, _USER_ID, _ROLE_ID, _MISSING_ID, "All"])
+
+    assert result == {_GROUP_ID: "Finance", _USER_ID: "a@contoso.com", _ROLE_ID: "Reader"}
+    assert len(adapter.requests) == 1
@@ -0,0 +1,121 @@
+import gc
+import weakref
+from collections.abc import Iterator
+import pytest
+from src.ca_pwt.directory_roles import (
+    DirectoryRoleIndex,
+    DirectoryRolesAPI,
+    DirectoryRoleTemplatesAPI,
+    get_directory_role_index,
+)
+from src.ca_pwt.helpers.retry import RetryPolicy
+from src.ca_pwt.helpers.transport import GraphTransport
+from src.ca_pwt.mock_graph import MockGraph, MockGraphServer
+from .fake_graph import create_fake_transport, create_fast_rate_limiter
+
+_ROLE_ID = "00000000-0000-0000-0000-000000000001"
+_TEMPLATE_ID = "00000000-0000-0000-0000-000000000002"
+_GLOBAL_ADMINISTRATOR_ID = "62e90394-69f5-4237-9190-012177145e10"
+_TENANT = {
+    "directoryRoles": [{"id": _ROLE_ID, "displayName": "Custom Reader"}],
+    "directoryRoleTemplates": [
+        {"id": _TEMPLATE_ID, "displayName": "Custom Reader"},
+        {"id": "00000000-0000-0000-0000-000000000003", "displayName": "Custom Writer"},
+    ],
+}
+
+
+@pytest.fixture()
+def server() -> Iterator[MockGraphServer]:
+    with MockGraphServer(MockGraph(_TENANT)) as server:
+        yield server
+
+
+def _create_transport(server: MockGraphServer) -> GraphTransport:
+    return GraphTransport(
+        rate_limiter=create_fast_rate_limiter(), retry_policy=RetryPolicy(backoff_base=0), base_url=server.base_url
+    )
+
+
+def _resolve(
+    server: MockGraphServer, role_index: DirectoryRoleIndex, keys: list[str], *, to_guids: bool, token: str = "token"
+) -> dict[str, str | None]:
+    transport = _create_transport(server)
+    return role_index.resolve(
+        DirectoryRolesAPI(token, transport=transport),
+        DirectoryRoleTemplatesAPI(token, transport=transport),
+        keys,
+        to_guids=to_guids,
+    )
+
+
+def test_roles_are_listed_once(server):
+    role_index = DirectoryRoleIndex()
+
+    for _ in range(5):
+        ids = _resolve(
+            server, role_index, ["Custom Reader", "Custom Writer", "Global Administrator", "Unknown"], to_guids=True
+        )
+        names = _resolve(server, role_index, [_ROLE_ID, _TEMPLATE_ID, "Unknown"], to_guids=False)
+
+    # the directory roles take precedence over the templates with the same display name
+    assert ids == {
+        "Custom Reader": _ROLE_ID,
+        "Custom Writer": "00000000-0000-0000-0000-000000000003",
+        "Global Administrator": _GLOBAL_ADMINISTRATOR_ID,
+        "Unknown": None,
+    }
+    assert names == {_ROLE_ID: "Custom Reader", _TEMPLATE_ID: "Custom Reader", "Unknown": None}
+    assert server.graph.request_counts == {"directoryRoles": 1, "directoryRoleTemplates": 1}
+
+
+def test_display_names_are_matched_case_insensitively(server):
+    role_index = DirectoryRoleIndex()
+
+    ids = _resolve(server, role_index, ["custom reader", "GLOBAL ADMINISTRATOR"], to_guids=True)
+
+    assert ids == {"custom reader": _ROLE_ID, "GLOBAL ADMINISTRATOR": _GLOBAL_ADMINISTRATOR_ID}
+    assert _resolve(server, role_index, [_GLOBAL_ADMINISTRATOR_ID.upper()], to_guids=False) == {
+        _GLOBAL_ADMINISTRATOR_ID.upper(): "Global Administrator"
+    }
+
+
+def test_roles_are_listed_again_with_the_current_token_when_the_index_expires():
+    transport, adapter = create_fake_transport(lambda _: (200, {"value": []}, {}))
+    role_index = DirectoryRoleIndex(ttl=0)
+
+    for token in ["first", "second"]:
+        role_index.resolve(
+            DirectoryRolesAPI(token, transport=transport),
+            DirectoryRoleTemplatesAPI(token, transport=transport),
+            ["Custom Reader"],
+            to_guids=True,
+        )
+
+    assert [request.headers["Authorization"] for request in adapter.requests] == [
+        "Bearer first",
+        "Bearer first",
+        "Bearer second",
+        "Bearer second",
+    ]
+
+
+def test_role_indexes_are_shared_by_tenant_and_transport(server):
+    transport = _create_transport(server)
+
+    role_index = get_directory_role_index("token", transport=transport)
+
+    assert get_directory_role_index("token", transport=transport) is role_index
+    assert get_directory_role_index("other-token", transport=transport) is not role_index
+    assert get_directory_role_index("token", transport=_create_transport(server)) is not role_index
+
+
+def test_role_indexes_do_not_keep_transports_alive(server):
+    transport = _create_transport(server)
+    get_directory_role_index("token", transport=transport)
+    transport_ref = weakref.ref(transport)
+
+    del transport
+    gc.collect()
+
+    assert transport_ref() is None
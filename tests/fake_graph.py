@@ -0,0 +1,57 @@
+import base64
+import json
+from typing import Any, Callable
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from src.ca_pwt.helpers.transport import GraphTransport
+from src.ca_pwt.helpers.rate_limiter import RateLimiter
+from src.ca_pwt.helpers.retry import RetryPolicy
+
+# a handler receives the request and returns a tuple with the status code, the body and the headers
+FakeHandler = Callable[[PreparedRequest], tuple[int, Any, dict[str, str]]]
+
+
+class FakeGraphAdapter(BaseAdapter):
+    """A requests adapter that serves responses from a handler, so the Graph API layer can be tested offline"""
+
+    def __init__(self, handler: FakeHandler):
+        super().__init__()
+        self.handler = handler
+        self.requests: list[PreparedRequest] = []
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # noqa: ARG002
+        self.requests.append(request)
+        status_code, body, headers = self.handler(request)
+        response = Response()
+        response.status_code = status_code
+        response._content = b"" if body is None else json.dumps(body).encode()
+        response.headers.update(headers)
+        response.encoding = "utf-8"
+        response.url = str(request.url)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def create_fast_rate_limiter() -> RateLimiter:
+    """Creates a rate limiter that does not get in the way of the tests"""
+    return RateLimiter(rate=10000, max_rate=10000, burst=10000)
+
+
+def create_fake_transport(handler: FakeHandler, **kwargs) -> tuple[GraphTransport, FakeGraphAdapter]:
+    """Creates a transport whose requests are served by the specified handler
+    (with its own rate limiter and no backoff, so retries do not slow down the tests)"""
+    kwargs.setdefault("rate_limiter", create_fast_rate_limiter())
+    kwargs.setdefault("retry_policy", RetryPolicy(backoff_base=0))
+    transport = GraphTransport(**kwargs)
+    adapter = FakeGraphAdapter(handler)
+    transport.session.mount("https://", adapter)
+    return transport, adapter
+
+
+def create_fake_token(tenant: str) -> str:
+    """Creates an access token of the tenant (a JWT with only the tid claim, which is never verified)"""
+    claims = base64.urlsafe_b64encode(json.dumps({"tid": tenant}).encode()).decode().rstrip("=")
+    return f"header.{claims}.signature"
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import pytest
+from src.ca_pwt.helpers.graph_api_async import AsyncGraphTransport, gather_by_key
+from src.ca_pwt.helpers.retry import RetryPolicy
+from src.ca_pwt.groups import AsyncGroupsAPI, get_groups_by_ids_async, import_groups_async
+from .utils import get_valid_groups
+from .fake_graph import create_fast_rate_limiter
+
+# the async API needs the optional httpx dependency
+httpx = pytest.importorskip("httpx")
+
+
+def _create_transport(handler, max_concurrency: int = 4) -> AsyncGraphTransport:
+    transport = AsyncGraphTransport(
+        max_concurrency=max_concurrency,
+        rate_limiter=create_fast_rate_limiter(),
+        retry_policy=RetryPolicy(backoff_base=0),
+    )
+    transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return transport
+
+
+def test_requests_are_bounded_by_max_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"id": request.url.path.split("/")[-1]})
+
+    async def run():
+        async with _create_transport(handler, max_concurrency=3) as transport:
+            groups_api = AsyncGroupsAPI("token", transport=transport)
+            return await asyncio.gather(*(groups_api.get_by_id(str(i)) for i in range(20)))
+
+    responses = asyncio.run(run())
+
+    assert [response.json()["id"] for response in responses] == [str(i) for i in range(20)]
+    assert max_in_flight == 3
+
+
+def _get_by_ids_handler(request: httpx.Request) -> httpx.Response:
+    """Answers getByIds requests with the groups whose ids do not end with 0"""
+    ids = json.loads(request.content)["ids"]
+    groups = [{"@odata.type": "#microsoft.graph.group", "id": group_id} for group_id in ids if group_id[-1] != "0"]
+    return httpx.Response(200, json={"value": groups})
+
+
+def test_groups_are_fetched_with_get_by_ids():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _get_by_ids_handler(request)
+
+    group_ids = [f"00000000-0000-0000-0000-{index:012d}" for index in range(1, 1502)]
+
+    async def run():
+        async with _create_transport(handler) as transport:
+            return await get_groups_by_ids_async("token", group_ids, transport=transport)
+
+    groups = asyncio.run(run())
+
+    # up to 1000 ids per request, and the groups are returned as by get_groups_by_ids
+    assert [len(json.loads(request.content)["ids"]) for request in requests] == [1000, 501]
+    assert all(request.url.path.endswith("/directoryObjects/getByIds") for request in requests)
+    assert json.loads(requests[0].content)["types"] == ["group"]
+    assert groups[0] == {"id": group_ids[0]}
+    assert len(groups) == len([group_id for group_id in group_ids if group_id[-1] != "0"])
+
+
+def test_not_found_groups_are_ignored():
+    found_id = "00000000-0000-0000-0000-000000000001"
+    missing_id = "00000000-0000-0000-0000-000000000010"
+
+    async def run(*, ignore_not_found: bool):
+        async with _create_transport(_get_by_ids_handler) as transport:
+            return await get_groups_by_ids_async(
+                "token", [found_id, missing_id], ignore_not_found=ignore_not_found, transport=transport
+            )
+
+    assert asyncio.run(run(ignore_not_found=True)) == [{"id": found_id}]
+    with pytest.raises(AssertionError):
+        asyncio.run(run(ignore_not_found=False))
+
+
+def test_import_groups_async_checks_duplicates():
+    created: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            # the filter is the only way to know which group is being checked
+            existing = [{"id": name} for name in created if name in str(request.url.params.get("$filter"))]
+            return httpx.Response(200, json={"value": existing})
+        group = json.loads(request.content)
+        created.append(group["displayName"])
+        return httpx.Response(201, json={"id": group["displayName"]})
+
+    groups = get_valid_groups()
+    # the same group twice must be created only once, even when importing concurrently
+    groups.append(get_valid_groups()[0])
+
+    async def run():
+        async with _create_transport(handler) as transport:
+            return await import_groups_async("token", groups, transport=transport)
+
+    result = asyncio.run(run())
+
+    assert created == [group["displayName"] for group in get_valid_groups()]
+    assert [group_id for group_id, _ in result] == [group["displayName"] for group in groups]
+
+
+def test_gather_by_key_keeps_order_and_serializes_same_keys():
+    running: set[str] = set()
+
+    async def func(item: tuple[str, int]) -> int:
+        key, value = item
+        assert key not in running
+        running.add(key)
+        await asyncio.sleep(0.001)
+        running.remove(key)
+        return value
+
+    items = [("a", 1), ("b", 2), ("a", 3), ("c", 4), ("b", 5)]
+    assert asyncio.run(gather_by_key(items, lambda item: item[0], func)) == [1, 2, 3, 4, 5]
+
+
+def test_async_entity_api_urls():
+    transport = AsyncGraphTransport()
+    groups_api = AsyncGroupsAPI("token", transport=transport)
+    assert groups_api._get_collection_url(odata_filter="a", odata_top=1).endswith("/groups?$filter=a&$top=1")
+    with pytest.raises(AssertionError):
+        asyncio.run(groups_api.get_by_id(""))
+
+
+def test_transient_errors_are_retried():
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            msg = "stalled"
+            raise httpx.ReadTimeout(msg, request=request)
+        if attempts == 2:
+            return httpx.Response(504)
+        return httpx.Response(200, json={"id": "1"})
+
+    async def run():
+        async with _create_transport(handler) as transport:
+            return await AsyncGroupsAPI("token", transport=transport).get_by_id("1")
+
+    assert asyncio.run(run()).success
+    assert attempts == 3
+
+
+def test_only_connect_timeouts_are_retried_for_posts():
+    errors = [httpx.ConnectTimeout, httpx.ConnectError]
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        msg = "unreachable"
+        raise errors[attempts - 1](msg, request=request)
+
+    async def run():
+        async with _create_transport(handler) as transport:
+            await transport.request("POST", "https://graph.microsoft.com/v1.0/groups", json={})
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(run())
+    assert attempts == 2
+
+
+def test_concurrent_identical_gets_share_a_single_request():
+    requests_sent = 0
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal requests_sent
+        requests_sent += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "1"})
+
+    async def run():
+        async with _create_transport(handler) as transport:
+            groups_api = AsyncGroupsAPI("token", transport=transport)
+            return await asyncio.gather(*(groups_api.get_by_id("1") for _ in range(5)))
+
+    assert all(response.success for response in asyncio.run(run()))
+    assert requests_sent == 1
@@ -0,0 +1,124 @@
+from urllib.parse import unquote
+from src.ca_pwt.groups import GroupsAPI
+from src.ca_pwt.users import UsersAPI
+from src.ca_pwt.helpers.graph_api import APIResponse
+from .fake_graph import create_fake_transport
+
+_PAGES = {
+    "https://graph.microsoft.com/v1.0/groups?$top=2": {
+        "value": [{"id": "1"}, {"id": "2"}],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/groups?$skiptoken=a",
+    },
+    "https://graph.microsoft.com/v1.0/groups?$skiptoken=a": {
+        "value": [{"id": "3"}, {"id": "4"}],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/groups?$skiptoken=b",
+    },
+    "https://graph.microsoft.com/v1.0/groups?$skiptoken=b": {"value": [{"id": "5"}]},
+}
+
+
+def _paged_handler(request):
+    url = unquote(str(request.url))
+    if url == "https://graph.microsoft.com/v1.0/groups":
+        url = "https://graph.microsoft.com/v1.0/groups?$top=2"
+    if url in _PAGES:
+        return 200, _PAGES[url], {}
+    return 404, {"error": {"code": "Request_ResourceNotFound"}}, {}
+
+
+def test_iter_all_follows_next_links_lazily():
+    transport, adapter = create_fake_transport(_paged_handler)
+    groups_api = GroupsAPI("token", transport=transport)
+
+    entities = groups_api.iter_all(page_size=2)
+    assert next(entities)["id"] == "1"
+    # only the first page has been requested so far
+    assert len(adapter.requests) == 1
+
+    assert [entity["id"] for entity in entities] == ["2", "3", "4", "5"]
+    assert len(adapter.requests) == 3
+
+
+def test_get_all_merges_all_pages():
+    transport, _ = create_fake_transport(_paged_handler)
+    groups_api = GroupsAPI("token", transport=transport)
+
+    response = groups_api.get_all()
+
+    assert response.success
+    assert [entity["id"] for entity in response.json()["value"]] == ["1", "2", "3", "4", "5"]
+
+
+def test_get_all_with_top_returns_only_the_first_page():
+    transport, adapter = create_fake_transport(_paged_handler)
+    groups_api = GroupsAPI("token", transport=transport)
+
+    response = groups_api.get_all(odata_top=2)
+
+    assert len(response.json()["value"]) == 2
+    assert len(adapter.requests) == 1
+
+
+def test_get_all_returns_the_failed_page():
+    transport, _ = create_fake_transport(lambda _: (403, {"error": {"code": "Authorization_RequestDenied"}}, {}))
+    groups_api = GroupsAPI("token", transport=transport)
+
+    response = groups_api.get_all()
+
+    assert not response.success
+    assert response.status_code == 403
+
+
+def test_select_is_added_to_the_read_urls():
+    transport, adapter = create_fake_transport(lambda _: (200, {"id": "1", "value": [{"id": "1"}]}, {}))
+    groups_api = GroupsAPI("token", transport=transport)
+    users_api = UsersAPI("token", transport=transport)
+
+    groups_api.get_by_id("1", select=["id", "displayName"])
+    groups_api.get_by_display_name("test", select=["id"])
+    users_api.get_by_id("user@contoso.com", select=["id"])
+
+    urls = [unquote(str(request.url)) for request in adapter.requests]
+    assert urls[0].endswith("/groups/1?$select=id,displayName")
+    assert urls[1].endswith("/groups?$filter=displayName eq 'test'&$top=1&$select=id")
+    assert urls[2].endswith("/users/user@contoso.com?$select=id")
+
+
+class _CountingResponse:
+    """A response that counts how many times its body is read"""
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self._text = text
+        self.reads = 0
+
+    @property
+    def text(self) -> str:
+        self.reads += 1
+        return self._text
+
+    def json(self, **kwargs):  # noqa: ARG002
+        msg = "the body must be decoded by APIResponse"
+        raise AssertionError(msg)
+
+
+def test_api_response_decodes_the_body_once_and_releases_the_raw_response():
+    raw_response = _CountingResponse(200, '{"id": "1"}')
+    response = APIResponse(raw_response)
+
+    assert raw_response.reads == 0
+    assert response.json() == {"id": "1"}
+    assert response.json() is response.json()
+    assert raw_response.reads == 1
+    assert response._raw_response is None
+    assert not hasattr(response, "__dict__")
+
+
+def test_api_response_returns_the_text_of_bodies_that_are_not_json_objects():
+    assert APIResponse(_CountingResponse(400, "Bad request"), 200).json() == "Bad request"
+    assert APIResponse(_CountingResponse(204, ""), 204).json() == ""
+
+    response = APIResponse(_CountingResponse(200, '{"value": [{"id": "1"}]}'))
+    response.response = response.json()["value"][0]
+    assert response.json() == {"id": "1"}
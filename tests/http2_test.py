@@ -0,0 +1,55 @@
+import httpx
+import pytest
+from src.ca_pwt.groups import GroupsAPI
+from src.ca_pwt.helpers.http2 import Http2Adapter
+from src.ca_pwt.helpers.retry import RetryPolicy
+from src.ca_pwt.helpers.transport import GraphTransport
+from .fake_graph import create_fast_rate_limiter
+
+_GROUP_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _create_transport(handler) -> GraphTransport:
+    """Creates a transport whose https requests are sent with an Http2Adapter served by the handler"""
+    transport = GraphTransport(rate_limiter=create_fast_rate_limiter(), retry_policy=RetryPolicy(backoff_base=0))
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    transport.session.mount("https://", Http2Adapter(1, client=client))
+    return transport
+
+
+def test_responses_are_converted():
+    requests_sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_sent.append(request)
+        return httpx.Response(201, json={"id": _GROUP_ID}, headers={"Location": "groups/1"})
+
+    response = GroupsAPI("token", transport=_create_transport(handler)).create({"displayName": "Sales"})
+
+    assert response.success
+    assert response.json() == {"id": _GROUP_ID}
+    assert requests_sent[0].headers["Authorization"] == "Bearer token"
+    assert requests_sent[0].content == b'{"displayName": "Sales"}'
+
+
+def test_transport_errors_are_retried():
+    errors: list[Exception] = [httpx.ConnectTimeout("timeout"), httpx.ReadTimeout("timeout")]
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        if errors:
+            raise errors.pop(0)
+        return httpx.Response(200, json={"id": _GROUP_ID})
+
+    response = GroupsAPI("token", transport=_create_transport(handler)).get_by_id(_GROUP_ID)
+
+    assert response.success
+    assert errors == []
+
+
+def test_transport_can_use_http2():
+    pytest.importorskip("h2")
+    transport = GraphTransport(http2=True)
+
+    # the transport imports the adapter as ca_pwt (not src.ca_pwt), so the classes are compared by name
+    assert type(transport.session.get_adapter("https://graph.microsoft.com")).__name__ == "Http2Adapter"
+    assert type(transport.session.get_adapter("http://localhost")).__name__ == "HTTPAdapter"
@@ -0,0 +1,96 @@
+import json
+import os
+import pytest
+from src.ca_pwt.lookup_cache import BuiltinCatalog, LookupCache
+from src.ca_pwt.policies_mappings import create_lookup_cache
+
+_GROUP_ID = "00000000-0000-0000-0000-000000000001"
+_GLOBAL_ADMIN_ROLE_ID = "62e90394-69f5-4237-9190-012177145e10"
+
+
+def test_each_type_of_object_has_its_own_namespace():
+    lookup_cache = create_lookup_cache()
+    lookup_cache.add("groups", _GROUP_ID, "Global Administrator")
+
+    assert lookup_cache.get("groups", "Global Administrator", to_guids=True) == _GROUP_ID
+    assert lookup_cache.get("roles", "Global Administrator", to_guids=True) == _GLOBAL_ADMIN_ROLE_ID
+    assert lookup_cache.get("roles", _GLOBAL_ADMIN_ROLE_ID, to_guids=False) == "Global Administrator"
+    assert not lookup_cache.has("users", "Global Administrator", to_guids=True)
+
+
+def test_indexes_are_kept_in_sync():
+    lookup_cache = LookupCache()
+    lookup_cache.set("groups", "Sales", _GROUP_ID, to_guids=True)
+    assert lookup_cache.get("groups", _GROUP_ID, to_guids=False) == "Sales"
+
+    # a case variant of the name is an alias, so it does not replace the name of the group
+    lookup_cache.set("groups", "sales", _GROUP_ID, to_guids=True)
+    assert lookup_cache.get("groups", _GROUP_ID, to_guids=False) == "Sales"
+    assert lookup_cache.get("groups", "Sales", to_guids=True) == _GROUP_ID
+
+    # the group was renamed
+    lookup_cache.set("groups", _GROUP_ID, "Marketing", to_guids=False)
+    assert lookup_cache.get("groups", "Marketing", to_guids=True) == _GROUP_ID
+    assert lookup_cache.get("groups", _GROUP_ID, to_guids=False) == "Marketing"
+
+    lookup_cache.set("groups", "Unknown", None, to_guids=True)
+    assert lookup_cache.has("groups", "Unknown", to_guids=True)
+    assert lookup_cache.get("groups", "Unknown", to_guids=True) is None
+
+
+def test_saved_cache_serves_both_directions(tmp_path):
+    file_path = os.path.join(tmp_path, "lookup_cache.json")
+    lookup_cache = LookupCache()
+    lookup_cache.add("groups", _GROUP_ID, "Sales")
+    lookup_cache.set("users", "unknown@contoso.com", None, to_guids=True)
+    lookup_cache.save(file_path)
+
+    loaded_cache = LookupCache.load(file_path)
+
+    assert loaded_cache.get("groups", "Sales", to_guids=True) == _GROUP_ID
+    assert loaded_cache.get("groups", _GROUP_ID, to_guids=False) == "Sales"
+    # the keys that could not be resolved are not saved
+    assert not loaded_cache.has("users", "unknown@contoso.com", to_guids=True)
+
+
+def test_flat_files_apply_to_every_type_of_object(tmp_path):
+    file_path = os.path.join(tmp_path, "lookup_cache.json")
+    with open(file_path, "w") as f:
+        json.dump({_GROUP_ID: "Sales"}, f)
+
+    lookup_cache = LookupCache.load(file_path)
+
+    assert lookup_cache.get("groups", "Sales", to_guids=True) == _GROUP_ID
+    assert lookup_cache.get("applications", _GROUP_ID, to_guids=False) == "Sales"
+    assert LookupCache.load(os.path.join(tmp_path, "missing.json")).to_dict()["groups"] == {}
+
+
+def test_builtins_are_layered_under_the_cache(tmp_path):
+    file_path = os.path.join(tmp_path, "lookup_cache.json")
+    lookup_cache = create_lookup_cache()
+    lookup_cache.add("roles", _GROUP_ID, "Custom Role")
+    lookup_cache.save(file_path)
+
+    assert lookup_cache.has("applications", "All", to_guids=True)
+    assert not LookupCache().has("roles", _GLOBAL_ADMIN_ROLE_ID, to_guids=False)
+    # the built-in objects are found but not saved
+    assert lookup_cache.to_dict()["roles"] == {_GROUP_ID: "Custom Role"}
+    assert LookupCache.load(file_path).to_dict()["roles"] == {_GROUP_ID: "Custom Role"}
+
+
+def test_builtin_catalogs_are_loaded_once_on_first_use():
+    loads = []
+
+    def load() -> dict[str, str]:
+        loads.append(1)
+        return {_GROUP_ID: "Sales"}
+
+    builtin_catalog = BuiltinCatalog(load)
+    assert loads == []
+
+    assert builtin_catalog.get("Sales", to_guids=True) == _GROUP_ID
+    assert builtin_catalog.get(_GROUP_ID, to_guids=False) == "Sales"
+    assert builtin_catalog.get("Unknown", to_guids=True) is None
+    assert loads == [1]
+    with pytest.raises(TypeError):
+        builtin_catalog.to_dict()["Unknown"] = "Unknown"
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.ca_pwt.lookup_cache import LookupCache
+from src.ca_pwt.lookup_store import LookupStore
+from src.ca_pwt.policies_mappings import create_lookup_cache, replace_attrs_with_guids_in_policies
+from .fake_graph import create_fake_token, create_fake_transport
+
+_GROUP_ID = "00000000-0000-0000-0000-000000000001"
+_USER_ID = "00000000-0000-0000-0000-000000000002"
+
+
+def _create_store(tmp_path, tenant: str = "tenant", **kwargs) -> LookupStore:
+    return LookupStore(os.path.join(tmp_path, "lookups.db"), create_fake_token(tenant), **kwargs)
+
+
+def _count_rows(tmp_path) -> int:
+    with sqlite3.connect(os.path.join(tmp_path, "lookups.db")) as connection:
+        return connection.execute("SELECT COUNT(*) FROM lookups").fetchone()[0]
+
+
+def test_only_the_resolved_objects_are_stored(tmp_path):
+    lookup_store = _create_store(tmp_path)
+    lookup_cache = lookup_store.load(create_lookup_cache())
+    lookup_cache.set("groups", "Sales", _GROUP_ID, to_guids=True)
+    lookup_cache.set("users", "unknown@contoso.com", None, to_guids=True)
+
+    lookup_store.save(lookup_cache)
+    lookup_store.save(lookup_cache)
+
+    # the built-in objects and the keys that could not be resolved are not stored
+    assert _count_rows(tmp_path) == 1
+    loaded_cache = _create_store(tmp_path).load(LookupCache())
+    assert loaded_cache.get("groups", "Sales", to_guids=True) == _GROUP_ID
+    assert loaded_cache.get("groups", _GROUP_ID, to_guids=False) == "Sales"
+    assert not _create_store(tmp_path, "other").load(LookupCache()).has("groups", "Sales", to_guids=True)
+
+
+def test_expired_objects_are_not_loaded(tmp_path, monkeypatch):
+    lookup_store = _create_store(tmp_path, ttl=60)
+    lookup_cache = lookup_store.load(LookupCache())
+    lookup_cache.add("groups", _GROUP_ID, "Sales")
+    lookup_store.save(lookup_cache)
+
+    now = time.time()
+    monkeypatch.setattr("src.ca_pwt.lookup_store.time.time", lambda: now + 61)
+
+    assert not lookup_store.load(LookupCache()).has("groups", _GROUP_ID, to_guids=False)
+    lookup_store.save(LookupCache())
+    assert _count_rows(tmp_path) == 0
+
+
+def test_concurrent_stores_share_the_database(tmp_path):
+    def save(index: int):
+        lookup_store = _create_store(tmp_path)
+        lookup_cache = lookup_store.load(LookupCache())
+        lookup_cache.add("groups", f"id-{index}", f"Group {index}")
+        lookup_store.save(lookup_cache)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(save, range(8)))
+
+    assert _create_store(tmp_path).load(LookupCache()).to_dict()["groups"] == {
+        f"id-{index}": f"Group {index}" for index in range(8)
+    }
+
+
+def test_warm_runs_do_not_look_up_stored_objects(tmp_path):
+    lookup_store = _create_store(tmp_path)
+    lookup_cache = lookup_store.load(create_lookup_cache())
+    lookup_cache.add("groups", _GROUP_ID, "Sales")
+    lookup_cache.add("users", _USER_ID, "a@contoso.com")
+    lookup_store.save(lookup_cache)
+    transport, adapter = create_fake_transport(lambda _: (500, None, {}))
+    policies = [{"conditions": {"users": {"includeGroupNames": ["Sales"], "includeUserNames": ["a@contoso.com"]}}}]
+
+    policies = replace_attrs_with_guids_in_policies(
+        "token",
+        policies,
+        _create_store(tmp_path).load(create_lookup_cache()),
+        lookup_applications=False,
+        transport=transport,
+    )
+
+    assert adapter.requests == []
+    assert policies[0]["conditions"]["users"] == {"includeGroups": [_GROUP_ID], "includeUsers": [_USER_ID]}
+
+
+def _replace_group_names(tmp_path, group_names: list[str], **kwargs) -> tuple[list, LookupCache]:
+    """Replaces the group names of a policy with a store loaded and saved around it, against a directory where no
+    group exists; returns the requests that were sent and the lookup cache"""
+    lookup_store = _create_store(tmp_path, **kwargs)
+    lookup_cache = lookup_store.load(create_lookup_cache())
+    transport, adapter = create_fake_transport(
+        lambda _: (200, {"responses": [{"id": "0", "status": 200, "body": {"value": []}}]}, {})
+    )
+    replace_attrs_with_guids_in_policies(
+        "token",
+        [{"conditions": {"users": {"includeGroupNames": group_names}}}],
+        lookup_cache,
+        lookup_users=False,
+        lookup_roles=False,
+        lookup_applications=False,
+        transport=transport,
+    )
+    lookup_store.save(lookup_cache)
+    return adapter.requests, lookup_cache
+
+
+def test_keys_that_could_not_be_resolved_are_not_looked_up_again(tmp_path, monkeypatch):
+    requests, lookup_cache = _replace_group_names(tmp_path, ["Deleted"])
+    assert len(requests) == 1
+    assert lookup_cache.get_not_found(to_guids=True) == {"groups": ["Deleted"]}
+
+    requests, lookup_cache = _replace_group_names(tmp_path, ["Deleted"])
+    assert requests == []
+    assert lookup_cache.get_not_found(to_guids=True) == {"groups": ["Deleted"]}
+
+    requests, _ = _replace_group_names(tmp_path, ["Deleted"], recheck_not_found=True)
+    assert len(requests) == 1
+
+    # the missing keys expire sooner than the resolved objects
+    now = time.time()
+    monkeypatch.setattr("src.ca_pwt.lookup_store.time.time", lambda: now + 61)
+    requests, _ = _replace_group_names(tmp_path, ["Deleted"], not_found_ttl=60)
+    assert len(requests) == 1
+
+
+def test_keys_that_are_resolved_later_are_no_longer_missing(tmp_path):
+    _replace_group_names(tmp_path, ["Sales"])
+
+    lookup_store = _create_store(tmp_path, recheck_not_found=True)
+    lookup_cache = lookup_store.load(LookupCache())
+    lookup_cache.set("groups", "Sales", _GROUP_ID, to_guids=True)
+    lookup_store.save(lookup_cache)
+
+    loaded_cache = _create_store(tmp_path).load(LookupCache())
+    assert loaded_cache.get("groups", "Sales", to_guids=True) == _GROUP_ID
+    assert loaded_cache.get_not_found(to_guids=True) == {}
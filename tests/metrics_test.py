@@ -0,0 +1,91 @@
+import json
+import os
+import pytest
+import requests
+from src.ca_pwt.helpers.metrics import RequestMetrics, RequestRecord, _get_endpoint
+from src.ca_pwt.groups import GroupsAPI
+from .fake_graph import create_fake_transport
+
+_GROUP_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def test_endpoints_replace_ids_and_keys_with_placeholders():
+    assert (
+        _get_endpoint(f"https://graph.microsoft.com/v1.0/groups/{_GROUP_ID}/members/$ref") == "groups/{id}/members/$ref"
+    )
+    assert _get_endpoint("https://graph.microsoft.com/v1.0/groups?$filter=displayName eq 'a'") == "groups"
+    assert _get_endpoint("https://graph.microsoft.com/v1.0/applications(appId='1')") == "applications(...)"
+
+
+def test_endpoints_replace_keys_that_are_not_guids():
+    assert _get_endpoint("https://graph.microsoft.com/v1.0/users/alice@contoso.com") == "users/{id}"
+    assert (
+        _get_endpoint("https://graph.microsoft.com/v1.0/users/alice@contoso.com/memberOf/bob@contoso.com")
+        == "users/{id}/memberOf/{id}"
+    )
+    assert (
+        _get_endpoint("https://graph.microsoft.com/v1.0/identity/conditionalAccess/policies/1")
+        == "identity/conditionalAccess/policies/{id}"
+    )
+    assert _get_endpoint("https://graph.microsoft.com/v1.0/directoryObjects/getByIds") == "directoryObjects/getByIds"
+    assert _get_endpoint("https://graph.microsoft.com/v1.0/groups/delta?$select=id") == "groups/delta"
+
+
+def test_transport_records_retries_throttling_status_codes_and_bytes():
+    responses = [(429, None, {"Retry-After": "0"}), (200, {"id": _GROUP_ID}, {})]
+    metrics = RequestMetrics()
+    transport, _ = create_fake_transport(lambda _: responses.pop(0), metrics=metrics)
+    groups_api = GroupsAPI("token", transport=transport)
+
+    assert groups_api.get_by_id(_GROUP_ID).success
+
+    [endpoint_metrics] = metrics.to_dict()["endpoints"]
+    assert endpoint_metrics["endpoint"] == "groups/{id}"
+    assert endpoint_metrics["method"] == "GET"
+    assert endpoint_metrics["count"] == 1
+    assert endpoint_metrics["retries"] == 1
+    assert endpoint_metrics["throttled"] == 1
+    assert endpoint_metrics["status_codes"] == {"200": 1}
+    assert endpoint_metrics["response_bytes"] == len(json.dumps({"id": _GROUP_ID}))
+    assert set(endpoint_metrics["latency_seconds"]) == {"min", "mean", "p50", "p90", "p95", "p99", "max"}
+
+
+def test_transport_records_requests_that_failed_without_a_response():
+    def handler(_):
+        msg = "connection reset"
+        raise requests.ConnectionError(msg)
+
+    metrics = RequestMetrics()
+    transport, _ = create_fake_transport(handler, metrics=metrics)
+
+    with pytest.raises(requests.ConnectionError):
+        transport.post("https://graph.microsoft.com/v1.0/groups", json={"displayName": "test"})
+
+    [endpoint_metrics] = metrics.to_dict()["endpoints"]
+    assert endpoint_metrics["method"] == "POST"
+    assert endpoint_metrics["status_codes"] == {"error": 1}
+
+
+def test_metrics_are_saved_as_json_or_prometheus(tmp_path):
+    metrics = RequestMetrics()
+    for status_code in [200, 200, 404]:
+        metrics.record(RequestRecord("GET", f"https://graph.microsoft.com/v1.0/groups/{_GROUP_ID}"), status_code)
+    metrics.record_cache_hit("GET", "https://graph.microsoft.com/v1.0/groups")
+
+    json_file = os.path.join(tmp_path, "metrics.json")
+    metrics.save(json_file)
+    with open(json_file) as f:
+        endpoints = json.load(f)["endpoints"]
+    assert [(e["endpoint"], e["count"], e["cache_hits"]) for e in endpoints] == [
+        ("groups", 0, 1),
+        ("groups/{id}", 3, 0),
+    ]
+
+    prometheus_file = os.path.join(tmp_path, "metrics.prom")
+    metrics.save(prometheus_file, "prometheus")
+    with open(prometheus_file) as f:
+        lines = f.read().splitlines()
+    assert 'ca_pwt_graph_requests_total{endpoint="groups/{id}",method="GET"} 3' in lines
+    assert 'ca_pwt_graph_responses_total{endpoint="groups/{id}",method="GET",status="404"} 1' in lines
+    assert 'ca_pwt_graph_request_duration_seconds_bucket{endpoint="groups/{id}",method="GET",le="+Inf"} 3' in lines
+    assert "# TYPE ca_pwt_graph_request_duration_seconds histogram" in lines
@@ -0,0 +1,89 @@
+from collections.abc import Iterator
+import pytest
+from src.ca_pwt.directory_objects import DirectoryObjectsAPI
+from src.ca_pwt.groups import GroupsAPI
+from src.ca_pwt.helpers.metrics import RequestMetrics
+from src.ca_pwt.helpers.rate_limiter import RateLimiter
+from src.ca_pwt.helpers.retry import RetryPolicy
+from src.ca_pwt.helpers.transport import GraphTransport
+from src.ca_pwt.mock_graph import MockGraph, MockGraphServer
+from .fake_graph import create_fast_rate_limiter
+
+_GROUP_ID = "00000000-0000-0000-0000-000000000001"
+_TENANT = {
+    "groups": [{"id": _GROUP_ID, "displayName": "Sales"}, {"displayName": "Finance"}],
+    "users": [{"userPrincipalName": "a@contoso.com"}],
+}
+
+
+def _create_transport(server: MockGraphServer, **kwargs) -> GraphTransport:
+    kwargs.setdefault("rate_limiter", create_fast_rate_limiter())
+    return GraphTransport(
+        retry_policy=RetryPolicy(backoff_base=0),
+        base_url=server.base_url,
+        **kwargs,
+    )
+
+
+@pytest.fixture()
+def server() -> Iterator[MockGraphServer]:
+    with MockGraphServer(MockGraph(_TENANT)) as server:
+        yield server
+
+
+def test_entity_apis_can_point_at_the_mock_server(server):
+    groups_api = GroupsAPI("token", transport=_create_transport(server))
+
+    created = groups_api.create({"displayName": "HR"})
+    assert created.status_code == 201
+    assert groups_api.get_by_id(created.json()["id"]).json()["displayName"] == "HR"
+    assert groups_api.get_top_entity("displayName eq 'sales'", select=["id"]).json() == {"id": _GROUP_ID}
+    assert groups_api.get_by_id("unknown").status_code == 404
+
+    # the `in` filters are sent in a $batch envelope
+    resolution = groups_api.resolve_keys(["Sales", "Finance", "Unknown"], "displayName")
+    assert resolution.found["Sales"] == _GROUP_ID
+    assert set(resolution.found) == {"Sales", "Finance"}
+    assert resolution.missing == ["Unknown"]
+
+
+def test_get_by_ids_and_paging(server):
+    transport = _create_transport(server)
+    for index in range(5):
+        server.graph.add("groups", {"displayName": f"Group {index}"})
+
+    responses = DirectoryObjectsAPI("token", transport=transport).get_by_ids([_GROUP_ID], types=["group"])
+    assert responses[0].json()["@odata.type"] == "#microsoft.graph.group"
+
+    groups = list(GroupsAPI("token", transport=transport).iter_all(page_size=2, select=["displayName"]))
+    assert len(groups) == 7
+    assert groups[0] == {"displayName": "Sales"}
+
+
+def test_injected_faults_are_retried():
+    graph = MockGraph(_TENANT, throttle_rate=0.3, unavailable_rate=0.3, retry_after=0, seed=1)
+    with MockGraphServer(graph) as server:
+        metrics = RequestMetrics()
+        # the rate is not cut by the injected faults, so the test does not slow down
+        rate_limiter = RateLimiter(rate=10000, min_rate=10000, max_rate=10000, burst=10000)
+        transport = _create_transport(server, metrics=metrics, rate_limiter=rate_limiter, coalesce_gets=False)
+        groups_api = GroupsAPI("token", transport=transport)
+
+        responses = [groups_api.get_by_id(_GROUP_ID) for _ in range(10)]
+
+    assert all(response.success for response in responses)
+    assert graph.throttled_counts["groups"] > 0
+    [endpoint_metrics] = metrics.to_dict()["endpoints"]
+    assert endpoint_metrics["retries"] == graph.throttled_counts["groups"]
+
+
+def test_requests_over_the_rate_limit_are_throttled():
+    graph = MockGraph(_TENANT, rate_limits={"groups": 2})
+
+    status_codes = [graph.handle("GET", f"/groups/{_GROUP_ID}")[0] for _ in range(3)]
+    status_code, _, headers = graph.handle("GET", "/users")
+
+    assert status_codes == [200, 200, 429]
+    assert graph.handle("GET", f"/groups/{_GROUP_ID}")[2]["Retry-After"] == "1"
+    assert status_code == 200
+    assert headers == {}
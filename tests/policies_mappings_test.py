@@ -0,0 +1,218 @@
+import copy
+import threading
+import time
+from collections.abc import Iterator
+import pytest
+from src.ca_pwt.helpers.metrics import RequestMetrics
+from src.ca_pwt.helpers.retry import RetryPolicy
+from src.ca_pwt.helpers.transport import GraphTransport
+from src.ca_pwt.lookup_cache import LookupCache
+from src.ca_pwt.mock_graph import MockGraph, MockGraphServer
+from src.ca_pwt.policies_mappings import (
+    LookupThresholds,
+    replace_attrs_with_guids_in_policies,
+    replace_guids_with_attrs_in_policies,
+)
+from .fake_graph import create_fast_rate_limiter
+
+_SALES_ID = "00000000-0000-0000-0000-000000000001"
+_FINANCE_ID = "00000000-0000-0000-0000-000000000002"
+_USER_ID = "00000000-0000-0000-0000-000000000003"
+_TENANT = {
+    "groups": [{"id": _SALES_ID, "displayName": "Sales"}, {"id": _FINANCE_ID, "displayName": "Finance"}],
+    "users": [{"id": _USER_ID, "userPrincipalName": "a@contoso.com"}],
+}
+
+
+@pytest.fixture()
+def server() -> Iterator[MockGraphServer]:
+    with MockGraphServer(MockGraph(_TENANT)) as server:
+        yield server
+
+
+def _create_policies(count: int) -> list[dict]:
+    """Creates policies that reference the same groups and users, in different orders"""
+    return [
+        {
+            "conditions": {
+                "users": {
+                    "includeGroupNames": ["Sales", "Finance"] if index % 2 else ["Finance", "Sales", "Unknown"],
+                    "excludeUserNames": ["a@contoso.com"],
+                },
+                "applications": {"includeApplications": ["All"]},
+            }
+        }
+        for index in range(count)
+    ]
+
+
+def _replace_attrs_with_guids(
+    server: MockGraphServer, policies: list[dict], lookup_thresholds: LookupThresholds | None = None
+) -> tuple[list[dict], int]:
+    """Replaces the attributes of the policies and returns them with the number of requests that were sent"""
+    metrics = RequestMetrics()
+    transport = GraphTransport(
+        rate_limiter=create_fast_rate_limiter(),
+        retry_policy=RetryPolicy(backoff_base=0),
+        base_url=server.base_url,
+        metrics=metrics,
+    )
+    policies = replace_attrs_with_guids_in_policies(
+        "token", policies, transport=transport, lookup_thresholds=lookup_thresholds
+    )
+    return policies, sum(endpoint["count"] for endpoint in metrics.to_dict()["endpoints"])
+
+
+def test_requests_depend_on_the_unique_references_only(server):
+    policies, requests_count = _replace_attrs_with_guids(server, _create_policies(20))
+    _, single_policy_requests_count = _replace_attrs_with_guids(server, _create_policies(2))
+
+    assert requests_count == single_policy_requests_count
+    assert policies[0]["conditions"]["users"] == {
+        "includeGroupNames": ["Unknown"],
+        "excludeUsers": [_USER_ID],
+        "includeGroups": [_FINANCE_ID, _SALES_ID],
+    }
+    assert policies[1]["conditions"]["users"] == {"excludeUsers": [_USER_ID], "includeGroups": [_SALES_ID, _FINANCE_ID]}
+    assert policies[0]["conditions"]["applications"] == {"includeApplications": ["All"]}
+
+
+def test_guids_are_replaced_back(server):
+    transport = GraphTransport(
+        rate_limiter=create_fast_rate_limiter(), retry_policy=RetryPolicy(backoff_base=0), base_url=server.base_url
+    )
+    policies, _ = _replace_attrs_with_guids(server, _create_policies(2))
+
+    policies = replace_guids_with_attrs_in_policies("token", policies, lookup_cache=LookupCache(), transport=transport)
+
+    assert policies[1]["conditions"]["users"] == {
+        "excludeUserNames": ["a@contoso.com"],
+        "includeGroupNames": ["Sales", "Finance"],
+    }
+
+
+def test_keywords_are_not_looked_up(server):
+    transport = GraphTransport(
+        rate_limiter=create_fast_rate_limiter(), retry_policy=RetryPolicy(backoff_base=0), base_url=server.base_url
+    )
+    lookup_cache = LookupCache()
+    policies = [
+        {
+            "conditions": {
+                "users": {"includeUsers": ["All", _USER_ID], "excludeUsers": ["GuestsOrExternalUsers"]},
+                "applications": {"includeApplications": ["All"]},
+            }
+        }
+    ]
+
+    policies = replace_guids_with_attrs_in_policies("token", policies, lookup_cache=lookup_cache, transport=transport)
+
+    assert policies[0]["conditions"]["users"] == {
+        "includeUsers": ["All"],
+        "excludeUsers": ["GuestsOrExternalUsers"],
+        "includeUserNames": ["a@contoso.com"],
+    }
+    assert not lookup_cache.has("users", "All", to_guids=False)
+    assert not lookup_cache.has("users", "GuestsOrExternalUsers", to_guids=False)
+
+
+def test_lookup_thresholds_choose_the_strategy():
+    lookup_thresholds = LookupThresholds(point_max_keys=2, prefetch_min_keys=10)
+
+    assert lookup_thresholds.choose_strategy(2, ["point", "bulk", "prefetch"]) == "point"
+    assert lookup_thresholds.choose_strategy(3, ["point", "bulk", "prefetch"]) == "bulk"
+    assert lookup_thresholds.choose_strategy(10, ["point", "bulk", "prefetch"]) == "prefetch"
+    assert lookup_thresholds.choose_strategy(10, ["point", "bulk"]) == "bulk"
+    assert lookup_thresholds.choose_strategy(10, ["point"]) == "point"
+    with pytest.raises(AssertionError):
+        LookupThresholds(point_max_keys=10, prefetch_min_keys=10)
+
+
+def test_many_references_are_resolved_by_listing(server, caplog):
+    group_ids = [server.graph.add("groups", {"displayName": f"Group {index}"})["id"] for index in range(40)]
+    # the policies are rewritten in place, so each run gets its own copy
+    policies = [
+        {
+            "conditions": {
+                "users": {"includeGroupNames": [f"Group {index}" for index in range(30)]},
+                "applications": {"includeApplications": ["All"]},
+            }
+        }
+    ]
+    caplog.set_level("INFO")
+
+    bulk_policies, bulk_requests_count = _replace_attrs_with_guids(server, copy.deepcopy(policies))
+    prefetch_policies, prefetch_requests_count = _replace_attrs_with_guids(
+        server, copy.deepcopy(policies), LookupThresholds(point_max_keys=1, prefetch_min_keys=30)
+    )
+
+    assert prefetch_policies == bulk_policies
+    assert prefetch_policies[0]["conditions"]["users"] == {"includeGroups": group_ids[:30]}
+    # a single page of all the groups instead of a $batch envelope with 2 filtered requests
+    assert prefetch_requests_count == 1
+    assert bulk_requests_count == 1
+    assert "Looking up 30 groups with the bulk strategy" in caplog.text
+    assert "Looking up 30 groups with the prefetch strategy" in caplog.text
+
+
+@pytest.mark.parametrize("lookup_thresholds", [None, LookupThresholds(point_max_keys=0, prefetch_min_keys=100)])
+def test_case_variants_of_a_name_are_all_replaced(server, lookup_thresholds):
+    policies = [
+        {"conditions": {"users": {"includeGroupNames": [name]}, "applications": {"includeApplications": ["All"]}}}
+        for name in ["Sales", "sales"]
+    ]
+
+    policies, _ = _replace_attrs_with_guids(server, policies, lookup_thresholds)
+
+    assert [policy["conditions"]["users"] for policy in policies] == [{"includeGroups": [_SALES_ID]}] * 2
+
+
+def test_lookups_do_not_use_more_than_jobs_threads(server, monkeypatch):
+    handle = server.graph.handle
+    lock = threading.Lock()
+    in_flight: set[int] = set()
+    max_in_flight = 0
+
+    def handle_slowly(method, url, body=None):
+        nonlocal max_in_flight
+        thread_id = threading.get_ident()
+        with lock:
+            # the sub-requests of a $batch envelope are handled by the thread of the envelope
+            nested = thread_id in in_flight
+            in_flight.add(thread_id)
+            max_in_flight = max(max_in_flight, len(in_flight))
+        if nested:
+            return handle(method, url, body)
+        try:
+            time.sleep(0.02)
+            return handle(method, url, body)
+        finally:
+            with lock:
+                in_flight.discard(thread_id)
+
+    monkeypatch.setattr(server.graph, "handle", handle_slowly)
+    transport = GraphTransport(
+        rate_limiter=create_fast_rate_limiter(), retry_policy=RetryPolicy(backoff_base=0), base_url=server.base_url
+    )
+    # 3 $batch envelopes of point lookups for each of groups, users and applications
+    policies = [
+        {
+            "conditions": {
+                "users": {
+                    "includeGroupNames": [f"Group {index}" for index in range(60)],
+                    "includeUserNames": [f"user{index}@contoso.com" for index in range(60)],
+                },
+                "applications": {"includeApplications": [f"App {index}" for index in range(60)]},
+            }
+        }
+    ]
+
+    replace_attrs_with_guids_in_policies(
+        "token",
+        policies,
+        transport=transport,
+        jobs=3,
+        lookup_thresholds=LookupThresholds(point_max_keys=100, prefetch_min_keys=1000),
+    )
+
+    assert max_in_flight <= 3
@@ -0,0 +1,74 @@
+import pytest
+from src.ca_pwt.helpers.rate_limiter import RateLimiter
+from src.ca_pwt.groups import GroupsAPI
+from .fake_graph import create_fake_transport
+
+
+def test_burst_is_free_and_then_requests_are_paced():
+    rate_limiter = RateLimiter(rate=10, burst=2)
+
+    assert rate_limiter.reserve() == 0
+    assert rate_limiter.reserve() == 0
+    # the following reservations queue behind each other at 10 requests/s
+    assert rate_limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert rate_limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_throttling_cuts_the_rate_and_pauses_for_retry_after():
+    rate_limiter = RateLimiter(rate=10, min_rate=2, burst=5)
+
+    rate_limiter.on_throttled(retry_after=3)
+
+    assert rate_limiter.rate == 5
+    assert rate_limiter.reserve() == pytest.approx(3, abs=0.01)
+
+    rate_limiter.on_throttled()
+    rate_limiter.on_throttled()
+    assert rate_limiter.rate == 2
+
+
+def test_sustained_success_raises_the_rate():
+    rate_limiter = RateLimiter(rate=5, max_rate=6, increase_step=1, increase_after=3)
+
+    for _ in range(3):
+        rate_limiter.on_success()
+    assert rate_limiter.rate == 6
+
+    for _ in range(3):
+        rate_limiter.on_success()
+    assert rate_limiter.rate == 6
+
+
+def test_transport_retries_throttled_requests_through_the_rate_limiter():
+    rate_limiter = RateLimiter(rate=100, burst=100)
+    responses = [(429, {}, {"Retry-After": "0"}), (503, {}, {"Retry-After": "0"}), (200, {"id": "1"}, {})]
+    transport, adapter = create_fake_transport(lambda _: responses.pop(0), rate_limiter=rate_limiter)
+
+    response = GroupsAPI("token", transport=transport).get_by_id("1")
+
+    assert response.success
+    assert len(adapter.requests) == 3
+    assert rate_limiter.rate == 25
+
+
+def test_service_unavailable_responses_cut_the_rate():
+    rate_limiter = RateLimiter(rate=100, burst=100)
+    responses = [(503, {}, {}), (502, {}, {}), (200, {"id": "1"}, {})]
+    transport, adapter = create_fake_transport(lambda _: responses.pop(0), rate_limiter=rate_limiter)
+
+    response = GroupsAPI("token", transport=transport).get_by_id("1")
+
+    assert response.success
+    assert len(adapter.requests) == 3
+    # only the 503 (without Retry-After) lowers the rate; the 502 is only retried with backoff
+    assert rate_limiter.rate == 50
+
+
+def test_entity_apis_share_the_rate_limiter():
+    rate_limiter = RateLimiter(rate=100, burst=100)
+    first_transport, _ = create_fake_transport(lambda _: (429, {}, {"Retry-After": "0"}), rate_limiter=rate_limiter)
+    second_transport, _ = create_fake_transport(lambda _: (200, {}, {}), rate_limiter=rate_limiter)
+
+    GroupsAPI("token", transport=first_transport).get_by_id("1")
+    # the throttling seen by the first transport slows down the second one
+    assert second_transport.rate_limiter.rate < 100
@@ -0,0 +1,139 @@
+import json
+import os
+import time
+from src.ca_pwt.helpers.response_cache import ResponseCache, _get_entity_type, _get_tenant
+from src.ca_pwt.groups import GroupsAPI
+from src.ca_pwt.helpers.graph_api import DuplicateActionEnum
+from .fake_graph import create_fake_token, create_fake_transport
+
+_URL = "https://graph.microsoft.com/v1.0/groups/1?$select=displayName"
+
+
+def test_entity_type_and_tenant_are_parsed():
+    assert _get_entity_type(_URL) == "groups"
+    assert _get_entity_type("https://graph.microsoft.com/v1.0/servicePrincipals(appId='{1}')") == "servicePrincipals"
+    assert _get_tenant(create_fake_token("tenant-a")) == "tenant-a"
+    assert _get_tenant("Bearer not-a-jwt") != _get_tenant("Bearer another-token")
+
+
+def test_responses_are_keyed_by_tenant_and_url(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put(_URL, create_fake_token("tenant-a"), 200, {}, '{"displayName": "a"}')
+
+    cached_response = cache.get(_URL, create_fake_token("tenant-a"))
+    assert cached_response is not None
+    assert cached_response.body == '{"displayName": "a"}'
+    assert cache.get(_URL, create_fake_token("tenant-b")) is None
+    assert cache.get(_URL.replace("displayName", "id"), create_fake_token("tenant-a")) is None
+
+
+def test_expired_and_bypassed_responses_are_ignored(tmp_path):
+    cache = ResponseCache(str(tmp_path), default_ttl=60, ttls={"directoryRoleTemplates": 3600})
+    cache.put(_URL, "token", 200, {}, "{}")
+    role_url = "https://graph.microsoft.com/v1.0/directoryRoleTemplates"
+    cache.put(role_url, "token", 200, {}, "{}")
+
+    # both responses were stored 2 minutes ago
+    for path in tmp_path.iterdir():
+        content = json.loads(path.read_text())
+        content["stored_at"] -= 120
+        path.write_text(json.dumps(content))
+
+    assert cache.get(_URL, "token") is None
+    assert cache.get(role_url, "token") is not None
+    assert ResponseCache(str(tmp_path), bypass=True).get(role_url, "token") is None
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    body = "x" * 400
+    cache = ResponseCache(str(tmp_path), max_size=1500)
+    cache.put(f"{_URL}&a", "token", 200, {}, body)
+    cache.put(f"{_URL}&b", "token", 200, {}, body)
+    # make a the most recently used response
+    old = time.time() - 60
+    for entry in os.scandir(tmp_path):
+        os.utime(entry.path, (old, old))
+    assert cache.get(f"{_URL}&a", "token") is not None
+
+    cache.put(f"{_URL}&c", "token", 200, {}, body)
+
+    assert cache.get(f"{_URL}&a", "token") is not None
+    assert cache.get(f"{_URL}&b", "token") is None
+    assert cache.get(f"{_URL}&c", "token") is not None
+
+
+def test_transport_serves_successful_gets_from_the_cache(tmp_path):
+    transport, adapter = create_fake_transport(
+        lambda request: (200, {"id": "1"}, {}) if request.url.endswith("/1") else (404, {"error": {}}, {}),
+        response_cache=ResponseCache(str(tmp_path)),
+    )
+    groups_api = GroupsAPI("token", transport=transport)
+
+    assert groups_api.get_by_id("1").json() == {"id": "1"}
+    assert groups_api.get_by_id("1").json() == {"id": "1"}
+    assert not groups_api.get_by_id("2").success
+    assert not groups_api.get_by_id("2").success
+
+    # only the missing group was requested twice
+    assert len(adapter.requests) == 3
+
+
+def test_batched_gets_are_served_from_the_cache(tmp_path):
+    def batch_handler(request):
+        envelope = json.loads(request.body)
+        responses = [
+            {"id": sub_request["id"], "status": 200, "body": {"id": sub_request["url"].split("/")[-1]}}
+            for sub_request in envelope["requests"]
+        ]
+        return 200, {"responses": responses}, {}
+
+    transport, adapter = create_fake_transport(batch_handler, response_cache=ResponseCache(str(tmp_path)))
+    groups_api = GroupsAPI("token", transport=transport)
+
+    groups_api.get_by_ids(["1", "2"])
+    responses = groups_api.get_by_ids(["1", "2", "3"])
+
+    assert [response.json()["id"] for response in responses] == ["1", "2", "3"]
+    assert [len(json.loads(request.body)["requests"]) for request in adapter.requests] == [2, 1]
+
+
+def test_empty_collections_are_not_cached_and_writes_invalidate_their_entity_type(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put(f"{_URL}&empty", "token", 200, {}, '{"value": []}')
+    cache.put(_URL, "token", 200, {}, '{"value": [{"id": "1"}]}')
+    users_url = "https://graph.microsoft.com/v1.0/users/1"
+    cache.put(users_url, "token", 200, {}, '{"id": "1"}')
+
+    assert cache.get(f"{_URL}&empty", "token") is None
+    assert cache.get(_URL, "token") is not None
+
+    cache.invalidate("https://graph.microsoft.com/v1.0/groups")
+
+    assert cache.get(_URL, "token") is None
+    assert cache.get(users_url, "token") is not None
+
+
+def test_duplicates_are_found_after_a_create_through_the_cache(tmp_path):
+    groups: list[dict] = []
+
+    def handler(request):
+        if request.method == "POST":
+            group = {"id": str(len(groups) + 1), **json.loads(request.body)}
+            groups.append(group)
+            return 201, group, {}
+        return 200, {"value": groups[:1]}, {}
+
+    transport, adapter = create_fake_transport(handler, response_cache=ResponseCache(str(tmp_path)))
+    groups_api = GroupsAPI("token", transport=transport)
+    odata_filter = "displayName eq 'a'"
+
+    # create -> lookup -> create: the empty lookup of the first create must not hide the created group
+    groups_api.create_checking_duplicates({"displayName": "a"}, odata_filter, DuplicateActionEnum.IGNORE)
+    assert groups_api.get_top_entity(odata_filter).json()["id"] == "1"
+    groups_api.create_checking_duplicates({"displayName": "a"}, odata_filter, DuplicateActionEnum.IGNORE)
+    assert len(groups) == 1
+
+    # a write drops the cached lookups of its entity type
+    groups_api.create({"displayName": "b"})
+    groups_api.get_top_entity(odata_filter)
+    assert [request.method for request in adapter.requests] == ["GET", "POST", "GET", "POST", "GET"]
@@ -0,0 +1,71 @@
+import pytest
+import requests
+from src.ca_pwt.helpers.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from src.ca_pwt.groups import GroupsAPI
+from .fake_graph import create_fake_transport
+
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(backoff_base=1, backoff_max=4)
+    backoffs = [policy.get_backoff(retries) for retries in range(10) for _ in range(20)]
+    assert all(0 <= backoff <= 4 for backoff in backoffs)
+    assert len(set(backoffs)) > 1
+
+
+def test_can_retry_honours_max_retries_and_deadline():
+    policy = RetryPolicy(2)
+    assert policy.can_retry(1, deadline_at=float("inf"))
+    assert not policy.can_retry(2, deadline_at=float("inf"))
+    assert not policy.can_retry(0, deadline_at=0)
+
+
+def test_transient_errors_are_retried_for_idempotent_requests():
+    responses = iter([(503, None, {}), (502, None, {}), (200, {"id": "1"}, {})])
+    transport, adapter = create_fake_transport(lambda _: next(responses))
+
+    assert GroupsAPI("token", transport=transport).get_by_id("1").success
+    assert len(adapter.requests) == 3
+
+
+def test_transient_errors_are_not_retried_for_posts():
+    transport, adapter = create_fake_transport(lambda _: (503, None, {}))
+
+    assert not GroupsAPI("token", transport=transport).create({"displayName": "test"}).success
+    assert len(adapter.requests) == 1
+
+
+def test_read_timeouts_are_retried_until_max_retries():
+    def handler(_):
+        msg = "stalled"
+        raise requests.ReadTimeout(msg)
+
+    transport, adapter = create_fake_transport(handler, retry_policy=RetryPolicy(2, backoff_base=0))
+
+    with pytest.raises(requests.ReadTimeout):
+        GroupsAPI("token", transport=transport).get_by_id("1")
+    assert len(adapter.requests) == 3
+
+
+def test_circuit_breaker_fails_fast_once_open():
+    transport, adapter = create_fake_transport(
+        lambda _: (503, None, {}),
+        retry_policy=RetryPolicy(0),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+    )
+    groups_api = GroupsAPI("token", transport=transport)
+
+    assert not groups_api.get_by_id("1").success
+    assert not groups_api.get_by_id("2").success
+    with pytest.raises(CircuitOpenError):
+        groups_api.get_by_id("3")
+    assert len(adapter.requests) == 2
+
+
+def test_circuit_breaker_closes_after_a_successful_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.on_failure()
+    assert breaker.is_open
+
+    breaker.before_request()
+    breaker.on_success()
+    assert not breaker.is_open
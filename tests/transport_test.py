@@ -0,0 +1,59 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.ca_pwt.helpers.transport import GraphTransport, _get_coalescing_key
+from src.ca_pwt.groups import GroupsAPI
+from src.ca_pwt.users import UsersAPI
+from .fake_graph import create_fake_transport
+
+
+def test_pool_size_is_applied_to_the_session_adapters():
+    transport = GraphTransport(pool_size=32)
+    adapter = transport.session.get_adapter("https://graph.microsoft.com")
+    assert adapter._pool_maxsize == 32
+    transport.close()
+
+
+def test_entity_apis_share_the_transport():
+    transport, adapter = create_fake_transport(lambda _: (200, {"id": "1", "displayName": "test"}, {}))
+    groups_api = GroupsAPI("token", transport=transport)
+    users_api = UsersAPI("token", transport=transport)
+
+    assert groups_api.get_by_id("1").success
+    assert users_api.get_by_id("1").success
+    assert len(adapter.requests) == 2
+    assert adapter.requests[0].headers["Authorization"] == "Bearer token"
+
+
+def test_add_user_to_group_uses_the_transport():
+    transport, adapter = create_fake_transport(lambda _: (204, None, {}))
+    groups_api = GroupsAPI("token", transport=transport)
+
+    response = groups_api.add_user_to_group("user-id", "group-id")
+
+    assert response.success
+    assert adapter.requests[0].url.endswith("/groups/group-id/members/$ref")
+
+
+def test_concurrent_identical_gets_share_a_single_request():
+    def slow_handler(_):
+        time.sleep(0.05)
+        return 200, {"id": "1"}, {}
+
+    transport, adapter = create_fake_transport(slow_handler)
+    groups_api = GroupsAPI("token", transport=transport)
+    other_token_api = GroupsAPI("other-token", transport=transport)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        responses = list(executor.map(lambda api: api.get_by_id("1"), [groups_api] * 5 + [other_token_api]))
+
+    assert all(response.json() == {"id": "1"} for response in responses)
+    # requests with a different token are never shared
+    assert len(adapter.requests) == 2
+
+
+def test_coalescing_can_be_disabled():
+    transport, adapter = create_fake_transport(lambda _: (200, {"id": "1"}, {}), coalesce_gets=False)
+    assert _get_coalescing_key("POST", "url", {"headers": {}}) is None
+
+    GroupsAPI("token", transport=transport).get_by_id("1")
+    assert len(adapter.requests) == 1